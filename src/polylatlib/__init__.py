@@ -2,3 +2,7 @@ import polylatlib.classes
 from polylatlib.classes import *
 import polylatlib.exception 
 import polylatlib.functions 
+import polylatlib.tiling
+import polylatlib.cache
+from polylatlib.regions import *
+import polylatlib.regions
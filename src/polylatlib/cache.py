@@ -0,0 +1,187 @@
+"""
+**********
+Lattice Cache
+**********
+Lattice cache for PolyLatLib.
+
+This file contains the bounded least recently used cache that 'Polygon.generate_lattice' serves
+lattices from. Lattices are cached in a canonical position, so a lattice of a polygon that
+differs from a cached one only by its centre or rotation is made by moving a copy of the cached
+lattice rather than by generating it again.
+
+"""
+
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+
+__all__ = [
+    "LatticeCache",
+    "lattice_cache"
+]
+
+
+class LatticeCache():
+    """
+    Bounded least recently used cache of generated lattices.
+
+    Parameters
+    ----------
+    max_entries : int >= 0, Default = 16, optional
+        The largest number of lattices held. 0 disables the cache.
+    max_bytes : int > 0 or None, Default = 2**28, optional
+        The largest estimated memory, in bytes, held by the cached lattices. None for no limit.
+
+    Attributes
+    ----------
+    max_entries, max_bytes :
+        The limits of the cache. Either can be changed at any time, taking effect on the next
+        lattice added.
+    hits : int
+        The number of lattices served from the cache.
+    misses : int
+        The number of lattices generated because they were not in the cache.
+    evictions : int
+        The number of lattices dropped to keep the cache within its limits.
+
+    Example
+    -------
+    >>> from polylatlib.cache import lattice_cache
+    >>> lattice_cache.max_entries = 64
+    >>> A = Hexagon(centre=(0, 0)).generate_lattice(100, "circular")  # Generated.
+    >>> B = Hexagon(centre=(5, 2), rotation=0).generate_lattice(100, "circular")  # From cache.
+    >>> lattice_cache.stats()
+    {'hits': 1, 'misses': 1, 'evictions': 0, 'entries': 1, 'bytes': ...}
+
+    Notes
+    -----
+    A polygon's lattices are cached under the key given by its '_canonical_form'; for regular
+    polygons, the class, edge length and storage backend, along with the lattice's layers and
+    type. A lattice that is not cached is generated as usual, and a copy of it moved to the
+    canonical position, centred on the origin with no rotation, is cached. Later requests are
+    served with a copy of the cached lattice rotated and translated into place, so callers are
+    free to change the lattices they are given. Served lattices have the same vertices and
+    edges, in the same order, as freshly generated ones, with positions equal to within
+    floating point rounding.
+
+    Lattice sizes are estimated from the storage arrays, or from the first vertex and edge of
+    the "dict" backend. A lattice larger than 'max_bytes' is never cached, and costs nothing
+    beyond its generation.
+    """
+    def __init__(self, max_entries = 16, max_bytes = 2**28):
+        """
+        Initialises an empty cache with the given limits.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lattices = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._lattices)
+
+    def lattice(self, polygon, layers, lat_type, workers = 1):
+        """
+        Returns the polygon's lattice of the given size and type, from the cache if possible.
+
+        Parameters
+        ----------
+        polygon : Polygon
+            The generating polygon.
+        layers : int > 0 or (rows, columns)
+            The size of the lattice, as for 'generate_lattice'.
+        lat_type : "circular" or "stacked"
+            The type of lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with, if it is not cached.
+
+        Returns
+        -------
+        lattice : Lattice
+            A lattice owned by the caller.
+        """
+        form = polygon._canonical_form()
+        if form is None or not self.max_entries:
+            return polygon._generate_lattice(layers, lat_type, workers)
+        key, matrix, offset = form
+        if lat_type == "stacked":
+            layers = polygon._stacked_size(layers)
+        key = (key, lat_type, layers)
+
+        with self._lock:
+            cached = self._lattices.get(key)
+            if cached is not None:
+                self._lattices.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        matrix = np.asarray(matrix, dtype=np.float64)
+        offset = np.asarray(offset, dtype=np.float64)
+        moved = not (np.array_equal(matrix, np.eye(2)) and not offset.any())
+        if cached is not None:
+            lattice = cached[0].copy()
+            if moved:
+                lattice._transform(matrix, offset)
+            return lattice
+
+        lattice = polygon._generate_lattice(layers, lat_type, workers)
+        size = lattice._store.nbytes()
+        if self.max_bytes is None or size <= self.max_bytes:
+            canonical = lattice.copy()
+            if moved:
+                inverse = np.linalg.inv(matrix)
+                canonical._transform(inverse, -inverse @ offset)
+            self._add(key, canonical, size)
+        return lattice
+
+    def _add(self, key, lattice, size):
+        """
+        Adds a lattice of the given estimated size to the cache, evicting the least recently used
+        lattices to stay within the limits.
+        """
+        with self._lock:
+            if key in self._lattices:
+                self._bytes -= self._lattices.pop(key)[1]
+            self._lattices[key] = (lattice, size)
+            self._bytes += size
+            while len(self._lattices) > self.max_entries or \
+                    (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, evicted) = self._lattices.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Empties the cache and resets its statistics.
+        """
+        with self._lock:
+            self._lattices.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """
+        Returns the cache statistics.
+
+        Returns
+        -------
+        stats : dict
+            The number of 'hits', 'misses' and 'evictions', and the current number of 'entries'
+            and their estimated 'bytes'.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._lattices),
+                "bytes": self._bytes
+            }
+
+
+# The cache used by 'Polygon.generate_lattice'.
+lattice_cache = LatticeCache()
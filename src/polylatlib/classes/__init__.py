@@ -2,3 +2,4 @@
 from .base_shapes import *
 from .regular import *
 from .nonregular import *
+from .virtual import *
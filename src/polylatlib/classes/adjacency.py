@@ -0,0 +1,202 @@
+"""
+**********
+Adjacency
+**********
+Vertex adjacency for PolyLatLib.
+
+This file contains the compressed sparse row (CSR) adjacency structure that shapes keep of their
+edges, so that the neighbours of a vertex are one contiguous slice of an array rather than a scan
+of every edge.
+
+"""
+
+import numpy as np
+
+__all__ = [
+    "Adjacency"
+]
+
+
+class Adjacency():
+    """
+    Compressed sparse row adjacency of a shape's vertices.
+
+    Parameters
+    ----------
+    n : int >= 0
+        The number of vertices.
+    ends : Ex2 int array
+        The vertex index of either end of each edge.
+
+    Attributes
+    ----------
+    offsets : int64 array of length N + 1
+        The neighbours of vertex v are entries offsets[v] up to offsets[v + 1] of 'neighbours'
+        and 'edges'.
+    neighbours : int array
+        The vertex index of each neighbour, each vertex's neighbours in increasing order.
+    edges : int array
+        The edge index, the position in the shape's edges, joining each vertex to each neighbour.
+    size : (int, int)
+        The number of vertices and edges the adjacency was built from.
+
+    Notes
+    -----
+    Every edge appears once in the rows of both of its ends, and a self loop once in the row of
+    its vertex. The adjacency is built in a single sort of the edge ends, and never changes once
+    built; shapes only ever add vertices and edges, so a shape's adjacency stays valid until its
+    size changes.
+    """
+    def __init__(self, n, ends):
+        """
+        Builds the adjacency of n vertices joined by the given edges.
+        """
+        ends = np.asarray(ends).reshape(-1, 2)
+        edges = np.arange(len(ends), dtype=ends.dtype)
+        loop = ends[:, 0] == ends[:, 1]
+        source = np.concatenate([ends[:, 0], ends[~loop, 1]])
+        target = np.concatenate([ends[:, 1], ends[~loop, 0]])
+        order = np.lexsort((target, source))
+        self.neighbours = target[order]
+        self.edges = np.concatenate([edges, edges[~loop]])[order]
+        self.offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source, minlength=n), out=self.offsets[1:])
+        self.size = (n, len(ends))
+        for array in (self.offsets, self.neighbours, self.edges):
+            array.setflags(write=False)
+
+    def with_vertices(self, n):
+        """
+        Returns the adjacency with vertices, without edges, added up to a total of n.
+        """
+        adjacency = Adjacency.__new__(Adjacency)
+        adjacency.neighbours, adjacency.edges = self.neighbours, self.edges
+        adjacency.offsets = np.concatenate([self.offsets, np.full(n - self.size[0], self.offsets[-1])])
+        adjacency.offsets.setflags(write=False)
+        adjacency.size = (n, self.size[1])
+        return adjacency
+
+    def degrees(self, indices = None):
+        """
+        Returns the number of neighbours of each vertex, or of each of an array of vertex indices.
+        """
+        if indices is None:
+            return np.diff(self.offsets)
+        return self.offsets[indices + 1] - self.offsets[indices]
+
+    def row(self, idx):
+        """
+        Returns the array of the neighbours of the vertex with index 'idx'.
+        """
+        return self.neighbours[self.offsets[idx]:self.offsets[idx + 1]]
+
+    def _entries(self, rows):
+        """
+        Returns the positions in 'neighbours' of every entry of the given rows, row by row, and
+        the position in 'rows' of the row of each.
+        """
+        starts = self.offsets[rows]
+        counts = self.offsets[rows + 1] - starts
+        row = np.repeat(np.arange(len(rows)), counts)
+        return np.arange(len(row)) + np.repeat(starts - (np.cumsum(counts) - counts), counts), row
+
+    def distances(self, sources, separate = False):
+        """
+        Returns the number of edges on the shortest path from the nearest of the source vertices
+        to every vertex, or -1 where there is no path.
+
+        Given 'separate', returns a KxN array of the distances from each of the K sources on its
+        own instead.
+
+        Notes
+        -----
+        A breadth first search, one level at a time; each level's frontier is expanded to all its
+        neighbours at once, as one slice of 'neighbours' per frontier vertex. Separate searches
+        run together, each (source, vertex) pair visited once.
+        """
+        n = self.size[0]
+        sources = np.asarray(sources, dtype=np.int64).reshape(-1)
+        groups = len(sources) if separate else 1
+        distance = np.full(groups*n, -1, dtype=np.int64)
+        # Frontier of (search, vertex) pairs, as search*n + vertex
+        frontier = np.unique(np.arange(len(sources))*n + sources if separate else sources)
+        distance[frontier] = 0
+        level = 0
+        while len(frontier):
+            level += 1
+            entries, row = self._entries(frontier % n)
+            reached = frontier[row] - frontier[row] % n + self.neighbours[entries]
+            frontier = np.unique(reached[distance[reached] < 0])
+            distance[frontier] = level
+        return distance.reshape(groups, n) if separate else distance
+
+    def path(self, source, target):
+        """
+        Returns the vertex indices along a shortest path from the vertex 'source' to 'target',
+        or None if there is no path.
+
+        Notes
+        -----
+        A breadth first search from the source, stopped once the target is reached, recording the
+        vertex each vertex was first reached from. Among paths of equal length, those through
+        lower vertex indices are preferred.
+        """
+        parent = np.full(self.size[0], -1, dtype=np.int64)
+        parent[source] = source
+        frontier = np.array([source], dtype=np.int64)
+        while len(frontier) and parent[target] < 0:
+            entries, row = self._entries(frontier)
+            reached = self.neighbours[entries]
+            new = parent[reached] < 0
+            # The first arrival at each vertex, from the lowest frontier vertex
+            reached, first = np.unique(reached[new], return_index=True)
+            parent[reached] = frontier[row[new][first]]
+            frontier = reached
+        if parent[target] < 0:
+            return None
+        path = [target]
+        while path[-1] != source:
+            path.append(int(parent[path[-1]]))
+        return path[::-1]
+
+    def components(self, subset = None):
+        """
+        Returns the connected component of each vertex, numbered from 0 in order of each
+        component's lowest vertex index.
+
+        Given a boolean array 'subset', only its vertices and the edges between them are
+        considered, and vertices outside it are given component -1.
+
+        Notes
+        -----
+        Components are found by repeatedly hooking the root of the higher end of each edge onto
+        the root of the lower, then shortcutting every vertex to its root by pointer jumping.
+        Each round is a handful of array operations over the edges, and the number of rounds
+        grows only slowly with the size of the shape.
+        """
+        n = self.size[0]
+        one = np.repeat(np.arange(n), np.diff(self.offsets))
+        two = self.neighbours.astype(np.int64)
+        if subset is not None:
+            subset = np.asarray(subset, dtype=bool)
+            keep = subset[one] & subset[two]
+            one, two = one[keep], two[keep]
+        root = np.arange(n)
+        while True:
+            high = np.maximum(root[one], root[two])
+            low = np.minimum(root[one], root[two])
+            hook = high != low
+            if not hook.any():
+                break
+            # Roots only ever point to lower roots, so no cycle can form
+            root[high[hook]] = low[hook]
+            while True:
+                jumped = root[root]
+                if np.array_equal(jumped, root):
+                    break
+                root = jumped
+        # Each root is its component's lowest vertex, so sorted roots number the components
+        if subset is None:
+            return np.unique(root, return_inverse=True)[1].reshape(-1)
+        roots = np.unique(root[subset])
+        return np.where(subset, np.searchsorted(roots, root), -1)
@@ -10,9 +10,54 @@ structure and behaviour.
 """
 
 import abc
-from math import sqrt, sin, cos, radians
+import copy
+from math import sqrt, sin, cos, radians, isfinite
+import numbers
+import numpy as np
 from polylatlib.exception import *
 from polylatlib.functions import add_vectors, is_positive_int, is_supported_colour, check_if_coord
+from polylatlib.classes.storage import STORES, colour_codes, grow_array, VertexView, VertexInfoView, EdgeView, EdgeInfoView
+from polylatlib.classes.spatial import SpatialHash, GridIndex
+from polylatlib.classes.adjacency import Adjacency
+from polylatlib.tiling import Clipped, tile, stream
+from polylatlib.cache import lattice_cache
+
+
+def _sparse(method):
+    """
+    Returns the scipy.sparse module, raising ImportError naming the method that needs it, and the
+    'graph' extra providing it, if SciPy is not installed.
+    """
+    try:
+        import scipy.sparse
+    except ImportError:
+        raise ImportError(f"SciPy required for {method}(); install it with 'pip install polylatlib[graph]'")
+    return scipy.sparse
+
+
+def _check_count(values, n, argument, item):
+    """
+    Raises PolyLatError unless 'values' is a single value or a sequence of exactly n values, one
+    for each of the n items being added.
+    """
+    if isinstance(values, str):
+        return
+    shape = np.shape(values)
+    if shape and shape != (n,):
+        raise PolyLatError(f"Argument '{argument}' must be a single value or one value per {item}, "
+                           f"{n} in all, not an array of shape {shape}.")
+
+
+def _networkx(method):
+    """
+    Returns the networkx module, raising ImportError naming the method that needs it, and the
+    'graph' extra providing it, if NetworkX is not installed.
+    """
+    try:
+        import networkx
+    except ImportError:
+        raise ImportError(f"NetworkX required for {method}(); install it with 'pip install polylatlib[graph]'")
+    return networkx
 
 
 ### SHAPE (Parent Base Class) ###
@@ -24,14 +69,20 @@ class Shape():
     Attributes
     ----------
     vertices : 
-        The list of all vertex names.
+        The read-only list of all vertex names.
     vertices_info : 
-        The list of vertex tuples of vertices along with their associated property dictionary.
-        This dictionary contains the vertex properties position, size, and colour.
+        The read-only list of vertex tuples of vertices along with their associated property
+        dictionary. This dictionary contains the vertex properties position, size, and colour.
     .edges :
-        The list of edges. Edges are stored as 2-tuples of the vertices at either end of the edge.
-    .edge_info : The list of tuples of edges along with their associated information dictionary.
-        This dictionary contains the edge weight and colour.
+        The read-only list of edges. Edges are stored as 2-tuples of the vertices at either end of
+        the edge.
+    .edge_info : The read-only list of tuples of edges along with their associated information
+        dictionary. This dictionary contains the edge weight and colour.
+    backend : "dict" or "array"
+        The storage backend holding the vertices and edges. See the Notes below.
+    merge_tolerance : float > 0 or None
+        The distance within which 'generate_shape' merges a new vertex into an existing one. If
+        None (default) the tolerance is 1/100 of the mean length of the generating vectors.
     
     Example
     -------
@@ -60,11 +111,28 @@ class Shape():
 
     The final method of the shape object (currently) utilises the OpenCV library to create and
     canvas and draw the created shape.
+
+    Vertices and edges are held in a hash-indexed store, so checking membership, looking up, and
+    updating a vertex or edge are O(1) operations. The 'vertices', 'vertices_info', 'edges', and
+    'edges_info' attributes are read-only list views onto this store; use the 'add' and 'update'
+    methods to change the shape.
+
+    Two storage backends are available. The default "dict" backend keeps a property dictionary
+    per vertex and edge, at roughly 1,130 bytes per vertex of a generated hexagonal lattice. The
+    "array" backend keeps properties in NumPy columns, at roughly 80 bytes per vertex as
+    generated and 370 once vertices or edges have been looked up by name, making it the better
+    choice for very large lattices. See 'polylatlib.classes.storage' for how these were
+    measured. Both behave identically through the Shape methods.
     """
-    def __init__(self):
+    def __init__(self, backend = "dict"):
         """
         Initialise a Shape object to be populated with vertices and edges.
 
+        Parameters
+        ----------
+        backend : "dict" or "array", Default = "dict", optional
+            The storage backend for the shape's vertices and edges.
+
         Example
         -------
         >>> A = Shape()
@@ -82,10 +150,194 @@ class Shape():
         When initialised a Shape is an empty object with the capacity for the addition of vertices
         and edges.
         """
-        self.vertices = []
-        self.vertices_info = []
-        self.edges = []
-        self.edges_info = []
+        if backend not in STORES:
+            raise PolyLatNotProp(backend)
+        self.backend = backend
+        self._store = STORES[backend]()
+        self._spatial = None
+        self._cache = {}
+        self._adjacency = None
+        self.merge_tolerance = None
+
+    @property
+    def vertices(self):
+        """
+        Read-only list view of all vertex names.
+        """
+        return VertexView(self._store)
+
+    @property
+    def vertices_info(self):
+        """
+        Read-only list view of (vertex, property dictionary) tuples.
+        """
+        return VertexInfoView(self._store)
+
+    @property
+    def edges(self):
+        """
+        Read-only list view of all edges as vertex pairs.
+        """
+        return EdgeView(self._store)
+
+    @property
+    def edges_info(self):
+        """
+        Read-only list view of (vertex_one, vertex_two, property dictionary) tuples.
+        """
+        return EdgeInfoView(self._store)
+
+    def _invalidate(self):
+        """
+        Clears values cached from the shape's vertices and edges. Called on every mutation.
+        """
+        self._cache.clear()
+
+    def copy(self):
+        """
+        Returns an independent copy of the shape.
+
+        Returns
+        -------
+        shape : Shape
+            Shape of the same type with its own copy of the vertices, edges and their properties.
+
+        Example
+        -------
+        >>> A = Hexagon()
+        >>> B = A.copy()
+        >>> B.update_vertex_colour(B.vertices[0], "r")  # A is unchanged.
+
+        Notes
+        -----
+        The copy takes time linear in the size of the shape, but involves no generation. With the
+        "array" backend it is a handful of array copies.
+        """
+        shape = copy.copy(self)
+        shape._store = self._store.copy()
+        shape._spatial = None
+        shape._cache = {}
+        return shape
+
+    def transform(self, matrix, offset = (0, 0), copy = False):
+        """
+        Applies an affine transform, x -> matrix @ x + offset, to every vertex position.
+
+        Parameters
+        ----------
+        matrix : 2x2 sequence
+            The linear part of the transform.
+        offset : (x, y) - 2D Cartesian Coordinate, Default = (0, 0), optional
+            The translation applied after the matrix.
+        copy : bool, Default = False, optional
+            If True, the shape is left unchanged and a transformed copy is returned.
+
+        Returns
+        -------
+        shape : Shape or None
+            The transformed copy, if 'copy' is True.
+
+        Example
+        -------
+        >>> lattice = Hexagon().generate_lattice(100, "circular")
+        >>> lattice.transform([[1, 0.5], [0, 1]])  # Shear in place.
+        >>> sheared = lattice.transform([[1, -0.5], [0, 1]], copy=True)
+
+        Notes
+        -----
+        All positions are moved by a single array operation, and the vertices, edges and their
+        other properties are untouched. Vertices without a position are left without one. A
+        lattice's tiling is transformed along with it, so it can still be grown, which needs an
+        invertible matrix. Attributes describing a polygon, such as a regular polygon's 'centre'
+        and 'rotation', are not updated.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.shape != (2, 2):
+            raise PolyLatError(f"'{matrix.tolist()}' is not a 2x2 matrix.")
+        elif not check_if_coord(offset):
+            raise PolyLatNotCart(offset)
+        shape = self.copy() if copy else self
+        shape._transform(matrix, offset)
+        if copy:
+            return shape
+
+    def translate(self, vector, copy = False):
+        """
+        Moves every vertex by a vector.
+
+        Parameters
+        ----------
+        vector : (x, y) - 2D Cartesian Coordinate
+            The translation.
+        copy : bool, Default = False, optional
+            If True, the shape is left unchanged and a translated copy is returned.
+
+        Returns
+        -------
+        shape : Shape or None
+            The translated copy, if 'copy' is True.
+        """
+        return self.transform(np.eye(2), vector, copy)
+
+    def rotate(self, angle, centre = (0, 0), copy = False):
+        """
+        Rotates every vertex about a point.
+
+        Parameters
+        ----------
+        angle : angle
+            The angle, in degrees, to rotate the shape anti-clockwise.
+        centre : (x, y) - 2D Cartesian Coordinate, Default = (0, 0), optional
+            The point to rotate about.
+        copy : bool, Default = False, optional
+            If True, the shape is left unchanged and a rotated copy is returned.
+
+        Returns
+        -------
+        shape : Shape or None
+            The rotated copy, if 'copy' is True.
+        """
+        if not check_if_coord(centre):
+            raise PolyLatNotCart(centre)
+        c, s = cos(radians(angle)), sin(radians(angle))
+        matrix = np.array([[c, -s], [s, c]])
+        return self.transform(matrix, tuple((centre - matrix @ centre).tolist()), copy)
+
+    def scale(self, factor, centre = (0, 0), copy = False):
+        """
+        Scales every vertex's position about a point.
+
+        Parameters
+        ----------
+        factor : float or (x, y)
+            The scale factor, or separate factors along the x and y axes.
+        centre : (x, y) - 2D Cartesian Coordinate, Default = (0, 0), optional
+            The point to scale about.
+        copy : bool, Default = False, optional
+            If True, the shape is left unchanged and a scaled copy is returned.
+
+        Returns
+        -------
+        shape : Shape or None
+            The scaled copy, if 'copy' is True.
+
+        Notes
+        -----
+        Only positions are scaled; vertex sizes and edge weights are unchanged.
+        """
+        if not check_if_coord(centre):
+            raise PolyLatNotCart(centre)
+        matrix = np.diag(np.broadcast_to(np.asarray(factor, dtype=np.float64), (2,)))
+        return self.transform(matrix, tuple((centre - matrix @ centre).tolist()), copy)
+
+    def _transform(self, matrix, offset):
+        """
+        Moves every vertex position by the affine transform x -> matrix @ x + offset, in place.
+        Vertices without a position are left without one.
+        """
+        self._store.transform_positions(np.asarray(matrix, dtype=np.float64), np.asarray(offset, dtype=np.float64))
+        self._spatial = None
+        self._invalidate()
     
     def __str__(self):
         """
@@ -156,18 +408,12 @@ class Shape():
         True
 
         """
-        # First Checks if input could be an edge
+        # First Checks if input could be an edge, in either direction
         if type(a) == tuple and len(a) == 2:
-            # checks both edge directions
-            for edge in [a, (a[1], a[0])]:
-                if edge in self.edges:
-                    return True
+            return self._store.edge_id(a[0], a[1]) is not None
         # Otherwise checks against vertices
         else:
-            try:
-                return a in self.vertices
-            except TypeError:
-                return False
+            return self._store.has_vertex(a)
 
     def add_vertex(self, vertex_for_adding, position = None, size: int = 4, colour = "b"):
         """
@@ -178,7 +424,7 @@ class Shape():
         ----------
         vertex_for_adding : vertex,
             The desired name for a vertex in the shape. These can be strings, numbers, or
-            collections.
+            tuples (any hashable object).
         position : (x, y) - 2D Cartesian Coordinate, Default = None, optional
             The desired position for the vertex in the form of a coordinate 2-tuple. New vertices
             have no postion by deafult allowing for the creation of a graph-like object.
@@ -218,7 +464,7 @@ class Shape():
         of the circle drawn at the vertex point. Colour is self-explanatory.
         """
         # Checks vertex does not already exist
-        if vertex_for_adding not in self.vertices:
+        if not self._store.has_vertex(vertex_for_adding):
             # Checks position of vertex is Cartesian coord. or None
             if not check_if_coord(position) and position != None:
                 raise PolyLatNotCart(position)
@@ -226,18 +472,104 @@ class Shape():
                 raise PolyLatNotPosInt(size)
             elif not is_supported_colour(colour):
                 raise PolyLatNotColour(colour)
-            
-            info = {
-                "position": position,
-                "size": size,
-                "colour": colour
-            }
-            self.vertices.append(vertex_for_adding)
-            self.vertices_info.append((vertex_for_adding, info))
+            try:
+                idx = self._store.add_vertex(vertex_for_adding, position, size, colour)
+            except TypeError:
+                raise PolyLatError(f"Vertex '{vertex_for_adding}' is not hashable.")
+            if self._spatial is not None and position is not None:
+                self._spatial.insert(idx, position)
+            self._invalidate()
         else:
             ### change this to update system????
             raise PolyLatError(f"Vertex '{vertex_for_adding}' already exists.")
 
+    def add_vertices(self, vertices_for_adding, positions = None, sizes = 4, colours = "b"):
+        """
+        Adds many vertices to the shape in one step, with associated properties; position, size,
+        and colour.
+
+        Parameters
+        ----------
+        vertices_for_adding : sequence or array of vertices
+            The desired names for the new vertices.
+        positions : Nx2 sequence or array, Default = None, optional
+            The positions of the new vertices, one (x, y) row per vertex. If None the vertices
+            are added with no position.
+        sizes : int > 0, or sequence of ints > 0, Default = 4, optional
+            A size for all new vertices, or one size per vertex.
+        colours : colour, or sequence of colours, Default = "b", optional
+            A colour for all new vertices, or one colour per vertex.
+
+        Example
+        -------
+        >>> A = Shape()
+        >>> A.add_vertices(["a", "b", "c"], [(0, 0), (1, 0), (0, 1)], colours = ["r", "g", "b"])
+        >>> print(A.get_vertex_colours())
+        {'a': 'r', 'b': 'g', 'c': 'b'}
+
+        Notes
+        -----
+        This is the bulk form of 'add_vertex'. All inputs are validated together in a single
+        vectorised pass before any vertex is added, so either every vertex is added or, if any
+        input is invalid, none are. Positions are stored as floats.
+
+        See Also
+        --------
+        add_vertex()
+        add_edges()
+        """
+        if isinstance(vertices_for_adding, np.ndarray):
+            vertices_for_adding = vertices_for_adding.tolist()
+        names = list(vertices_for_adding)
+        n = len(names)
+        # Checks vertices are unique and do not already exist
+        try:
+            unique_names = set(names)
+        except TypeError:
+            raise PolyLatError("Vertices must be hashable.")
+        if len(unique_names) != n:
+            seen = set()
+            for name in names:
+                if name in seen:
+                    raise PolyLatError(f"Vertex '{name}' is repeated.")
+                seen.add(name)
+        existing = [idx is not None for idx in self._store.vertex_ids(names)]
+        if any(existing):
+            raise PolyLatError(f"Vertex '{names[existing.index(True)]}' already exists.")
+        # Checks positions are Cartesian coords.
+        if positions is None:
+            positions = np.full((n, 2), np.nan)
+        else:
+            try:
+                positions = np.asarray(positions, dtype=np.float64)
+            except (TypeError, ValueError):
+                raise PolyLatNotCart(positions)
+            if positions.shape != (n, 2):
+                raise PolyLatNotCart(positions)
+            invalid = np.flatnonzero(~np.isfinite(positions).all(axis=1))
+            if len(invalid):
+                raise PolyLatNotCart(tuple(positions[invalid[0]].tolist()))
+        # Checks sizes and colours are one for all vertices or one per vertex
+        _check_count(sizes, n, "sizes", "vertex")
+        _check_count(colours, n, "colours", "vertex")
+        # Checks sizes are positive integers
+        sizes = np.asarray(sizes)
+        if not np.issubdtype(sizes.dtype, np.integer):
+            raise PolyLatNotPosInt(sizes.flat[0] if sizes.size else sizes)
+        invalid = np.flatnonzero(sizes <= 0)
+        if len(invalid):
+            raise PolyLatNotPosInt(sizes.flat[invalid[0]].item())
+        sizes = np.broadcast_to(sizes, (n,))
+        codes = colour_codes(colours, n)
+
+        start = self._store.num_vertices()
+        self._store.extend_vertices(names, positions, sizes, codes)
+        if self._spatial is not None:
+            for idx, position in enumerate(positions.tolist(), start):
+                if position[0] == position[0]:
+                    self._spatial.insert(idx, tuple(position))
+        self._invalidate()
+
     def update(self, item_for_update, prop, value):
         """
         Updates the desired property for a given item, either a vertex or an edge.
@@ -313,7 +645,7 @@ class Shape():
 
         """
         # Checks vertex existence
-        if vertex_for_update in self.vertices:
+        if self._store.has_vertex(vertex_for_update):
             # Method selector
             try:
                 method_name = "update_vertex_" + prop
@@ -345,10 +677,16 @@ class Shape():
         'colour': 'b'})]
 
         """
-        if vertex_for_update in self.vertices:
+        if self._store.has_vertex(vertex_for_update):
             if check_if_coord(value):
-                index = self.vertices.index(vertex_for_update)
-                self.vertices_info[index][1]["position"] = value
+                index = self._store.vertex_id(vertex_for_update)
+                if self._spatial is not None:
+                    old_position = self._store.get_vertex(index, "position")
+                    if old_position is not None:
+                        self._spatial.remove(index, old_position)
+                    self._spatial.insert(index, value)
+                self._store.set_vertex(index, "position", value)
+                self._invalidate()
             else:
                 raise PolyLatNotCart(value)
         else:
@@ -375,10 +713,11 @@ class Shape():
         'colour': 'b'})]
 
         """
-        if vertex_for_update in self.vertices:
+        if self._store.has_vertex(vertex_for_update):
             if is_positive_int(value):
-                index = self.vertices.index(vertex_for_update)
-                self.vertices_info[index][1]["size"] = value
+                index = self._store.vertex_id(vertex_for_update)
+                self._store.set_vertex(index, "size", value)
+                self._invalidate()
             else:
                 raise PolyLatNotPosInt(value)
         else:
@@ -405,10 +744,11 @@ class Shape():
         'colour': 'b'})]
 
         """
-        if vertex_for_update in self.vertices:
+        if self._store.has_vertex(vertex_for_update):
             if is_supported_colour(value):
-                index = self.vertices.index(vertex_for_update)
-                self.vertices_info[index][1]["colour"] = value
+                index = self._store.vertex_id(vertex_for_update)
+                self._store.set_vertex(index, "colour", value)
+                self._invalidate()
             else:
                 raise PolyLatNotColour(value)
         else:
@@ -448,13 +788,9 @@ class Shape():
         get_vertex_colours()
 
         """
-        try:
-            vertex_info = {}
-            for vertex in self.vertices_info:
-                vertex_info[vertex[0]] = vertex[1][desired_info]
-            return vertex_info
-        except:
+        if desired_info not in ("position", "size", "colour"):
             raise PolyLatNotExist(desired_info)
+        return self._store.vertex_property(desired_info)
 
     def get_vertex_positions(self):
         """
@@ -561,18 +897,118 @@ class Shape():
         """
         # Checks if edge (in either direction) pre-exists
         if (vertex_one, vertex_two) not in self:
-            self.edges.append((vertex_one, vertex_two))
-            info = {
-                "weight": weight,
-                "colour": colour
-            }
-            self.edges_info.append((vertex_one, vertex_two, info))
             # Adds new vertices if needed
             for vertex in (vertex_one, vertex_two):
-                if vertex not in self.vertices:
+                if not self._store.has_vertex(vertex):
                     self.add_vertex(vertex)
+            self._store.add_edge(
+                self._store.vertex_id(vertex_one),
+                self._store.vertex_id(vertex_two),
+                weight,
+                colour
+            )
+            self._invalidate()
         else:
             raise PolyLatError(f"Edge '{(vertex_one, vertex_two)}' already exists in the shape.")
+
+    def add_edges(self, edges_for_adding, weights = 1, colours = "k"):
+        """
+        Adds many edges to the shape in one step, with associated properties; weight and colour.
+
+        Parameters
+        ----------
+        edges_for_adding : sequence of vertex pairs, or Ex2 array of vertices
+            The edges to add, each given by the vertices at either end.
+        weights : int > 0, or sequence of ints > 0, Default = 1, optional
+            A weight for all new edges, or one weight per edge.
+        colours : colour, or sequence of colours, Default = "k", optional
+            A colour for all new edges, or one colour per edge.
+
+        Example
+        -------
+        >>> A = Shape()
+        >>> A.add_edges([(0, 1), (1, 2), (2, 0)], weights = [1, 2, 3])
+        >>> print(A.get_edge_weights())
+        {(0, 1): 1, (1, 2): 2, (2, 0): 3}
+
+        Notes
+        -----
+        This is the bulk form of 'add_edge'. All inputs are validated together in a single
+        vectorised pass before any edge is added, so either every edge is added or, if any input
+        is invalid, none are. As with 'add_edge', vertices not pre-existing within the shape are
+        added with no position and default size and colour.
+
+        See Also
+        --------
+        add_edge()
+        add_vertices()
+        """
+        if isinstance(edges_for_adding, np.ndarray):
+            if edges_for_adding.ndim != 2 or edges_for_adding.shape[1] != 2:
+                raise PolyLatError(f"{edges_for_adding} is not an array of edges.")
+            flat = edges_for_adding.reshape(-1).tolist()
+        else:
+            flat = []
+            for edge in edges_for_adding:
+                if type(edge) not in (tuple, list) or len(edge) != 2:
+                    raise PolyLatError(f"{edge} is not an edge.")
+                flat.extend(edge)
+        m = len(flat)//2
+        # Validates edge properties before anything is added
+        _check_count(weights, m, "weights", "edge")
+        _check_count(colours, m, "colours", "edge")
+        weights = np.asarray(weights)
+        if not np.issubdtype(weights.dtype, np.integer):
+            raise PolyLatNotPosInt(weights.flat[0] if weights.size else weights)
+        invalid = np.flatnonzero(weights <= 0)
+        if len(invalid):
+            raise PolyLatNotPosInt(weights.flat[invalid[0]].item())
+        weights = np.broadcast_to(weights, (m,))
+        codes = colour_codes(colours, m)
+        self._add_edge_list(flat, weights, codes)
+
+    def _add_edge_list(self, flat, weights, codes):
+        """
+        Adds the edges between consecutive pairs of the vertices in 'flat', with the given arrays
+        of validated weights and colour codes, adding any vertices new to the shape. Raises
+        PolyLatError, adding nothing, if any edge is repeated or already exists.
+        """
+        m = len(flat)//2
+        # Finds the vertex index of each end, numbering vertices that are new to the shape
+        try:
+            ids = self._store.vertex_ids(flat)
+        except TypeError:
+            raise PolyLatError("Vertices must be hashable.")
+        n = self._store.num_vertices()
+        new_vertices = []
+        if None in ids:
+            new_ids = {}
+            for i, vertex in enumerate(flat):
+                if ids[i] is None:
+                    if vertex not in new_ids:
+                        new_ids[vertex] = n + len(new_vertices)
+                        new_vertices.append(vertex)
+                    ids[i] = new_ids[vertex]
+            n += len(new_vertices)
+        ends = np.array(ids, dtype=np.int64).reshape(-1, 2)
+
+        # Checks edges (in either direction) are unique and do not already exist
+        keys = np.minimum(ends[:, 0], ends[:, 1])*n + np.maximum(ends[:, 0], ends[:, 1])
+        order = np.argsort(keys, kind="stable")
+        repeated = np.zeros(m, dtype=bool)
+        repeated[order[1:][keys[order[1:]] == keys[order[:-1]]]] = True
+        if self._store.num_edges():
+            old_ends = self._store.endpoints().astype(np.int64)
+            old_keys = np.minimum(old_ends[:, 0], old_ends[:, 1])*n + np.maximum(old_ends[:, 0], old_ends[:, 1])
+            repeated |= np.isin(keys, old_keys, kind="sort")
+        if repeated.any():
+            edge = tuple(flat[2*np.flatnonzero(repeated)[0]:][:2])
+            raise PolyLatError(f"Edge '{edge}' already exists in the shape.")
+
+        if new_vertices:
+            self.add_vertices(new_vertices)
+        self._store.extend_edges(ends.astype(np.int32), weights, codes)
+        self._invalidate()
     
     def update_edge(self, edge_for_update, prop, value):
         """
@@ -641,13 +1077,11 @@ class Shape():
 
         """
         if is_positive_int(value):
-            if edge_for_update in self.edges:
-                index = self.edges.index(edge_for_update)
-            elif (edge_for_update[1], edge_for_update[0]) in self.edges:
-                index = self.edges.index((edge_for_update[1], edge_for_update[0]))
-            else:
+            index = self._store.edge_id(edge_for_update[0], edge_for_update[1])
+            if index is None:
                 raise PolyLatNotExist(edge_for_update)
-            self.edges_info[index][2]["weight"] = value
+            self._store.set_edge(index, "weight", value)
+            self._invalidate()
         else:
             raise PolyLatNotPosInt(value)
     
@@ -674,13 +1108,11 @@ class Shape():
 
         """
         if is_supported_colour(value):
-            if edge_for_update in self.edges:
-                index = self.edges.index(edge_for_update)
-            elif (edge_for_update[1], edge_for_update[0]) in self.edges:
-                index = self.edges.index((edge_for_update[1], edge_for_update[0]))
-            else:
+            index = self._store.edge_id(edge_for_update[0], edge_for_update[1])
+            if index is None:
                 raise PolyLatNotExist(edge_for_update)
-            self.edges_info[index][2]["colour"] = value
+            self._store.set_edge(index, "colour", value)
+            self._invalidate()
         else:
             raise PolyLatNotColour(value)
 
@@ -717,13 +1149,9 @@ class Shape():
         get_edge_colours()
 
         """
-        try:
-            edge_info = {}
-            for edge in self.edges_info:
-                edge_info[(edge[0], edge[1])] = edge[2][desired_info]
-            return edge_info
-        except:
+        if desired_info not in ("weight", "colour"):
             raise PolyLatError(f"'{desired_info}' is not an edge property.")
+        return self._store.edge_property(desired_info)
 
     def get_edge_weights(self):
         """
@@ -767,13 +1195,19 @@ class Shape():
         """
         return self.get_edge_info("colour")
 
-    def get_edge_vectors(self):
+    def get_edge_vectors(self, as_array = False):
         """
         Returns the vectors of the edges in the shape in the form of a dictionary.
+
+        Parameters
+        ----------
+        as_array : boolean, Default = False, optional
+            If True the vectors are instead returned as a read-only Ex2 NumPy array, in the same
+            order as the shape's edges.
         
         Returns
         -------
-        edge_vectors : dictionary
+        edge_vectors : dictionary or array
             Dictionary with edges as keys and their vectors as values.
 
         Example
@@ -799,20 +1233,32 @@ class Shape():
         be overwritten in some circumstances (i.e generate polygon automatically closes the shape
         if input vectors do not do so).
 
+        The vectors are calculated for all edges in a single vectorised pass over the shape's
+        vertex positions and cached until the shape is next changed.
+
         See Also
         --------
         get_edge_vector()
         """
-        edge_vectors = {}
-        for edge in self.edges:
-            pos_one = self.get_vertex_positions()[edge[0]]
-            pos_two = self.get_vertex_positions()[edge[1]]
+        vectors = self._get_edge_vector_array()
+        if as_array:
+            return vectors
+        return dict(zip(self._store.edge_names(), map(tuple, vectors.tolist())))
+
+    def _get_edge_vector_array(self):
+        """
+        Returns the cached Ex2 array of edge vectors, calculating it if needed.
+        """
+        if "edge_vectors" not in self._cache:
+            positions = self._store.positions()
+            ends = self._store.endpoints()
+            vectors = positions[ends[:, 1]] - positions[ends[:, 0]]
             # Raises error upon any vertex with no position
-            if pos_one == None or pos_two == None:
+            if np.isnan(vectors).any():
                 raise TypeError("Edge vectors cannot be generated as one or more vertices in an edge do not have a position.")
-            vector = (pos_two[0] - pos_one[0], pos_two[1] - pos_one[1])
-            edge_vectors[edge] = vector
-        return edge_vectors
+            vectors.setflags(write=False)
+            self._cache["edge_vectors"] = vectors
+        return self._cache["edge_vectors"]
     
     def get_edge_vector(self, edge):
         """
@@ -838,124 +1284,817 @@ class Shape():
         --------
         get_edge_vectors
         """
-        for e in [edge, (edge[1], edge[0])]:
-            if e in self.edges:
-                return self.get_edge_vectors()[e]
-        raise PolyLatNotExist(edge)
+        index = self._store.edge_id(edge[0], edge[1])
+        if index is None:
+            raise PolyLatNotExist(edge)
+        return tuple(self._get_edge_vector_array()[index].tolist())
 
-    def generate_shape(self, vertex_pos, shape_name, vectors):
+    def vertex_neighbours(self, vertex):
         """
-        Generates a named shape from a series of edge vectors staring at a given point.
-        
+        Returns the vertices joined to a vertex by an edge.
+
         Parameters
         ----------
-        vertex_pos : (x, y) - 2D Cartesian Coordinate
-            Start position for the initial vertex in the shape.
-        shape_name : string, int, or float
-            This is the overiding shape name dictating all the vertex names within the shape.
-            Vertex names are of the form; 'shape_name-k', where k is number of the vertex.
-        vectors : list
-            This should be an ordered list of edge vectors. This method runs through the list in
-            order to generate the polygon.
+        vertex : the vertex.
+
+        Returns
+        -------
+        neighbours : list
+            List of the neighbouring vertices, in the order they were added.
 
         Example
         -------
-        >>> vecs = [(0, 1), (1, 1), (-1, 2)]
-        >>> A = pl.Shape()
-        >>> A.generate_shape((0, 0), "Example", vecs)
-        >>> A.draw_shape()
-        <MatPlotLib drawing of shape graph>
+        >>> A = Shape()
+        >>> A.add_edges([(0, 1), (1, 2), (2, 0), (2, 3)])
+        >>> A.vertex_neighbours(2)
+        [0, 1, 3]
 
         Notes
         -----
-        This method checks for pre-existence of vertices before adding new ones, i.e we cannot
-        have multiple vetrices occupying the same position. This method does not close the shape
-        automatically.
+        Neighbours are read from the shape's adjacency, in O(degree) time. See 'get_adjacency'.
         """
-        edge_list = []
-        for k in range(len(vectors) + 1):
-            vertex_dict = self.get_vertex_positions()
-            found = False
-            # Check if a vertex in within a small radius (1/100) to vector start,
-            # If found choose existing vertex instead - this accounts for floating point error
-            for key in vertex_dict.keys():
-                if (vertex_pos[0] - vertex_dict[key][0])**2 + (vertex_pos[1] - vertex_dict[key][1])**2 <= (1/100)**2: ## Change to edge_length!!
-                    edge_list.append(key)
-                    found = True
-                    break
-            # Else create new vertex in that spot
-            if found == False:
-                self.add_vertex(str(shape_name) + "-" + str(k), vertex_pos)
-                edge_list.append(str(shape_name) + "-" + str(k))
-            # Move along next vector if not at end of vector list
-            if k != len(vectors):
-                vertex_pos = add_vectors(vertex_pos, vectors[k])
-        for e in range(len(vectors)):
-            if (edge_list[e], edge_list[e + 1]) not in self:
-                self.add_edge(edge_list[e], edge_list[e + 1])
-        
-    def generate_from_vectors(self, start_pos, vectors):
+        if not self._store.has_vertex(vertex):
+            raise PolyLatNotExist(vertex)
+        neighbours = self._get_adjacency().row(self._store.vertex_id(vertex))
+        return [self._store.vertex_name(idx) for idx in neighbours.tolist()]
+
+    def degree(self, vertex):
         """
-        Generates and returns lattice type object of the current shape repeated with positions
-        according to given vectors.
+        Returns the number of edges at a vertex.
 
         Parameters
         ----------
-        start_pos : (x, y) - 2D Cartesian Coordinate
-            Start position for the initial vertex in the shape.
-        vectors : list
-            List of vectors to describe positions for the current shape to be drawn in.
-        
+        vertex : the vertex.
+
         Returns
         -------
-        lattice : Lattice
-            Lattice object of the current shape drawn in position described by the input vectors.
+        degree : int
+            The number of the vertex's neighbours. A self loop counts once.
+        """
+        if not self._store.has_vertex(vertex):
+            raise PolyLatNotExist(vertex)
+        idx = self._store.vertex_id(vertex)
+        return int(self._get_adjacency().degrees(np.array([idx]))[0])
+
+    def get_degrees(self):
+        """
+        Returns the degree of every vertex.
+
+        Returns
+        -------
+        degrees : int array
+            The number of edges at each vertex, in the order of 'vertices'.
+        """
+        return self._get_adjacency().degrees()
+
+    def get_adjacency(self):
+        """
+        Returns the shape's adjacency in compressed sparse row form.
+
+        Returns
+        -------
+        offsets : int array of length N + 1
+        neighbours : int array
+        edges : int array
+            Read-only arrays, where the neighbours of the vertex with index v, its position in
+            'vertices', are neighbours[offsets[v]:offsets[v + 1]], in increasing order, joined by
+            the edges with indices, positions in 'edges', edges[offsets[v]:offsets[v + 1]].
 
         Example
         -------
-        >>> shape_vec = [(0, 1), (1, 1), (-1, 2)]
-        >>> A = pl.Shape()
-        >>> A.generate_shape((0, 0), "Example", shape_vec)
-        >>> lat_vec = [(3, 3), (0, -2), (1, 1)]
-        >>> lat_A = A.generate_from_vectors((0, 0), lat_vec)
-        >>> lat_A.draw_shape()
-        <Matplotlib drawing of repeated shape lattice>
+        # Sum of the weights of the edges at each vertex
+        >>> offsets, neighbours, edges = lattice.get_adjacency()
+        >>> weights = np.array(list(lattice.get_edge_weights().values()))
+        >>> np.add.reduceat(weights[edges], offsets[:-1])
 
         Notes
         -----
-        This method takes the existing shape and creates a new Lattice object of repeated copies
-        of that shape. The number of copies present in the lattice is (num. of vectors) + 1.
-        This is because this method first generates the original shape in the starting position
-        given and proceeds to repeat the shape in positions dictated by the provided vectors.
+        The adjacency is built from the store's integer edge endpoints in a single sort, on first
+        use. As vertices and edges are only ever added, it is kept until the number of edges
+        changes, and extended in place when only vertices are added, so updating vertex and edge
+        properties never rebuilds it. Each entry lists both ends of its edge, so degree and
+        neighbour queries are O(degree) and graph traversals read each row as one contiguous
+        slice.
+        """
+        adjacency = self._get_adjacency()
+        return adjacency.offsets, adjacency.neighbours, adjacency.edges
 
-        This method also accounts for the preexistence of vertices in the shape.
-         
+    def _get_adjacency(self):
         """
-        lattice = Lattice()
-        edge_vec = list(self.get_edge_vectors().values())
-        lattice.generate_shape(start_pos, "0", edge_vec)
-        for i in range(len(vectors)):
-            start_pos = add_vectors(start_pos, vectors[i])
-            lattice.generate_shape(start_pos, str(i + 1), edge_vec)
-        return lattice
-    
-    def draw_shape(self, axis = "off"):
+        Returns the shape's Adjacency, building it if edges have been added since it was built.
         """
-        Draws the current shape using the MatPlotLib library.
+        n, m = self._store.num_vertices(), self._store.num_edges()
+        if self._adjacency is None or self._adjacency.size[1] != m:
+            self._adjacency = Adjacency(n, self._store.endpoints())
+        elif self._adjacency.size[0] != n:
+            self._adjacency = self._adjacency.with_vertices(n)
+        return self._adjacency
+
+    def _vertex_index_array(self, indices):
+        """
+        Returns an array of vertex indices as int64, raising PolyLatNotExist for any out of range.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        bad = (indices < 0) | (indices >= self._store.num_vertices())
+        if bad.any():
+            raise PolyLatNotExist(indices[bad][0])
+        return indices
+
+    def bfs_distances(self, source):
+        """
+        Returns the number of edges between a vertex and every vertex.
 
         Parameters
         ----------
-        axis : "on" or "off" (Default "off")
-            Set as "on" to view x and y axis in plot. Set as "off" to view plot as blank
-            canvas.
+        source : the vertex to measure from.
+
+        Returns
+        -------
+        distances : int array
+            The number of edges on a shortest path from 'source' to each vertex, in the order of
+            'vertices', or -1 for vertices with no path from it.
+
+        Example
+        -------
+        >>> A = Shape()
+        >>> A.add_edges([(0, 1), (1, 2), (2, 3)])
+        >>> A.add_vertex(4)
+        >>> A.bfs_distances(1)
+        array([ 1,  0,  1,  2, -1])
+
+        See Also
+        --------
+        bfs_distance_indices
+        """
+        if not self._store.has_vertex(source):
+            raise PolyLatNotExist(source)
+        return self._get_adjacency().distances([self._store.vertex_id(source)])
+
+    def bfs_distance_indices(self, sources, separate = False):
+        """
+        Returns the number of edges between any of many vertices and every vertex.
+
+        Parameters
+        ----------
+        sources : int array
+            The indices, positions in 'vertices', of the vertices to measure from.
+        separate : bool, default = False
+            If True, measures from each source on its own rather than from the nearest source.
+
+        Returns
+        -------
+        distances : int array
+            Array of length N, or KxN for K sources if 'separate', of the number of edges on a
+            shortest path from the nearest source, or from each source, to each vertex, in the
+            order of 'vertices', with -1 for vertices with no path.
+
+        Example
+        -------
+        # Distance of every vertex from the nearest of three, and from each of them
+        >>> depth = lattice.bfs_distance_indices([0, 10, 20])
+        >>> each = lattice.bfs_distance_indices([0, 10, 20], separate = True)
 
         Notes
         -----
-        Uses the Matplotlib library to visualise the current shapem, accounting for vertex
-        properties (position, size, and colour) and edge properties (weight and colour).
+        The search runs over the shape's adjacency one level at a time, expanding the whole
+        frontier with array operations, so it takes O(N + E) time with a number of Python steps
+        equal to the largest distance found. Separate searches run together in the same levels.
+        """
+        sources = self._vertex_index_array(sources)
+        return self._get_adjacency().distances(sources, separate)
 
+    def shortest_path(self, a, b):
         """
-        try:
+        Returns the vertices along a shortest path between two vertices.
+
+        Parameters
+        ----------
+        a : the vertex to start from.
+        b : the vertex to end at.
+
+        Returns
+        -------
+        path : list
+            List of the vertices from 'a' to 'b', each joined to the next by an edge, of the
+            fewest edges possible.
+
+        Example
+        -------
+        >>> A = Shape()
+        >>> A.add_edges([(0, 1), (1, 2), (2, 3), (0, 3)])
+        >>> A.shortest_path(1, 3)
+        [1, 0, 3]
+
+        Notes
+        -----
+        A breadth first search from 'a' over the shape's adjacency, stopped once 'b' is reached.
+        Of paths of equal length, the path through vertices added earlier is returned.
+        """
+        for vertex in (a, b):
+            if not self._store.has_vertex(vertex):
+                raise PolyLatNotExist(vertex)
+        path = self._get_adjacency().path(self._store.vertex_id(a), self._store.vertex_id(b))
+        if path is None:
+            raise PolyLatError(f"There is no path between vertices {a} and {b}.")
+        return [self._store.vertex_name(idx) for idx in path]
+
+    def connected_components(self, subset = None):
+        """
+        Returns the connected component of each vertex.
+
+        Parameters
+        ----------
+        subset : bool array, optional
+            Array of length N marking the vertices, in the order of 'vertices', to consider. Only
+            the edges between marked vertices then join components.
+
+        Returns
+        -------
+        components : int array
+            The component of each vertex, in the order of 'vertices', numbered from 0 in the order
+            of each component's first vertex, or -1 for vertices outside 'subset'.
+
+        Example
+        -------
+        # Clusters of dopant vertices in a lattice, and the size of each
+        >>> dopant = np.random.random(len(lattice.vertices)) < 0.3
+        >>> clusters = lattice.connected_components(dopant)
+        >>> sizes = np.bincount(clusters[clusters >= 0])
+
+        Notes
+        -----
+        Components are found with array operations over the shape's adjacency, alternately
+        joining the components at either end of every edge and shortcutting each vertex to its
+        component's first vertex, in O((N + E) log N) time at worst.
+        """
+        if subset is not None:
+            subset = np.asarray(subset, dtype=bool)
+            if subset.shape != (self._store.num_vertices(),):
+                raise PolyLatError(f"Argument 'subset' must mark each of the {self._store.num_vertices()} vertices.")
+        return self._get_adjacency().components(subset)
+
+    def nearest_vertex(self, point):
+        """
+        Returns the vertex nearest to a point.
+
+        Parameters
+        ----------
+        point : (x, y) - 2D Cartesian Coordinate
+            The point to search from.
+
+        Returns
+        -------
+        vertex : the nearest vertex with a position. Ties go to the earliest added vertex.
+
+        Example
+        -------
+        >>> lattice = Hexagon().generate_lattice(100, "circular")
+        >>> lattice.nearest_vertex((10.2, -3.7))
+
+        Notes
+        -----
+        Queries use a grid index of the vertex positions, built on the first query and kept
+        until the shape next changes. See 'nearest_vertex_indices' for the batched form.
+        """
+        if not check_if_coord(point):
+            raise PolyLatNotCart(point)
+        index, _ = self.nearest_vertex_indices([point])
+        if index[0] < 0:
+            raise PolyLatError("Shape has no vertices with positions.")
+        return self._store.vertex_name(int(index[0]))
+
+    def nearest_vertex_indices(self, points):
+        """
+        Returns the nearest vertex to each of an array of points.
+
+        Parameters
+        ----------
+        points : Mx2 array
+            The points to search from.
+
+        Returns
+        -------
+        indices : int array of length M
+            The index, the position in 'vertices', of the nearest vertex to each point, or -1
+            if no vertex has a position.
+        distances : float array of length M
+            The distance from each point to its nearest vertex.
+        """
+        return self._get_grid_index().nearest(self._as_points(points))
+
+    def vertices_within(self, point, radius):
+        """
+        Returns the vertices within a distance of a point.
+
+        Parameters
+        ----------
+        point : (x, y) - 2D Cartesian Coordinate
+            The centre of the search.
+        radius : float >= 0
+            The search distance.
+
+        Returns
+        -------
+        vertices : list
+            List of the vertices no further than 'radius' from the point, in the order they were
+            added. See 'vertex_indices_within' for the batched form.
+        """
+        if not check_if_coord(point):
+            raise PolyLatNotCart(point)
+        _, indices = self.vertex_indices_within([point], radius)
+        return [self._store.vertex_name(idx) for idx in indices.tolist()]
+
+    def vertex_indices_within(self, points, radius):
+        """
+        Returns the vertices within a distance of each of an array of points.
+
+        Parameters
+        ----------
+        points : Mx2 array
+            The centres of the searches.
+        radius : float >= 0 or array of length M
+            The search distance, for all points or for each.
+
+        Returns
+        -------
+        offsets : int array of length M + 1
+        indices : int array
+            The vertex indices found, in compressed sparse row form; those within reach of point
+            m are indices[offsets[m]:offsets[m + 1]], in increasing order.
+        """
+        return self._get_grid_index().within(self._as_points(points), radius)
+
+    def vertices_in_box(self, lower, upper):
+        """
+        Returns the vertices inside an axis-aligned box.
+
+        Parameters
+        ----------
+        lower : (x, y) - 2D Cartesian Coordinate
+            The corner of the box with the least x and y.
+        upper : (x, y) - 2D Cartesian Coordinate
+            The corner of the box with the greatest x and y.
+
+        Returns
+        -------
+        vertices : list
+            List of the vertices inside the box or on its edge, in the order they were added.
+            See 'vertex_indices_in_box' for the batched form.
+        """
+        for corner in (lower, upper):
+            if not check_if_coord(corner):
+                raise PolyLatNotCart(corner)
+        _, indices = self.vertex_indices_in_box([lower], [upper])
+        return [self._store.vertex_name(idx) for idx in indices.tolist()]
+
+    def vertex_indices_in_box(self, lowers, uppers):
+        """
+        Returns the vertices inside each of an array of axis-aligned boxes.
+
+        Parameters
+        ----------
+        lowers, uppers : Mx2 arrays
+            The lower and upper corners of the boxes.
+
+        Returns
+        -------
+        offsets : int array of length M + 1
+        indices : int array
+            The vertex indices found, in compressed sparse row form; those in box m are
+            indices[offsets[m]:offsets[m + 1]], in increasing order.
+        """
+        return self._get_grid_index().in_boxes(self._as_points(lowers), self._as_points(uppers))
+
+    def _get_grid_index(self):
+        """
+        Returns the shape's grid index of vertex positions, building it if the shape has changed
+        since it was last built.
+        """
+        if "grid" not in self._cache:
+            self._cache["grid"] = GridIndex(self._store.positions())
+        return self._cache["grid"]
+
+    @staticmethod
+    def _as_points(points):
+        """
+        Returns an Mx2 float array of points, raising PolyLatError for any other shape.
+        """
+        array = np.asarray(points, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise PolyLatError("Points must be given as an Mx2 array.")
+        return array
+
+    def adjacency_matrix(self, weighted = False):
+        """
+        Returns the adjacency matrix of the shape.
+
+        Parameters
+        ----------
+        weighted : bool, Default = False, optional
+            If True the entries are the edge weights rather than 1.
+
+        Returns
+        -------
+        adjacency : scipy.sparse.csr_matrix
+            The symmetric NxN float matrix, rows and columns in the order of 'vertices', with
+            entry (u, v) the weight of the edge between u and v, or 0 if there is none.
+
+        Example
+        -------
+        # Nearest neighbour tight-binding Hamiltonian of a graphene flake, hopping t = 2.7 eV.
+        >>> flake = Hexagon(backend="array").generate_lattice(50, "circular")
+        >>> H = -2.7 * flake.adjacency_matrix()
+        >>> energies = scipy.sparse.linalg.eigsh(H, k=20, sigma=0, return_eigenvectors=False)
+
+        Notes
+        -----
+        The matrix is built directly from the store's integer edge endpoints, in O(N + E) time
+        with no Python loop over the edges. Requires SciPy, from the 'graph' extra.
+        """
+        sparse = _sparse("adjacency_matrix")
+        ends, data = self._edge_arrays(weighted)
+        # Both directions of each edge, and self loops once
+        mirror = ends[:, 0] != ends[:, 1]
+        rows = np.concatenate([ends[:, 0], ends[mirror, 1]])
+        columns = np.concatenate([ends[:, 1], ends[mirror, 0]])
+        n = self._store.num_vertices()
+        return sparse.coo_matrix((np.concatenate([data, data[mirror]]), (rows, columns)), shape=(n, n)).tocsr()
+
+    def laplacian(self, weighted = False):
+        """
+        Returns the graph Laplacian of the shape.
+
+        Parameters
+        ----------
+        weighted : bool, Default = False, optional
+            If True the Laplacian of the edge weights rather than of the unweighted graph.
+
+        Returns
+        -------
+        laplacian : scipy.sparse.csr_matrix
+            The NxN float matrix D - A, where A is the 'adjacency_matrix' and D the diagonal
+            matrix of its row sums, the vertex degrees.
+
+        Notes
+        -----
+        Requires SciPy, from the 'graph' extra.
+        """
+        sparse = _sparse("laplacian")
+        adjacency = self.adjacency_matrix(weighted)
+        degrees = np.asarray(adjacency.sum(axis=1)).reshape(-1)
+        return (sparse.diags(degrees, format="csr") - adjacency).tocsr()
+
+    def incidence_matrix(self, oriented = False, weighted = False):
+        """
+        Returns the incidence matrix of the shape.
+
+        Parameters
+        ----------
+        oriented : bool, Default = False, optional
+            If True each edge is directed from its first vertex to its second, as stored in
+            'edges', with entry -1 at the first and +1 at the second.
+        weighted : bool, Default = False, optional
+            If True the entries are scaled by the edge weights.
+
+        Returns
+        -------
+        incidence : scipy.sparse.csr_matrix
+            The NxE float matrix, rows in the order of 'vertices' and columns in the order of
+            'edges', with entry (v, e) non-zero if vertex v is an end of edge e. Self loops have
+            empty columns.
+
+        Notes
+        -----
+        For the unweighted oriented incidence matrix B, B @ B.T is the 'laplacian'. Requires
+        SciPy, from the 'graph' extra.
+        """
+        sparse = _sparse("incidence_matrix")
+        ends, data = self._edge_arrays(weighted)
+        data = np.where(ends[:, 0] != ends[:, 1], data, 0)
+        edges = np.arange(len(ends))
+        values = np.concatenate([-data if oriented else data, data])
+        shape = (self._store.num_vertices(), len(ends))
+        incidence = sparse.coo_matrix((values, (ends.T.reshape(-1), np.tile(edges, 2))), shape=shape).tocsr()
+        incidence.eliminate_zeros()
+        return incidence
+
+    def _edge_arrays(self, weighted):
+        """
+        Returns the Ex2 int64 array of edge endpoints, by vertex index, and the float array of
+        edge weights, or of ones if not 'weighted'.
+        """
+        ends = self._store.endpoints().astype(np.int64)
+        if weighted:
+            return ends, np.asarray(self._store.weights(), dtype=np.float64)
+        return ends, np.ones(len(ends))
+
+    def to_numpy(self):
+        """
+        Returns the shape's vertex positions, edge endpoints and edge weights as arrays.
+
+        Returns
+        -------
+        positions : Nx2 float array
+            The position of each vertex, in the order of 'vertices', with NaN for vertices with no
+            position.
+        ends : Ex2 int array
+            The vertex indices, positions in 'vertices', of either end of each edge, in the order
+            of 'edges'.
+        weights : float array of length E
+            The weight of each edge, in the order of 'edges'.
+
+        Example
+        -------
+        # Lengths of all the edges of a lattice
+        >>> positions, ends, weights = lattice.to_numpy()
+        >>> lengths = np.hypot(*(positions[ends[:, 1]] - positions[ends[:, 0]]).T)
+
+        Notes
+        -----
+        With the "array" backend the arrays are read-only views of the store's own columns, so no
+        data is copied. They show later updates to the shape's properties, but not vertices or
+        edges added later, which may also move the store's columns and leave the views holding
+        the old data. With the "dict" backend the arrays are built from the property
+        dictionaries.
+        """
+        arrays = (self._store.positions(), self._store.endpoints(), self._store.weights())
+        views = []
+        for array in arrays:
+            view = array.view()
+            view.setflags(write=False)
+            views.append(view)
+        return tuple(views)
+
+    def to_scipy_sparse(self, weighted = True, format = "csr"):
+        """
+        Returns the shape's adjacency as a SciPy sparse matrix.
+
+        Parameters
+        ----------
+        weighted : bool, Default = True, optional
+            If True the entries are the edge weights rather than 1.
+        format : str, Default = "csr", optional
+            The SciPy sparse format of the matrix, such as "csr", "csc" or "coo".
+
+        Returns
+        -------
+        adjacency : scipy.sparse matrix
+            The symmetric NxN float matrix, rows and columns in the order of 'vertices'.
+
+        Notes
+        -----
+        The matrix of 'adjacency_matrix', in any format, and with the edge weights by default as
+        with NetworkX's 'to_scipy_sparse_array'. Requires SciPy, from the 'graph' extra.
+
+        See Also
+        --------
+        adjacency_matrix()
+        """
+        return self.adjacency_matrix(weighted).asformat(format)
+
+    def to_networkx(self):
+        """
+        Returns the shape as a NetworkX graph.
+
+        Returns
+        -------
+        graph : networkx.Graph
+            Graph with a node for each vertex, in the order of 'vertices', with attributes "pos",
+            "size" and "colour", and an edge for each edge, in the order of 'edges', with
+            attributes "weight" and "colour". Vertices with no position have "pos" None.
+
+        Example
+        -------
+        >>> graph = lattice.to_networkx()
+        >>> networkx.draw(graph, networkx.get_node_attributes(graph, "pos"))
+
+        Notes
+        -----
+        The graph is built with one call each of 'add_nodes_from' and 'add_edges_from', from the
+        store's property columns. The "pos" attribute is the one the legacy NetworkX generators
+        used. Requires NetworkX, from the 'graph' extra.
+
+        See Also
+        --------
+        from_networkx()
+        """
+        networkx = _networkx("to_networkx")
+        graph = networkx.Graph()
+        properties = [self._store.vertex_values(prop) for prop in ("position", "size", "colour")]
+        graph.add_nodes_from(
+            (vertex, {"pos": position, "size": size, "colour": colour})
+            for vertex, position, size, colour in zip(self._store.names, *properties)
+        )
+        properties = [self._store.edge_values(prop) for prop in ("weight", "colour")]
+        graph.add_edges_from(
+            (one, two, {"weight": weight, "colour": colour})
+            for (one, two), weight, colour in zip(self._store.edge_names(), *properties)
+        )
+        return graph
+
+    @staticmethod
+    def from_networkx(graph, backend = "dict"):
+        """
+        Returns a shape built from a NetworkX graph.
+
+        Parameters
+        ----------
+        graph : networkx.Graph
+            An undirected graph. Node attributes "pos", "size" and "colour", and edge attributes
+            "weight" and "colour", are used where given.
+        backend : "dict" or "array", Default = "dict", optional
+            The storage backend of the new shape.
+
+        Returns
+        -------
+        shape : Shape
+            Shape with a vertex for each node, in the order of the graph's nodes, and an edge for
+            each of its edges. Missing properties take the defaults of 'add_vertex' and
+            'add_edge'.
+
+        Example
+        -------
+        >>> graph = networkx.grid_2d_graph(10, 10)
+        >>> networkx.set_node_attributes(graph, {node: node for node in graph}, "pos")
+        >>> A = Shape.from_networkx(graph, backend="array")
+
+        Notes
+        -----
+        Vertices and edges are added in bulk, as by 'add_vertices' and 'add_edges', and are
+        validated as those methods validate them, except that edge weights may be any finite
+        real numbers, such as the float weights of NetworkX graphs and of shapes with the
+        "array" backend. Requires NetworkX, from the 'graph' extra.
+
+        See Also
+        --------
+        to_networkx()
+        """
+        _networkx("from_networkx")
+        if graph.is_directed() or graph.is_multigraph():
+            raise PolyLatError("Only undirected graphs without parallel edges can be converted.")
+        shape = Shape(backend)
+        nodes = list(graph.nodes(data=True))
+        if nodes:
+            positions = [data.get("pos") for _, data in nodes]
+            placed = [position is not None for position in positions]
+            shape.add_vertices(
+                [node for node, _ in nodes],
+                positions if all(placed) else None,
+                [data.get("size", 4) for _, data in nodes],
+                [data.get("colour", "b") for _, data in nodes]
+            )
+            # Positions of some but not all nodes are set one by one
+            if any(placed) and not all(placed):
+                for (node, _), position in zip(nodes, positions):
+                    if position is not None:
+                        shape.update_vertex_position(node, position)
+        edges = list(graph.edges(data=True))
+        if edges:
+            weights = [data.get("weight", 1) for _, _, data in edges]
+            for weight in weights:
+                if isinstance(weight, bool) or not isinstance(weight, numbers.Real) or not isfinite(weight):
+                    raise PolyLatError(f"Edge weight '{weight}' is not a finite real number.")
+            codes = colour_codes([data.get("colour", "k") for _, _, data in edges], len(edges))
+            shape._add_edge_list([end for one, two, _ in edges for end in (one, two)],
+                                 np.asarray(weights), codes)
+        return shape
+
+    def generate_shape(self, vertex_pos, shape_name, vectors, tolerance = None):
+        """
+        Generates a named shape from a series of edge vectors staring at a given point.
+        
+        Parameters
+        ----------
+        vertex_pos : (x, y) - 2D Cartesian Coordinate
+            Start position for the initial vertex in the shape.
+        shape_name : string, int, or float
+            This is the overiding shape name dictating all the vertex names within the shape.
+            Vertex names are of the form; 'shape_name-k', where k is number of the vertex.
+        vectors : list
+            This should be an ordered list of edge vectors. This method runs through the list in
+            order to generate the polygon.
+        tolerance : float > 0, Default = None, optional
+            Distance within which a new vertex is merged into an existing one. Defaults to the
+            shape's 'merge_tolerance', or 1/100 of the mean vector length if that is not set.
+
+        Example
+        -------
+        >>> vecs = [(0, 1), (1, 1), (-1, 2)]
+        >>> A = pl.Shape()
+        >>> A.generate_shape((0, 0), "Example", vecs)
+        >>> A.draw_shape()
+        <MatPlotLib drawing of shape graph>
+
+        Notes
+        -----
+        This method checks for pre-existence of vertices before adding new ones, i.e we cannot
+        have multiple vetrices occupying the same position. This method does not close the shape
+        automatically.
+
+        Existing vertices are found through a spatial hash of vertex positions that the shape
+        keeps up to date as vertices are added or moved, so each check is O(1).
+        """
+        if tolerance is None:
+            tolerance = self.merge_tolerance
+        if tolerance is None:
+            lengths = [sqrt(vec[0]**2 + vec[1]**2) for vec in vectors]
+            edge_length = sum(lengths)/len(lengths) if lengths and sum(lengths) > 0 else 1
+            tolerance = edge_length/100
+        spatial = self._get_spatial_hash(tolerance)
+
+        edge_list = []
+        for k in range(len(vectors) + 1):
+            # Check if a vertex in within the tolerance radius to vector start,
+            # If found choose existing vertex instead - this accounts for floating point error
+            index = spatial.find(vertex_pos, tolerance)
+            if index is not None:
+                edge_list.append(self._store.vertex_name(index))
+            # Else create new vertex in that spot
+            else:
+                self.add_vertex(str(shape_name) + "-" + str(k), vertex_pos)
+                edge_list.append(str(shape_name) + "-" + str(k))
+            # Move along next vector if not at end of vector list
+            if k != len(vectors):
+                vertex_pos = add_vectors(vertex_pos, vectors[k])
+        for e in range(len(vectors)):
+            if (edge_list[e], edge_list[e + 1]) not in self:
+                self.add_edge(edge_list[e], edge_list[e + 1])
+
+    def _get_spatial_hash(self, cell_size):
+        """
+        Returns the shape's spatial hash of vertex positions, (re)building it if it does not yet
+        exist or was built with a different cell size.
+        """
+        if self._spatial is None or self._spatial.cell_size != cell_size:
+            self._spatial = SpatialHash(cell_size)
+            for idx in range(self._store.num_vertices()):
+                position = self._store.get_vertex(idx, "position")
+                if position is not None:
+                    self._spatial.insert(idx, position)
+        return self._spatial
+        
+    def generate_from_vectors(self, start_pos, vectors):
+        """
+        Generates and returns lattice type object of the current shape repeated with positions
+        according to given vectors.
+
+        Parameters
+        ----------
+        start_pos : (x, y) - 2D Cartesian Coordinate
+            Start position for the initial vertex in the shape.
+        vectors : list
+            List of vectors to describe positions for the current shape to be drawn in.
+        
+        Returns
+        -------
+        lattice : Lattice
+            Lattice object of the current shape drawn in position described by the input vectors.
+
+        Example
+        -------
+        >>> shape_vec = [(0, 1), (1, 1), (-1, 2)]
+        >>> A = pl.Shape()
+        >>> A.generate_shape((0, 0), "Example", shape_vec)
+        >>> lat_vec = [(3, 3), (0, -2), (1, 1)]
+        >>> lat_A = A.generate_from_vectors((0, 0), lat_vec)
+        >>> lat_A.draw_shape()
+        <Matplotlib drawing of repeated shape lattice>
+
+        Notes
+        -----
+        This method takes the existing shape and creates a new Lattice object of repeated copies
+        of that shape. The number of copies present in the lattice is (num. of vectors) + 1.
+        This is because this method first generates the original shape in the starting position
+        given and proceeds to repeat the shape in positions dictated by the provided vectors.
+
+        This method also accounts for the preexistence of vertices in the shape.
+         
+        """
+        lattice = Lattice(self.backend)
+        edge_vec = list(self.get_edge_vectors().values())
+        lattice.generate_shape(start_pos, "0", edge_vec)
+        for i in range(len(vectors)):
+            start_pos = add_vectors(start_pos, vectors[i])
+            lattice.generate_shape(start_pos, str(i + 1), edge_vec)
+        return lattice
+    
+    def draw_shape(self, axis = "off"):
+        """
+        Draws the current shape using the MatPlotLib library.
+
+        Parameters
+        ----------
+        axis : "on" or "off" (Default "off")
+            Set as "on" to view x and y axis in plot. Set as "off" to view plot as blank
+            canvas.
+
+        Notes
+        -----
+        Uses the Matplotlib library to visualise the current shapem, accounting for vertex
+        properties (position, size, and colour) and edge properties (weight and colour).
+
+        """
+        try:
             import matplotlib.pyplot as plt
         except ImportError:
             raise ImportError("Matplotlib required for draw_shape()")
@@ -1009,23 +2148,30 @@ class Polygon(Shape):
     of the shapes in the lattice) can then be defined and the lattice can be generated. 
 
     """
-    def __init__(self):
+    def __init__(self, backend = "dict"):
         """
         Initialises a Polygon object, inherits from Shape..
 
         """
-        super().__init__()
+        super().__init__(backend)
 
-    def generate_lattice(self, layers, lat_type):
+    def generate_lattice(self, layers, lat_type, workers = 1):
         """
         Generates the polygon's lattice in a given number of layers centred on the staring
         polygon. Uses the methods; 'generate_change_vectors' a 'generate_lattice_from_vectors'.
 
         Parameters
         ----------
-        layers : int > 0
+        layers : int > 0 or (rows, columns)
             The number of layers to be generated around the original polygon. If 1 is input
-            the original shape is just generated.
+            the original shape is just generated. Stacked lattices take a (rows, columns) pair,
+            or a single number used for both.
+        lat_type : "circular" or "stacked"
+            The type of lattice to generate.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with. Large lattices are split into
+            contiguous parts generated in parallel, and stitched back into exactly the lattice
+            generated serially.
         
         Returns
         -------
@@ -1037,28 +2183,170 @@ class Polygon(Shape):
 
         Notes
         -----
-        ADD NOTES
+        Generating with more than one worker starts a process pool. On platforms where worker
+        processes are spawned, such as Windows and macOS, scripts must make the call from under an
+        'if __name__ == "__main__":' guard.
+
+        Lattices are served from 'polylatlib.cache.lattice_cache', so repeated requests for the
+        same lattice, or for one differing only in the polygon's centre or rotation, are copied
+        from a cached lattice rather than generated again.
         """
         if self.get_lattice_state():
-            if lat_type == "circular":
-                return self.generate_lattice_circular(layers)
-            elif lat_type == "stacked":
-                return self.generate_lattice_stacked(layers)
-            else:
-                raise PolyLatNotProp(lat_type)  
+            if lat_type not in ("circular", "stacked"):
+                raise PolyLatNotProp(lat_type)
+            return lattice_cache.lattice(self, layers, lat_type, workers)
         else:
             print("Lattice not possible with this shape.")
 
+    def _generate_lattice(self, layers, lat_type, workers = 1):
+        """
+        Generates and returns the polygon's lattice of the given size and type, bypassing the
+        lattice cache.
+        """
+        if lat_type == "circular":
+            return self.generate_lattice_circular(layers, workers)
+        return self.generate_lattice_stacked(*self._stacked_size(layers), workers)
+
+    def _canonical_form(self):
+        """
+        Returns the key the polygon's lattices are cached under, and the matrix and offset of the
+        affine transform from the canonical position of its lattices to their actual position.
+        Returns None if the polygon's lattices are not cached.
+        """
+        return None
+
+    def iter_lattice(self, layers, lat_type, chunk_size = 65536):
+        """
+        Generates the polygon's lattice in chunks, without building the lattice in memory.
+
+        Parameters
+        ----------
+        layers : int > 0 or (rows, columns)
+            The size of the lattice, as for 'generate_lattice'.
+        lat_type : "circular" or "stacked"
+            The type of lattice to generate.
+        chunk_size : int > 0, Default = 65536, optional
+            The number of polygons generated per chunk.
+
+        Yields
+        ------
+        vertices : list
+            Names of the chunk's new vertices.
+        positions : Nx2 array
+            Positions of the chunk's new vertices.
+        edges : list
+            The chunk's new edges as 2-tuples of vertex names, which may include vertices from
+            earlier chunks.
+
+        Example
+        -------
+        >>> hexagon = Hexagon()
+        >>> for vertices, positions, edges in hexagon.iter_lattice(1000, "circular"):
+        ...     write_chunk(vertices, positions, edges)
+
+        Notes
+        -----
+        Every vertex and edge of the lattice is yielded exactly once, with the same names and in
+        the same order as in the lattice from 'generate_lattice'. Memory use depends only on the
+        chunk size, not on the size of the lattice. The size, type and chunk size are checked
+        when 'iter_lattice' is called, rather than when the first chunk is generated.
+        """
+        if not self.get_lattice_state():
+            raise PolyLatError("Lattice not possible with this shape.")
+        elif not is_positive_int(chunk_size):
+            raise PolyLatNotPosInt(chunk_size)
+        return stream(self.get_tiling(), self._lattice_cells(layers, lat_type), chunk_size)
+
+    def generate_lattice_clipped(self, region, workers = 1):
+        """
+        Generates the part of the polygon's lattice overlapping a region.
+
+        Parameters
+        ----------
+        region : CircleRegion, BoxRegion or ConvexRegion
+            The region to clip the lattice to.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
+
+        Returns
+        -------
+        lattice : Lattice
+            Lattice object of every polygon of the polygon's tiling that overlaps the region.
+
+        Example
+        -------
+        >>> hexagon = Hexagon()
+        >>> disc = hexagon.generate_lattice_clipped(CircleRegion((0, 0), 25))
+        >>> box = hexagon.generate_lattice_clipped(BoxRegion((0, 0), (40, 10)))
+
+        Notes
+        -----
+        Whole polygons are kept, so the lattice covers the region with polygons crossing its
+        boundary included, and those only touching it left out. Polygons are numbered row by row
+        along the tiling's translation vectors. Polygons outside the region are rejected from
+        their tiling indices before any vertex is created, so generation costs time proportional
+        to the area of the region.
+        """
+        if not self.get_lattice_state():
+            raise PolyLatError("Lattice not possible with this shape.")
+        tiling = self.get_tiling()
+        return self._tile_lattice(Clipped(tiling, region), tiling, workers)
+
+    def _lattice_cells(self, layers, lat_type):
+        """
+        Returns the tiling cells of the polygon's lattice of the given size and type.
+        """
+        if lat_type == "circular":
+            return self._circular_cells(layers)
+        elif lat_type == "stacked":
+            return self._stacked_cells(*self._stacked_size(layers))
+        else:
+            raise PolyLatNotProp(lat_type)
+
+    @staticmethod
+    def _stacked_size(layers):
+        """
+        Returns the (rows, columns) of a stacked lattice from a pair or a single number.
+        """
+        if isinstance(layers, (tuple, list)):
+            return tuple(layers)
+        return (layers, layers)
+
+    def _tile_lattice(self, cells, tiling = None, workers = 1):
+        """
+        Generates and returns the lattice of the given cells of the polygon's tiling.
+
+        Parameters
+        ----------
+        cells : cell sequence
+            The cells of the tiling making up the lattice.
+        tiling : Tiling, Default = None, optional
+            The tiling to generate the lattice from. Defaults to the polygon's 'get_tiling'.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
+
+        Notes
+        -----
+        The vertex and edge arrays are generated directly by the tiling engine and loaded into
+        the lattice in bulk, so no vertex merging by proximity is needed.
+        """
+        if not is_positive_int(workers):
+            raise PolyLatNotPosInt(workers)
+        if tiling is None:
+            tiling = self.get_tiling()
+        lattice = Lattice(self.backend)
+        lattice._add_tiles(tiling, cells, *tile(tiling, cells, workers=workers))
+        return lattice
 
     @abc.abstractmethod
-    def generate_lattice_stacked(self, layers):
+    def generate_lattice_stacked(self, rows, columns, workers = 1):
         """
         Abstract method that generates and returns the stacked lattice for polygons. To be defined
         in child classes.
         """
 
     @abc.abstractmethod
-    def generate_lattice_circular(self, layers):
+    def generate_lattice_circular(self, layers, workers = 1):
         """
         Abstract method that generates and returns the circular lattice for polygons. To be defined
         in child classes.
@@ -1078,11 +2366,400 @@ class Lattice(Shape):
     """
     IMPLEMENT DOCUMENTATION
     """
-    def __init__(self):
+    def __init__(self, backend = "dict"):
         """
         IMPLEMENT DOCUMENTATION
         """
-        super().__init__()
+        super().__init__(backend)
+        # Tiling, cells and the vertex index of each cell corner, for lattices from the tiling engine
+        self._tiling = None
+        self._cells = None
+        self._cell_vertices = None
+        self._tiled_size = None
+
+    def copy(self):
+        """
+        Returns an independent copy of the lattice, which can still be grown and located on its
+        tiling.
+        """
+        lattice = super().copy()
+        if self._cell_vertices is not None:
+            lattice._cell_vertices = self._cell_vertices.copy()
+        return lattice
+
+    def _transform(self, matrix, offset):
+        """
+        Moves the lattice by an affine transform, in place, along with the tiling it was
+        generated from.
+        """
+        if self._tiling is not None:
+            self._tiling = self._tiling.transformed(matrix, offset)
+        super()._transform(matrix, offset)
+
+    def grow(self, n_layers = 1):
+        """
+        Adds layers to the outside of a circular lattice, in place.
+
+        Parameters
+        ----------
+        n_layers : int > 0, Default = 1, optional
+            The number of layers to add.
+
+        Example
+        -------
+        >>> lattice = Hexagon().generate_lattice(40, "circular")
+        >>> lattice.grow()
+
+        Notes
+        -----
+        Only the new layers are generated, so growing costs time proportional to their size
+        rather than to the whole lattice. The grown lattice has exactly the vertices and edges,
+        with the same names and in the same order, as a lattice generated with the larger number
+        of layers from the start. Only circular lattices generated from a polygon, and not since
+        given more vertices or edges, can be grown.
+        """
+        if not is_positive_int(n_layers):
+            raise PolyLatNotPosInt(n_layers)
+        elif not hasattr(self._cells, "layers"):
+            raise PolyLatError("Only circular lattices generated from a polygon can be grown.")
+        elif self._tiled_size != (self._store.num_vertices(), self._store.num_edges()):
+            raise PolyLatError("Lattice has been changed since it was generated and cannot be grown.")
+        start = len(self._cells)
+        cells = type(self._cells)(self._cells.layers + n_layers)
+        generated = tile(self._tiling, cells, start, self._cell_vertices, self._store.num_vertices())
+        self._add_tiles(self._tiling, cells, *generated)
+
+    def get_vertex_coordinates(self, as_array = False):
+        """
+        Returns the exact integer coordinates of the lattice's vertices on its tiling.
+
+        Parameters
+        ----------
+        as_array : bool, Default = False, optional
+            If True, returns an Nx3 int64 array of coordinates in vertex order instead of a
+            dictionary.
+
+        Returns
+        -------
+        coordinates : dict
+            Dictionary of vertices and their (site, i, j) coordinates.
+
+        Notes
+        -----
+        Vertex (site, i, j) is the tiling's site translated by i*t1 + j*t2, and its position is
+        calculated directly from these integers. Vertex identity therefore never depends on
+        rounded positions, and positions do not drift however large the lattice grows. The
+        coordinates are those used by 'VirtualLattice', and are only defined for lattices
+        generated by the tiling engine.
+        """
+        coordinates = self._get_vertex_coordinate_array()
+        if as_array:
+            return coordinates.copy()
+        return dict(zip(self._store.names, map(tuple, coordinates.tolist())))
+
+    def _get_vertex_coordinate_array(self):
+        """
+        Returns the cached Nx3 array of vertex coordinates on the lattice's tiling.
+        """
+        if "coordinates" not in self._cache:
+            table = self._get_cell_vertices()
+            # Each vertex is first met at the corner of its owning cell
+            _, first = np.unique(table.reshape(-1), return_index=True)
+            rank, k = np.divmod(first, table.shape[1])
+            i, j, s = self._cells.at(rank)
+            shift = self._tiling.corner_shift[s, k]
+            self._cache["coordinates"] = np.stack(
+                [self._tiling.corner_site[s, k], i + shift[:, 0], j + shift[:, 1]], axis=1)
+        return self._cache["coordinates"]
+
+    def get_vertex_at(self, coordinate):
+        """
+        Returns the vertex at the given exact integer coordinates.
+
+        Parameters
+        ----------
+        coordinate : (site, i, j)
+            Integer coordinates of a vertex on the lattice's tiling.
+
+        Returns
+        -------
+        vertex : the vertex with those coordinates.
+
+        Notes
+        -----
+        The vertex is found by index arithmetic on the tiling rather than by comparing positions,
+        in O(1) time.
+        """
+        table = self._get_cell_vertices()
+        site, i, j = coordinate
+        if not 0 <= site < len(self._tiling.sites):
+            raise PolyLatNotExist(coordinate)
+        rank, corner = self._tiling.vertex_owners(self._cells, [site], [i], [j])
+        if rank[0] < 0:
+            raise PolyLatNotExist(coordinate)
+        return self._store.vertex_name(int(table[rank[0], corner[0]]))
+
+    def get_cell_vertices(self, cell):
+        """
+        Returns the vertices of a polygon of the lattice.
+
+        Parameters
+        ----------
+        cell : int
+            The polygon's cell id; its position, from 0, in the order the lattice's polygons
+            were generated.
+
+        Returns
+        -------
+        vertices : list
+            List of the polygon's vertices, in order around the polygon.
+
+        Example
+        -------
+        >>> lattice = Hexagon().generate_lattice(3, "circular")
+        >>> lattice.get_cell_vertices(0)
+        ['0-0', '0-1', '0-2', '0-3', '0-4', '0-5']
+
+        Notes
+        -----
+        The vertex index of every corner of every polygon is recorded in the lattice's cell table
+        as it is generated, so this is an O(1) lookup.
+        """
+        table = self._get_cell_vertices()
+        self._check_cell(cell)
+        return [self._store.vertex_name(idx) for idx in table[cell].tolist()]
+
+    def get_cell_info(self, cell):
+        """
+        Returns the information of a polygon of the lattice.
+
+        Parameters
+        ----------
+        cell : int
+            The polygon's cell id.
+
+        Returns
+        -------
+        info : dict
+            Dictionary of the polygon's 'name', its tiling 'coordinates' (i, j, s), and its
+            'layer' in circular lattices or its 'row' and 'column' in stacked lattices.
+
+        Notes
+        -----
+        The information is calculated from the cell id by index arithmetic, in O(1) time.
+        """
+        self._get_cell_vertices()
+        self._check_cell(cell)
+        i, j, s = self._cells.cells(cell, cell + 1)
+        info = {"name": self._cells.labels([cell])[0], "coordinates": (int(i[0]), int(j[0]), int(s[0]))}
+        info.update(self._cells.info(cell))
+        return info
+
+    def get_layer_cells(self, layer):
+        """
+        Returns the cell ids of the polygons in a layer of a circular lattice.
+
+        Parameters
+        ----------
+        layer : int >= 0
+            The layer; 0 for the generating polygon, and l for the ring of polygons l steps out
+            from it.
+
+        Returns
+        -------
+        cells : range
+            The ids of the layer's polygons, which are numbered layer by layer.
+        """
+        self._get_cell_vertices()
+        if not hasattr(self._cells, "layers"):
+            raise PolyLatError("Only circular lattices have layers.")
+        elif not (isinstance(layer, int) and 0 <= layer < self._cells.layers):
+            raise PolyLatNotExist(layer)
+        return self._cells.layer_cells(layer)
+
+    def get_row_cells(self, row):
+        """
+        Returns the cell ids of the polygons in a row of a stacked lattice.
+        """
+        self._get_cell_vertices()
+        if not hasattr(self._cells, "rows"):
+            raise PolyLatError("Only stacked lattices have rows and columns.")
+        elif not (isinstance(row, int) and 0 <= row < self._cells.rows):
+            raise PolyLatNotExist(row)
+        return self._cells.row_cells(row)
+
+    def get_column_cells(self, column):
+        """
+        Returns the cell ids of the polygons in a column of a stacked lattice.
+        """
+        self._get_cell_vertices()
+        if not hasattr(self._cells, "columns"):
+            raise PolyLatError("Only stacked lattices have rows and columns.")
+        elif not (isinstance(column, int) and 0 <= column < self._cells.columns):
+            raise PolyLatNotExist(column)
+        return self._cells.column_cells(column)
+
+    def cell_neighbours(self, cell):
+        """
+        Returns the polygons sharing an edge with a polygon of the lattice.
+
+        Parameters
+        ----------
+        cell : int or array of ints
+            The cell id of the polygon, or an array of cell ids.
+
+        Returns
+        -------
+        neighbours : list or int array
+            List of the neighbouring cell ids, in order of the polygon's sides. For an array of
+            cell ids, an array with one more dimension of length the number of sides, holding
+            the neighbour across each side or -1 where the side is on the lattice's edge.
+
+        Example
+        -------
+        >>> lattice = Hexagon().generate_lattice(10, "circular")
+        >>> lattice.cell_neighbours(0)
+        [3, 4, 5, 6, 1, 2]
+        >>> lattice.cell_neighbours(np.arange(200)).shape
+        (200, 6)
+
+        Notes
+        -----
+        The polygon across each side is found by index arithmetic on the lattice's tiling, in
+        O(1) time per polygon with no search of the edges.
+        """
+        self._get_cell_vertices()
+        ranks = np.asarray(cell)
+        if not ranks.ndim:
+            self._check_cell(cell)
+        else:
+            bad = (ranks < 0) | (ranks >= len(self._cells))
+            if bad.any():
+                raise PolyLatNotExist(ranks[bad][0])
+        i, j, s = self._cells.at(ranks.reshape(-1).astype(np.int64))
+        side_neighbour = self._tiling.side_neighbour[s]
+        offset = self._tiling.side_offset[s]
+        neighbours = self._cells.rank(i[:, None] + offset[..., 0], j[:, None] + offset[..., 1], side_neighbour)
+        neighbours[side_neighbour < 0] = -1
+        if not ranks.ndim:
+            return [rank for rank in neighbours[0].tolist() if rank >= 0]
+        return neighbours.reshape(ranks.shape + (self._tiling.num_corners,))
+
+    def vertex_neighbour_indices(self, indices):
+        """
+        Returns the neighbours of an array of vertices, by vertex index.
+
+        Parameters
+        ----------
+        indices : array of ints
+            Indices of vertices, their positions in 'vertices'.
+
+        Returns
+        -------
+        neighbours : int array
+            Array with one more dimension than 'indices', of length the most edges meeting at a
+            vertex of the tiling, holding the indices of each vertex's neighbours in increasing
+            order padded with -1.
+
+        Notes
+        -----
+        The polygons meeting at each vertex are found by index arithmetic on the lattice's
+        tiling, and its neighbours are read from their corners in the lattice's cell table. After
+        the tiling coordinates of the vertices are first calculated and cached, this is O(1) time
+        per vertex. Only lattices unchanged since generation can be queried, as added vertices
+        and edges are not part of the tiling.
+        """
+        table = self._get_cell_vertices()
+        if self._tiled_size != (self._store.num_vertices(), self._store.num_edges()):
+            raise PolyLatError("Lattice has been changed since it was generated.")
+        indices = np.asarray(indices, dtype=np.int64)
+        bad = (indices < 0) | (indices >= self._store.num_vertices())
+        if bad.any():
+            raise PolyLatNotExist(indices[bad][0])
+        coordinates = self._get_vertex_coordinate_array()[indices.reshape(-1)]
+        rank, corner = self._tiling.vertex_cells(self._cells, *coordinates.T)
+        K = table.shape[1]
+        present = np.concatenate([rank >= 0, rank >= 0], axis=1)
+        rank = np.maximum(rank, 0)
+        neighbours = np.concatenate([table[rank, (corner - 1) % K], table[rank, (corner + 1) % K]], axis=1)
+        # Each neighbour is met from the polygons either side of their edge; keep it once
+        neighbours = np.where(present, neighbours, np.iinfo(np.int32).max)
+        neighbours.sort(axis=1)
+        neighbours[:, 1:][neighbours[:, 1:] == neighbours[:, :-1]] = np.iinfo(np.int32).max
+        neighbours.sort(axis=1)
+        D = self._tiling.max_degree
+        neighbours = np.where(neighbours[:, :D] == np.iinfo(np.int32).max, -1, neighbours[:, :D])
+        return neighbours.reshape(indices.shape + (D,))
+
+    def locate_cells(self, points):
+        """
+        Returns the polygon of the lattice containing each of an array of points.
+
+        Parameters
+        ----------
+        points : Mx2 array
+            The points to locate.
+
+        Returns
+        -------
+        cells : int array of length M
+            The cell id of the polygon containing each point, or -1 for points outside the
+            lattice. Points on an edge shared by two polygons are given to one of them.
+
+        Example
+        -------
+        >>> lattice = Hexagon().generate_lattice(100, "circular")
+        >>> points = np.random.default_rng().uniform(-50, 50, (10_000_000, 2))
+        >>> cells = lattice.locate_cells(points)
+        >>> np.bincount(cells[cells >= 0], minlength=lattice.get_shape_num())
+
+        Notes
+        -----
+        Points are located on the lattice's tiling in closed form, by writing them in units of
+        its translation vectors and testing only the few polygons that can cover the cell found,
+        so this is O(1) time per point with no search of the lattice's polygons. The polygons
+        are located as generated, along with any later moves of the whole lattice.
+        """
+        self._get_cell_vertices()
+        return self._tiling.locate(self._cells, self._as_points(points))
+
+    def _check_cell(self, cell):
+        """
+        Raises PolyLatNotExist unless 'cell' is the id of one of the lattice's polygons.
+        """
+        if not (isinstance(cell, (int, np.integer)) and 0 <= cell < len(self._cells)):
+            raise PolyLatNotExist(cell)
+
+    def _get_cell_vertices(self):
+        """
+        Returns the CxK table of the vertex index of each corner of the lattice's cells.
+        """
+        if self._cells is None:
+            raise PolyLatError("Lattice was not generated from a polygon's tiling.")
+        return self._cell_vertices[:len(self._cells)]
+
+    def _add_tiles(self, tiling, cells, names, positions, ends, corners):
+        """
+        Adds the vertices and edges generated by the tiling engine for the last cells of 'cells',
+        and records the tiling and cells the lattice is made of.
+        """
+        # Names are unique by construction, so the bulk checks of 'add_vertices' are skipped
+        start = self._store.num_vertices()
+        self._store.extend_vertices(names, positions, np.full(len(names), 4), colour_codes("b", len(names)))
+        self._store.extend_edges(ends, np.ones(len(ends), dtype=np.int64), colour_codes("k", len(ends)))
+        if self._spatial is not None:
+            for idx, position in enumerate(positions.tolist(), start):
+                self._spatial.insert(idx, tuple(position))
+        count = len(cells)
+        if self._cell_vertices is None:
+            self._cell_vertices = corners
+        else:
+            self._cell_vertices = grow_array(self._cell_vertices, count)
+            self._cell_vertices[count - len(corners):count] = corners
+        self._tiling = tiling
+        self._cells = cells
+        self._tiled_size = (self._store.num_vertices(), self._store.num_edges())
+        self._invalidate()
     
     def __set_lattice_type(self, lattice_type):
         """
@@ -1093,16 +2770,26 @@ class Lattice(Shape):
 
     def get_shape_num(self):
         """
-        IMPLEMENT DOCUMENTATION
+        Returns the number of polygons in the lattice.
+
+        Notes
+        -----
+        For lattices generated from a polygon's tiling this is the size of the lattice's cell
+        table. Other lattices fall back on Euler's formula, which only holds for connected
+        planar lattices.
         """
+        if self._cells is not None:
+            return len(self._cells)
         ## Using Euler's Formula: v - e + f = 2 (f includes outside face)
         # Only works if connected planar graph.
         return 1 - len(self.vertices) + len(self)
 
     def get_shape_sides(self):
         """
-        IMPLEMENT DOCUMENTATION
+        Returns the number of sides of the polygons in the lattice.
         """
+        if self._tiling is not None:
+            return self._tiling.num_corners
         ## This returns the No. of sides of the shpe in the lattice....
         edge_vecs = list(self.get_edge_vectors().values())
         initial_vertex_pos = self.vertices_info[0][1]["position"]
@@ -10,8 +10,11 @@ the key attributes for all non-regular polygons.
 """
 
 import abc
-from polylatlib.classes.base_shapes import Polygon, Lattice
-from polylatlib.functions import add_vectors, change_to_cart_list
+import numpy as np
+from polylatlib.classes.base_shapes import Polygon
+from polylatlib.functions import change_to_cart_list
+from polylatlib.exception import PolyLatError
+from polylatlib.tiling import Tiling, SquareRings, Block
 
 __all__ = [
     "NonRegularPolygon",
@@ -24,11 +27,11 @@ class NonRegularPolygon(Polygon):
     """
     IMPLEMENT DOCUMENTATION
     """
-    def __init__(self, start_point, rotation):
+    def __init__(self, start_point, rotation, backend = "dict"):
         """
         IMPLEMENT DOCUMENTATION
         """
-        super().__init__()
+        super().__init__(backend)
         self.start_point = start_point
         self.rotation = rotation
         self.polygon_vectors = self.generate_polygon_vectors()
@@ -45,41 +48,150 @@ class FourSided(Polygon):
     """
     IMPLEMENT DOCUMENTATION
     """    
-    def generate_lattice_from_vectors(self, layers, chg_vectors): 
+    def get_tiling(self, translations = None):
         """
-        IMPLEMENT DOCUMENTATION
+        Returns the periodic tiling of the plane by copies of this four sided polygon.
+
+        Parameters
+        ----------
+        translations : 2x2 sequence, Default = None, optional
+            The two translation vectors repeating the polygon. Defaults to the polygon's third and
+            fourth edge vectors, which tile any parallelogram edge to edge.
+
+        Returns
+        -------
+        tiling : Tiling
+            Tiling with this polygon as cell (0, 0).
+
+        Notes
+        -----
+        The translated copies must tile the plane edge to edge; without gaps or overlaps, and with
+        every side shared whole with one other copy. Translations that do not are rejected; the
+        area they span must equal the polygon's area and every side must meet another copy's.
+        """
+        if translations is None:
+            translations = self.polygon_vectors[2:4]
+        tiling = Tiling.from_vectors(self.start_point, self.polygon_vectors, translations)
+        corners = tiling.sites[tiling.corner_site[0]] + tiling.corner_shift[0] @ tiling.translations
+        x, y = corners[:, 0], corners[:, 1]
+        area = abs((x*np.roll(y, -1) - np.roll(x, -1)*y).sum())/2
+        if not np.isclose(area, abs(np.linalg.det(tiling.translations))) or (tiling.side_neighbour < 0).any():
+            raise PolyLatError(f"Translations {translations} do not tile the polygon edge to edge.")
+        return tiling
+
+    def generate_lattice_circular(self, layers, workers = 1):
+        """
+        Generates and returns the circular lattice for the four sided polygon.
+
+        Parameters
+        ----------
+        layers : int > 0
+            The number of desired layers in the lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
+
+        Returns
+        -------
+        lattice : Lattice
+            Lattice object of the polygon in square rings around the generating polygon.
+
+        Notes
+        -----
+        Polygons are numbered ring by ring from the generating polygon, 0, with ring l holding the
+        8l polygons l steps away along the polygon's edges.
+        """
+        return self._tile_lattice(self._circular_cells(layers), workers=workers)
+
+    def generate_lattice_stacked(self, rows, columns, workers = 1):
+        """
+        Generates and returns the stacked lattice for the four sided polygon.
+
+        Parameters
+        ----------
+        rows : int > 0
+            Number of rows in the stacked lattice.
+        columns : int > 0
+            Number of columns in the stacked lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
+
+        Returns
+        -------
+        lattice : Lattice
+            Lattice object of the polygon in stacked, row by column, layers with the generating
+            polygon in the first row and column.
+
+        Notes
+        -----
+        Each column is offset from the last along the polygon's first edge, and each row along its
+        second edge. Polygons are named 'row.column'.
+        """
+        return self._tile_lattice(self._stacked_cells(rows, columns), workers=workers)
+
+    def _circular_cells(self, layers):
+        """
+        Returns the tiling cells of the circular lattice with the given number of layers.
+        """
+        return SquareRings(layers)
+
+    def _stacked_cells(self, rows, columns):
+        """
+        Returns the tiling cells of the stacked lattice with the given rows and columns.
+        """
+        return Block(rows, columns, (0, -1), (-1, 0))
+
+    def generate_lattice_from_vectors(self, translations, i_range, j_range, workers = 1):
+        """
+        Generates and returns the lattice of the polygon repeated by two translation vectors.
+
+        Parameters
+        ----------
+        translations : 2x2 sequence
+            The two translation vectors, t1 and t2, repeating the polygon.
+        i_range : range
+            The multiples of t1 to translate the polygon by.
+        j_range : range
+            The multiples of t2 to translate the polygon by.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
+
+        Returns
+        -------
+        lattice : Lattice
+            Lattice object with a copy of the polygon translated by i*t1 + j*t2 for every i in
+            'i_range' and j in 'j_range'.
+
+        Example
+        -------
+        # A rectangle's polygon vectors are (height, 0) and (0, width), so translations along them
+        # repeat it side by side
+        >>> rect = Rectangle(2, 1)
+        >>> lattice = rect.generate_lattice_from_vectors([(1, 0), (0, 2)], range(-2, 3), range(0, 4))
+
+        Notes
+        -----
+        The translations must tile the plane with the polygon edge to edge, as checked by
+        'get_tiling'. Polygons are named 'row.column', where rows count along 'j_range' and columns
+        along 'i_range' from 0. Vertices and edges shared between copies are found by index
+        arithmetic, so the lattice is exact and generated in time linear in its size.
         """
-        lattice = Lattice(layers)
-        
-        radius_vec = add_vectors(chg_vectors[2], chg_vectors[3])
-
-        even_numbers = list(range(0, 2*layers, 2))
-        shape = 0
-        for layer in range(layers):
-            if layer == 0:
-                lattice.generate_shape(self.start_point, shape, chg_vectors)
-                shape += 1
-            else:
-                radius_vec = (round((layer*radius_vec[0]), 3), round((layer*radius_vec[1]), 3))
-                start_vertex_pos = add_vectors(self.start_point, radius_vec)
-                for i in range(4):
-                    for _ in range(even_numbers[layer]):
-                        lattice.generate_shape(start_vertex_pos, shape, chg_vectors)
-                        start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[i])
-                        shape += 1
-        return lattice
+        for index_range in (i_range, j_range):
+            if not isinstance(index_range, range) or index_range.step != 1 or not len(index_range):
+                raise PolyLatError("Index ranges must be non-empty ranges with a step of 1.")
+        cells = Block(len(j_range), len(i_range), start=(i_range.start, j_range.start))
+        return self._tile_lattice(cells, self.get_tiling(translations), workers)
 
 class Rectangle(NonRegularPolygon, FourSided):
     """
     IMPLEMENT DOCUMENTATION
     """
-    def __init__(self, width, height, start_point = (0, 0), rotation = 0):
+    def __init__(self, width, height, start_point = (0, 0), rotation = 0, backend = "dict"):
         """
         IMPLEMENT DOCUMENTATION
         """
         self.height = height
         self.width = width
-        super().__init__(start_point, rotation)
+        super().__init__(start_point, rotation, backend)
     
     def generate_change_vectors(self): 
         """
@@ -111,14 +223,14 @@ class Parallelogram(NonRegularPolygon, FourSided):
     """
     IMPLEMENT DOCUMENTATION
     """
-    def __init__(self, width, height, angle, start_point = (0, 0), rotation = 0):
+    def __init__(self, width, height, angle, start_point = (0, 0), rotation = 0, backend = "dict"):
         """
         IMPLEMENT DOCUMENTATION
         """
         self.height = height
         self.width = width
         self.angle = angle
-        super().__init__(start_point, rotation)
+        super().__init__(start_point, rotation, backend)
 
     def generate_change_vectors(self): 
         """
@@ -10,9 +10,10 @@ key attributes for all regular polygons and automatic regular polygon generation
 """
 
 from math import sqrt, sin, cos, radians
-from polylatlib.classes.base_shapes import Shape, Polygon, Lattice
-from polylatlib.functions import change_to_cart_list, change_to_cart_vector, check_if_coord, add_vectors
+from polylatlib.classes.base_shapes import Shape, Polygon
+from polylatlib.functions import change_to_cart_vector, check_if_coord, add_vectors
 from polylatlib.exception import PolyLatError, PolyLatNotCart
+from polylatlib.tiling import Tiling, HexRings, SquareRings, TriangleRings, Block
 
 __all__ = [
     "RegularPolygon",
@@ -42,6 +43,8 @@ class RegularPolygon(Polygon):
     rotation : angle
         The angle, in degrees, to rotate the shape around the centre anti-clockwise. This value
         is cyclic with period 360 degrees (Attribute).
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the shape, and for any lattice generated from it (Attribute).
 
     Attributes
     ----------
@@ -69,7 +72,7 @@ class RegularPolygon(Polygon):
     length. Along with a given centre and a rotation all further features of these shapes can
     be found through private class methods.
     """
-    def __init__(self, sides: int, edge_length, centre, rotation):
+    def __init__(self, sides: int, edge_length, centre, rotation, backend = "dict"):
         """
         Initialises a Regular Polygon object.
 
@@ -91,7 +94,7 @@ class RegularPolygon(Polygon):
         elif not check_if_coord(self.centre):
             raise PolyLatNotCart(self.centre)
 
-        super().__init__()
+        super().__init__(backend)
 
         # Set Radius related attributes
         self.int_angle = round(((sides - 2)*180)/sides, 3)
@@ -124,6 +127,22 @@ class RegularPolygon(Polygon):
             edge_vectors.append(change_to_cart_vector((self.edge_length, angle)))
         return edge_vectors
 
+    def _corner_offsets(self):
+        """
+        Returns the exact offsets of the polygon's vertices from its centre, in generation order.
+
+        Notes
+        -----
+        Unlike the rounded vectors used to generate the polygon, these are calculated without
+        rounding for use in exact lattice generation.
+        """
+        radius = self.edge_length/(2*sin(radians(180/self.sides)))
+        offsets = []
+        for k in range(self.sides):
+            angle = radians(self.rotation + k*360/self.sides)
+            offsets.append((radius*cos(angle), radius*sin(angle)))
+        return offsets
+
     def get_lattice_state(self):
         """
         Returns True if lattice can be generated from current regular polygon. False otherwise.
@@ -140,6 +159,18 @@ class RegularPolygon(Polygon):
         lattice_test = 360/self.int_angle
         return lattice_test.is_integer()
 
+    def _canonical_form(self):
+        """
+        Returns the lattice cache key of the regular polygon, and the rotation matrix and centre
+        taking lattices of the same polygon centred on the origin, with no rotation, onto its own.
+        """
+        # Only the presets implement lattice generation
+        if type(self) is RegularPolygon:
+            return None
+        angle = radians(self.rotation)
+        matrix = ((cos(angle), -sin(angle)), (sin(angle), cos(angle)))
+        return (type(self), self.edge_length, self.backend), matrix, self.centre
+
 
 
 ################## PRESETs for REGULAR POLYGONs ######################
@@ -157,6 +188,8 @@ class EquilateralTriangle(RegularPolygon):
         Centre position for the polygon.
     rotation : angle, Default = 0, optional
         The angle, in degrees, to rotate the polygon arounds its centre anti-clockwise.
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the polygon and its lattices.
 
     Notes
     -----
@@ -164,13 +197,13 @@ class EquilateralTriangle(RegularPolygon):
     degrees. The default Equilateral Triangle is generated "pointing" along the x-axis in the
     positive direction centred at the origin, (0, 0).
     """
-    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0):
+    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0, backend = "dict"):
         """
         Equilateral Triangles are initialised as Regular Polygons with 3 sides.
         """
-        super().__init__(3, edge_length, centre, rotation)
+        super().__init__(3, edge_length, centre, rotation, backend)
 
-    def generate_lattice_circular(self, layers: int):
+    def generate_lattice_circular(self, layers: int, workers: int = 1):
         """
         Generates and returns the circular lattice for Equilateral Triangles.
 
@@ -178,6 +211,8 @@ class EquilateralTriangle(RegularPolygon):
         ----------
         layers : int > 0
             The number of desired layers in the lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
 
         Returns
         -------
@@ -187,55 +222,36 @@ class EquilateralTriangle(RegularPolygon):
 
         Notes
         -----
-        Triangles in circular lattices have alternating orientaion for each layer.
+        Triangles in circular lattices have alternating orientaion for each layer. Triangles are
+        numbered layer by layer from the central triangle, 0, with each layer moving
+        anti-clockwise. The lattice is generated exactly from the triangles' integer coordinates
+        on the triangular grid, in time linear in the size of the lattice.
         """
-        polar_vectors = []
-        for i in range(2*self.sides):
-            polar_vectors.append((self.edge_length, 30 + (i + 1)*self.int_angle + self.rotation))
-        chg_vectors = change_to_cart_list(polar_vectors)
+        return self._tile_lattice(self._circular_cells(layers), workers=workers)
 
-        triangle_one = []
-        for i in range(self.sides):
-            triangle_one.append(chg_vectors[2*i + 1])
-        triangle_two = []
-        for i in range(self.sides):
-            triangle_two.append(chg_vectors[len(chg_vectors) - (2*i + 1)])
-
-        lattice = Lattice()
-        shape = 0
-        origin_vertex = add_vectors(self.centre, self.radius_vec)
-        for layer in range(layers):
-            if layer == 0:
-                lattice.generate_shape(origin_vertex, shape, triangle_one)
-            else:
-                if layer % 2 == 0: # Odd Layers
-                    origin_vertex = add_vectors(origin_vertex, chg_vectors[5])
-                    origin_vertex = add_vectors(origin_vertex, chg_vectors[4])
-                    vertex_pos = origin_vertex
-                    for i in range(3):
-                        for _ in range(int(layer/2)):
-                            shape += 1
-                            lattice.generate_shape(vertex_pos, shape, triangle_one)
-                            vertex_pos = add_vectors(vertex_pos, chg_vectors[2*i])
-                        for _ in range(int(layer/2)):
-                            shape += 1
-                            lattice.generate_shape(vertex_pos, shape, triangle_one)
-                            vertex_pos = add_vectors(vertex_pos, chg_vectors[(2*i) + 1])
-                else: # Even Layers
-                    origin_vertex = add_vectors(origin_vertex, chg_vectors[2])
-                    vertex_pos = origin_vertex
-                    for i in range(3):
-                        for _ in range(int((layer + 1)/2)):
-                            shape += 1
-                            lattice.generate_shape(vertex_pos, shape, triangle_two)
-                            vertex_pos = add_vectors(vertex_pos, chg_vectors[2*i])
-                        for _ in range(int((layer + 1)/2) - 1):
-                            shape += 1
-                            lattice.generate_shape(vertex_pos, shape, triangle_two)
-                            vertex_pos = add_vectors(vertex_pos, chg_vectors[(2*i) + 1])
-        return lattice
-
-    def generate_lattice_stacked(self, rows, columns):
+    def get_tiling(self):
+        """
+        Returns the periodic tiling of the plane by copies of this triangle.
+
+        Returns
+        -------
+        tiling : Tiling
+            Tiling with this triangle and its reflection in its third edge as cell (0, 0), and
+            translation vectors along the triangle's first and second edges.
+        """
+        corners = self._corner_offsets()
+        translations = [
+            (corners[1][0] - corners[0][0], corners[1][1] - corners[0][1]),
+            (corners[2][0] - corners[1][0], corners[2][1] - corners[1][1])
+        ]
+        reflected = [
+            corners[2],
+            corners[0],
+            (corners[0][0] + corners[2][0] - corners[1][0], corners[0][1] + corners[2][1] - corners[1][1])
+        ]
+        return Tiling(self.centre, translations, [corners, reflected])
+
+    def generate_lattice_stacked(self, rows, columns, workers = 1):
         """
         Generates and returns the stacked lattice for the Equilateral Triangles.
 
@@ -245,6 +261,8 @@ class EquilateralTriangle(RegularPolygon):
             The number of desired rows in the lattice.
         columns : int > 0
             The number of desired columns in the lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
 
         Returns
         -------
@@ -256,38 +274,22 @@ class EquilateralTriangle(RegularPolygon):
         -----
         Triangles in stacked lattices have alternating orientaion row-wise and column-wise.
 
+        Triangles are named 'row.column'. Every vertex and edge is placed by index arithmetic on
+        the triangles' integer coordinates, in time linear in the size of the lattice.
+        """
+        return self._tile_lattice(self._stacked_cells(rows, columns), workers=workers)
+
+    def _circular_cells(self, layers):
+        """
+        Returns the tiling cells of the circular lattice with the given number of layers.
+        """
+        return TriangleRings(layers)
+
+    def _stacked_cells(self, rows, columns):
+        """
+        Returns the tiling cells of the stacked lattice with the given rows and columns.
         """
-        edge_vec_1 = list(self.get_edge_vectors().values())
-        edge_vec_2 = [edge_vec_1[2], edge_vec_1[1], edge_vec_1[0]]
-
-        edge_vec = [edge_vec_1, edge_vec_2]
-
-        move_row = [edge_vec_1[0], edge_vec_1[2]]
-        move_col = [edge_vec_1[2], (-edge_vec_1[0][0], -edge_vec_1[0][1])]
-
-        lattice = Lattice()
-        origin_vertex = add_vectors(self.centre, self.radius_vec)
-        for i in range(rows):
-            col_pos = origin_vertex
-            if i % 2 == 0:
-                for j in range(columns):
-                    if j % 2 == 0:
-                        lattice.generate_shape(col_pos, str(i) + "." + str(j), edge_vec[(i % 2)])
-                    else:
-                        lattice.generate_shape(col_pos, str(i) + "." + str(j), edge_vec[(i % 2) - 1])
-                        col_pos = add_vectors(col_pos, move_col[0])
-                        col_pos = add_vectors(col_pos, move_col[1])
-                origin_vertex = add_vectors(origin_vertex, move_row[(i % 2)])
-            else:
-                for j in range(columns):
-                    if j % 2 == 0:
-                        lattice.generate_shape(col_pos, str(i) + "." + str(j), edge_vec[(i % 2)])
-                        col_pos = add_vectors(col_pos, move_col[0])
-                        col_pos = add_vectors(col_pos, move_col[1])
-                    else:
-                        lattice.generate_shape(col_pos, str(i) + "." + str(j), edge_vec[(i % 2) - 1])
-                origin_vertex = add_vectors(origin_vertex, move_row[(i % 2)])
-        return lattice
+        return Block(rows, columns, (0, -1), (-1, -1), polygons=2)
 
 class Square(RegularPolygon):
     """
@@ -301,6 +303,8 @@ class Square(RegularPolygon):
         Centre position for the polygon.
     rotation : angle, Default = 45, optional
         The angle, in degrees, to rotate the polygon arounds its centre anti-clockwise.
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the polygon and its lattices.
 
     Notes
     -----
@@ -308,13 +312,13 @@ class Square(RegularPolygon):
     of Squares is with its edges parallel to the axes. This means that unlike other preset
     regular polygons the initial vertex of the shape does not lie upon the x-axis.
     """
-    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 45):
+    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 45, backend = "dict"):
         """
         Squares are initialised as Regular Polygons with 4 sides.
         """
-        super().__init__(4, edge_length, centre, rotation)
+        super().__init__(4, edge_length, centre, rotation, backend)
 
-    def generate_lattice_circular(self, layers: int):
+    def generate_lattice_circular(self, layers: int, workers: int = 1):
         """
         Generates and returns the circular lattice for Squares.
 
@@ -322,34 +326,25 @@ class Square(RegularPolygon):
         ----------
         layers : int > 0
             The number of desired layers in the lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
 
         Returns
         -------
         lattice : Lattice
             Lattice object of squares in circular layers centred on the generating
             shape's centre.
-        """
-        chg_vectors = list(self.get_edge_vectors().values())
-
-        lattice = Lattice()
 
-        even_numbers = list(range(0, 2*layers, 2))
-        shape = 0
-        for layer in range(layers):
-            radius_vec = (round((layer*2*self.radius_vec[0]) + self.radius_vec[0], 3), round((layer*2*self.radius_vec[1]) + self.radius_vec[1], 3))
-            start_vertex_pos = add_vectors(self.centre, radius_vec)
-            if layer == 0:
-                lattice.generate_shape(start_vertex_pos, shape, chg_vectors)
-                shape += 1
-            else:
-                for i in range(self.sides):
-                    for _ in range(even_numbers[layer]):
-                        lattice.generate_shape(start_vertex_pos, shape, chg_vectors)
-                        start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[i])
-                        shape += 1
-        return lattice
+        Notes
+        -----
+        Squares are numbered ring by ring from the central square, 0, with each ring starting
+        from the square diagonally beyond the central square's first vertex. The lattice is
+        generated exactly from the squares' integer grid coordinates, in time linear in the size
+        of the lattice.
+        """
+        return self._tile_lattice(self._circular_cells(layers), workers=workers)
 
-    def generate_lattice_stacked(self, rows, columns):
+    def generate_lattice_stacked(self, rows, columns, workers = 1):
         """
         Generates and returns the stacked lattice for the Squares.
         
@@ -359,6 +354,8 @@ class Square(RegularPolygon):
             Number of rows in the stacked lattice.
         columns : int > 0
             Number of columns in the stacked lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
 
         Returns
         -------
@@ -371,19 +368,40 @@ class Square(RegularPolygon):
         Note that the idea of "stacked" specifically refers to the default position of the shape. For
         squares this results in a (row x column) grid formation with the generating square (current
         polygon) is situated in the bottom left corner.
+
+        Squares are named 'row.column'. Every vertex and edge is placed by index arithmetic on
+        the square grid, in time linear in the size of the lattice.
         """
-        edge_vec = list(self.get_edge_vectors().values())
-        move_row = edge_vec[3]
-        move_col = edge_vec[2]
-        lattice  = Lattice()
-        start_pos = add_vectors(self.centre, self.radius_vec)
-        for i in range(rows):
-            vertex_pos = start_pos
-            for j in range(columns):
-                lattice.generate_shape(vertex_pos, str(i) + "." + str(j), edge_vec)
-                vertex_pos = add_vectors(vertex_pos, move_col)
-            start_pos = add_vectors(start_pos, move_row)
-        return lattice
+        return self._tile_lattice(self._stacked_cells(rows, columns), workers=workers)
+
+    def _circular_cells(self, layers):
+        """
+        Returns the tiling cells of the circular lattice with the given number of layers.
+        """
+        return SquareRings(layers)
+
+    def _stacked_cells(self, rows, columns):
+        """
+        Returns the tiling cells of the stacked lattice with the given rows and columns.
+        """
+        return Block(rows, columns)
+
+    def get_tiling(self):
+        """
+        Returns the periodic tiling of the plane by copies of this square.
+
+        Returns
+        -------
+        tiling : Tiling
+            Tiling with this square as cell (0, 0) and translation vectors along the square's
+            third and fourth edges; one column across and one row up in the default orientation.
+        """
+        corners = self._corner_offsets()
+        translations = [
+            (corners[3][0] - corners[2][0], corners[3][1] - corners[2][1]),
+            (corners[0][0] - corners[3][0], corners[0][1] - corners[3][1])
+        ]
+        return Tiling(self.centre, translations, [corners])
 
 class Pentagon(RegularPolygon):
     """
@@ -397,16 +415,18 @@ class Pentagon(RegularPolygon):
         Centre position for the polygon.
     rotation : angle, Default = 45, optional
         The angle, in degrees, to rotate the polygon arounds its centre anti-clockwise.
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the polygon and its lattices.
 
     Notes
     -----
     Pentagons are 5 sided polygons with internal angles of 108 degrees.
     """
-    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0):
+    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0, backend = "dict"):
         """
         Pentagons are initialised as Regular Polygons with 5 sides.
         """
-        super().__init__(5, edge_length, centre, rotation)
+        super().__init__(5, edge_length, centre, rotation, backend)
 
 
 class Hexagon(RegularPolygon):
@@ -421,6 +441,8 @@ class Hexagon(RegularPolygon):
         Centre position for the polygon.
     rotation : angle, Default = 45, optional
         The angle, in degrees, to rotate the polygon arounds its centre anti-clockwise.
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the polygon and its lattices.
 
     Notes
     -----
@@ -429,13 +451,13 @@ class Hexagon(RegularPolygon):
     to the y-axis. This means that unlike other preset regular polygons that the initial vertex of
     the shape does not lie upon the x-axis.
     """
-    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 30):
+    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 30, backend = "dict"):
         """
         Hexagons are initialised as Regular Polygons with 6 sides.
         """
-        super().__init__(6, edge_length, centre, rotation)
+        super().__init__(6, edge_length, centre, rotation, backend)
 
-    def generate_lattice_circular(self, layers: int):
+    def generate_lattice_circular(self, layers: int, workers: int = 1):
         """
         Generates and returns the circular lattice for Hexagons.
 
@@ -443,40 +465,42 @@ class Hexagon(RegularPolygon):
         ----------
         layers : int > 0
             The number of desired layers in the lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
 
         Returns
         -------
         lattice : Lattice
             Lattice object of hexagons in circular layers centred on the generating
             shape's centre.
+
+        Notes
+        -----
+        Hexagons are numbered ring by ring from the central hexagon, 0, with each ring starting
+        from the hexagon below-left of the centre and moving anti-clockwise. The lattice is
+        generated exactly from the hexagons' integer axial coordinates, in time linear in the size
+        of the lattice.
         """
-        edgeLengthPlus = 1.5*self.edge_length
-        halfHexHeight = round(sqrt(0.75*((self.edge_length)**2)), 2)
-        vector_length = round(sqrt(edgeLengthPlus**2 + halfHexHeight**2), 2)
-        polar_vectors = []
-        for i in range(self.sides):
-            polar_vectors.append((vector_length, i*(self.theta) + self.theta/2 + self.rotation))
-        chg_vectors = change_to_cart_list(polar_vectors)
-
-        lattice = Lattice()
-        polygon_vectors = list(self.get_edge_vectors().values())
-
-        shape = 1
-        for layer in range(layers):
-            if layer == 0:
-                start_vertex_pos = add_vectors(self.centre, self.radius_vec)
-                lattice.generate_shape(start_vertex_pos, 0, polygon_vectors)
-            else:
-                start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[4])
-                lattice.generate_shape(start_vertex_pos, shape, polygon_vectors)
-                for i in range(self.sides):
-                    for _ in range(layer):
-                        shape += 1
-                        start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[i])
-                        lattice.generate_shape(start_vertex_pos, shape, polygon_vectors)
-        return lattice
-
-    def generate_lattice_stacked(self, rows, columns):
+        return self._tile_lattice(self._circular_cells(layers), workers=workers)
+
+    def get_tiling(self):
+        """
+        Returns the periodic tiling of the plane by copies of this hexagon.
+
+        Returns
+        -------
+        tiling : Tiling
+            Tiling with this hexagon as cell (0, 0) and translation vectors to the neighbouring
+            hexagons at 30 and 90 degrees anti-clockwise of the hexagon's rotation.
+        """
+        spacing = sqrt(3)*self.edge_length
+        translations = [
+            (spacing*cos(radians(self.rotation + 30)), spacing*sin(radians(self.rotation + 30))),
+            (spacing*cos(radians(self.rotation + 90)), spacing*sin(radians(self.rotation + 90)))
+        ]
+        return Tiling(self.centre, translations, [self._corner_offsets()])
+
+    def generate_lattice_stacked(self, rows, columns, workers = 1):
         """
         Generates and returns the stacked lattice for the Hexagons.
 
@@ -486,6 +510,8 @@ class Hexagon(RegularPolygon):
             Number of rows in the stacked lattice.
         columns : int > 0
             Number of columns in the stacked lattice.
+        workers : int > 0, Default = 1, optional
+            The number of processes to generate the lattice with.
 
         Returns
         -------
@@ -496,23 +522,25 @@ class Hexagon(RegularPolygon):
         Notes
         -----
         Note that the idea of "stacked" specifically refers to the default position of the shape.
+        Each row is offset from the last by the neighbouring hexagon at 30 degrees, and each column
+        by the neighbouring hexagon at -30 degrees, from the hexagon's rotation.
+
+        Hexagons are named 'row.column'. Every vertex and edge is placed by index arithmetic on
+        the hexagons' axial coordinates, in time linear in the size of the lattice.
+        """
+        return self._tile_lattice(self._stacked_cells(rows, columns), workers=workers)
+
+    def _circular_cells(self, layers):
+        """
+        Returns the tiling cells of the circular lattice with the given number of layers.
+        """
+        return HexRings(layers)
+
+    def _stacked_cells(self, rows, columns):
+        """
+        Returns the tiling cells of the stacked lattice with the given rows and columns.
         """
-        edge_vec = list(self.get_edge_vectors().values())
-        print(edge_vec)
-        edgeLengthPlus = 1.5*self.edge_length
-        halfHexHeight = round(sqrt(0.75*((self.edge_length)**2)), 2)
-        vector_length = round(sqrt(edgeLengthPlus**2 + halfHexHeight**2), 2)
-        move_row = change_to_cart_vector((vector_length, 30 + self.rotation))
-        move_col = change_to_cart_vector((vector_length, self.rotation - 30))
-        lattice  = Lattice()
-        start_pos = add_vectors(self.centre, self.radius_vec)
-        for i in range(rows):
-            vertex_pos = start_pos
-            for j in range(columns):
-                lattice.generate_shape(vertex_pos, str(i) + "." + str(j), edge_vec)
-                vertex_pos = add_vectors(vertex_pos, move_col)
-            start_pos = add_vectors(start_pos, move_row)
-        return lattice
+        return Block(rows, columns, (1, 0), (1, -1))
 
 class Septagon(RegularPolygon):
     """
@@ -526,16 +554,18 @@ class Septagon(RegularPolygon):
         Centre position for the polygon.
     rotation : angle, Default = 45, optional
         The angle, in degrees, to rotate the polygon arounds its centre anti-clockwise.
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the polygon and its lattices.
 
     Notes
     -----
     Septagons are 7 sided polygons with internal angles of 128.57 degrees.
     """
-    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0):
+    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0, backend = "dict"):
         """
         Septagons are initialised as Regular Polygons with 7 sides.
         """
-        super().__init__(7, edge_length, centre, rotation)
+        super().__init__(7, edge_length, centre, rotation, backend)
 
 
 class Octagon(RegularPolygon):
@@ -550,13 +580,15 @@ class Octagon(RegularPolygon):
         Centre position for the polygon.
     rotation : angle, Default = 45, optional
         The angle, in degrees, to rotate the polygon arounds its centre anti-clockwise.
+    backend : "dict" or "array", Default = "dict", optional
+        Storage backend for the polygon and its lattices.
 
     Notes
     -----
     Octagons are 8 sided polygons with internal angles of 135 degrees.
     """
-    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0):
+    def __init__(self, edge_length: float = 1, centre = (0, 0), rotation: float = 0, backend = "dict"):
         """
         Octagons are initialised as Regular Polygons with 8 sides.
         """
-        super().__init__(8, edge_length, centre, rotation)
+        super().__init__(8, edge_length, centre, rotation, backend)
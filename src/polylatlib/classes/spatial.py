@@ -0,0 +1,263 @@
+"""
+**********
+Spatial Hashing
+**********
+Spatial hashing for PolyLatLib.
+
+This file contains the uniform-grid spatial hash used by shapes to find existing vertices close to a
+given position without scanning every vertex in the shape, and the static grid index used to answer
+batches of nearest vertex and range queries.
+
+"""
+
+from math import floor, sqrt
+import numpy as np
+
+__all__ = [
+    "SpatialHash",
+    "GridIndex"
+]
+
+
+class SpatialHash():
+    """
+    Uniform-grid spatial hash of vertex positions.
+
+    Parameters
+    ----------
+    cell_size : float > 0
+        Side length of the square grid cells positions are bucketed into.
+
+    Notes
+    -----
+    Each position is bucketed into the grid cell that contains it. A search within a radius no
+    larger than the cell size then only needs to look at the 3 x 3 block of cells around the
+    search position, making the search O(1) regardless of how many vertices have been inserted.
+    Vertices are stored by their integer index in the shape's store.
+    """
+    def __init__(self, cell_size):
+        """
+        Initialises an empty spatial hash with the given cell size.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cell(self, position):
+        return (floor(position[0]/self.cell_size), floor(position[1]/self.cell_size))
+
+    def insert(self, idx, position):
+        """
+        Adds the vertex with index 'idx' at the given position to the hash.
+        """
+        self.cells.setdefault(self._cell(position), []).append((idx, position))
+
+    def remove(self, idx, position):
+        """
+        Removes the vertex with index 'idx' at the given position from the hash.
+        """
+        cell = self._cell(position)
+        bucket = self.cells.get(cell, [])
+        for i, entry in enumerate(bucket):
+            if entry[0] == idx:
+                del bucket[i]
+                break
+        if not bucket:
+            self.cells.pop(cell, None)
+
+    def find(self, position, radius):
+        """
+        Returns the index of the earliest inserted vertex within 'radius' of the given position,
+        or None if there is no such vertex. The radius must not exceed the cell size.
+        """
+        cx, cy = self._cell(position)
+        found = None
+        for i in (cx - 1, cx, cx + 1):
+            for j in (cy - 1, cy, cy + 1):
+                for idx, pos in self.cells.get((i, j), ()):
+                    if (found is None or idx < found) and \
+                            (position[0] - pos[0])**2 + (position[1] - pos[1])**2 <= radius**2:
+                        found = idx
+        return found
+
+
+def _ragged(counts):
+    """
+    Returns, for a ragged expansion of groups of the given sizes, the group of each item and the
+    item's position within its group.
+    """
+    group = np.repeat(np.arange(len(counts)), counts)
+    return group, np.arange(len(group)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+
+class GridIndex():
+    """
+    Static uniform-grid index of vertex positions, answering batches of spatial queries.
+
+    Parameters
+    ----------
+    positions : Nx2 array
+        The position of each vertex, by vertex index, with NaN for vertices without a position.
+
+    Notes
+    -----
+    Vertices are sorted by the grid cell containing them, column by column, so the vertices of
+    each cell, and of each run of cells within a column, are one contiguous slice of an index
+    array. The cell size is chosen for about one vertex per cell, and the grid has O(N) cells
+    however the vertices are spread. A query only visits the column slices overlapping its
+    search area, so range queries are O(1) per vertex found, and nearest vertex queries O(1)
+    for points among the vertices. Every query is answered for a whole array of points at once,
+    without a Python loop per point.
+    """
+    # Most candidate vertices examined at once
+    _CHUNK = 1 << 20
+    # Most candidates measured for a nearest vertex query before its search disc is narrowed
+    _FEW = 32
+
+    def __init__(self, positions):
+        """
+        Builds the grid index of the given positions.
+        """
+        self.positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        valid = np.flatnonzero(~np.isnan(self.positions).any(axis=1))
+        points = self.positions[valid]
+        self.lower = points.min(axis=0) if len(points) else np.zeros(2)
+        extent = points.max(axis=0) - self.lower if len(points) else np.zeros(2)
+        n = max(len(points), 1)
+        self.cell_size = max(sqrt(extent[0]*extent[1]/n), extent.max()/n) or 1.0
+        self.shape = (extent // self.cell_size).astype(np.int64) + 1
+        cell = np.clip(self._cell(points), 0, self.shape - 1)
+        cell = cell[:, 0]*self.shape[1] + cell[:, 1]
+        order = np.argsort(cell, kind="stable")
+        self.order = valid[order]
+        self.starts = np.searchsorted(cell[order], np.arange(self.shape[0]*self.shape[1] + 1))
+
+    def _cell(self, points):
+        """
+        Returns the (column, row) of the grid cell containing each point, unclamped.
+        """
+        return np.floor((points - self.lower) / self.cell_size).astype(np.int64)
+
+    def _spans(self, lower, upper, centres = None, radii = None):
+        """
+        Returns, for each column of grid cells overlapping each of the M boxes 'lower' to
+        'upper', the query and the slice, 'begin' to 'end', of 'order' holding the column's
+        vertices in cells overlapping the box. Given 'centres' and 'radii', only the cells
+        overlapping the discs inside the boxes are kept.
+        """
+        width, height = self.shape
+        first = np.maximum(np.floor((lower[:, 0] - self.lower[0]) / self.cell_size), 0)
+        last = np.minimum(np.floor((upper[:, 0] - self.lower[0]) / self.cell_size), width - 1)
+        count = np.maximum(last - first + 1, 0).astype(np.int64)
+        query, k = _ragged(count)
+        column = first.astype(np.int64)[query] + k
+        if radii is None:
+            bottom, top = lower[query, 1], upper[query, 1]
+        else:
+            left = self.lower[0] + column*self.cell_size
+            dx = np.maximum(np.maximum(left - centres[query, 0], centres[query, 0] - left - self.cell_size), 0)
+            half = np.sqrt(np.maximum(radii[query]**2 - dx**2, 0))
+            bottom, top = centres[query, 1] - half, centres[query, 1] + half
+        bottom = np.maximum(np.floor((bottom - self.lower[1]) / self.cell_size), 0).astype(np.int64)
+        top = np.minimum(np.floor((top - self.lower[1]) / self.cell_size), height - 1).astype(np.int64)
+        begin = self.starts[column*height + np.minimum(bottom, height - 1)]
+        end = np.where(top >= bottom, self.starts[column*height + np.maximum(top, -1) + 1], begin)
+        return query, begin, end
+
+    def _candidates(self, spans):
+        """
+        Yields (query, vertex) pairs of the vertices in the given spans, a chunk at a time.
+        """
+        query, begin, end = spans
+        total = np.cumsum(end - begin)
+        split = np.searchsorted(total, np.arange(self._CHUNK, total[-1] if len(total) else 0, self._CHUNK))
+        for part in np.split(np.arange(len(query)), split):
+            entry, k = _ragged(end[part] - begin[part])
+            yield query[part][entry], self.order[begin[part][entry] + k]
+
+    def in_boxes(self, lower, upper):
+        """
+        Returns the vertices inside each of the M boxes 'lower' to 'upper', as offsets and indices
+        arrays in compressed sparse row form.
+        """
+        found = []
+        for query, vertex in self._candidates(self._spans(lower, upper)):
+            position = self.positions[vertex]
+            inside = ((position >= lower[query]) & (position <= upper[query])).all(axis=1)
+            found.append((query[inside], vertex[inside]))
+        return self._rows(found, len(lower))
+
+    def within(self, points, radius):
+        """
+        Returns the vertices within 'radius' of each of the M points, as offsets and indices arrays
+        in compressed sparse row form.
+        """
+        radius = np.broadcast_to(np.asarray(radius, dtype=np.float64), (len(points),))
+        spans = self._spans(points - radius[:, None], points + radius[:, None], points, radius)
+        found = []
+        for query, vertex in self._candidates(spans):
+            inside = np.hypot(*(self.positions[vertex] - points[query]).T) <= radius[query]
+            found.append((query[inside], vertex[inside]))
+        return self._rows(found, len(points))
+
+    @staticmethod
+    def _rows(found, M):
+        """
+        Returns (query, vertex) pairs as offsets and indices arrays, each row in index order.
+        """
+        query = np.concatenate([pairs[0] for pairs in found] + [np.empty(0, dtype=np.int64)])
+        vertex = np.concatenate([pairs[1] for pairs in found] + [np.empty(0, dtype=np.int64)])
+        order = np.lexsort((vertex, query))
+        offsets = np.zeros(M + 1, dtype=np.int64)
+        np.cumsum(np.bincount(query, minlength=M), out=offsets[1:])
+        return offsets, vertex[order]
+
+    def nearest(self, points):
+        """
+        Returns the index of, and distance to, the nearest vertex to each of the M points, with
+        index -1 and distance inf if there are no vertices.
+
+        Notes
+        -----
+        Each point's search disc starts one cell wider than its distance to the grid and
+        doubles until it overlaps a vertex's cell. Counting the vertices in the cells a disc
+        overlaps is cheap, so the disc is then narrowed by bisection, between the largest disc
+        known to be empty and the smallest known not to be, until it holds few vertices. Those
+        are measured, and the point is done once its nearest is inside the disc, when no vertex
+        outside it can be nearer; otherwise the next disc reaches the nearest found, at most a
+        cell's diagonal further. Points far from the vertices so cost little more than those
+        among them.
+        """
+        M = len(points)
+        index = np.full(M, -1, dtype=np.int64)
+        distance = np.full(M, np.inf)
+        pending = np.arange(M) if len(self.order) else np.empty(0, dtype=np.int64)
+        # Radii known to hold no vertex, and known to reach a vertex or its cell
+        empty = np.hypot(*np.maximum(np.abs(points - self.lower - self.shape*self.cell_size/2)
+                                     - self.shape*self.cell_size/2, 0).T)
+        full = np.full(M, np.inf)
+        reach = empty + self.cell_size
+        while len(pending):
+            centres, radii = points[pending], reach[pending]
+            query, begin, end = self._spans(centres - radii[:, None], centres + radii[:, None], centres, radii)
+            count = np.bincount(query, weights=end - begin, minlength=len(pending))
+            measure = (count > 0) & ((count <= self._FEW) | (radii - empty[pending] <= 2*self.cell_size))
+            keep = measure[query]
+            for query, vertex in self._candidates((query[keep], begin[keep], end[keep])):
+                d = np.hypot(*(self.positions[vertex] - centres[query]).T)
+                # Candidates come grouped by query; take each group's nearest, then lowest index
+                new = np.diff(query, prepend=-1) != 0
+                first, group = np.flatnonzero(new), np.cumsum(new) - 1
+                nearest = np.minimum.reduceat(d, first)
+                vertex = np.minimum.reduceat(np.where(d == nearest[group], vertex, len(self.positions)), first)
+                d, best = nearest, pending[query[first]]
+                closer = (d < distance[best]) | ((d == distance[best]) & (vertex < index[best]))
+                index[best[closer]] = vertex[closer]
+                distance[best[closer]] = d[closer]
+            done = distance[pending] <= radii
+            empty[pending] = np.where((count == 0) | measure, radii, empty[pending])
+            full[pending] = np.where(measure, distance[pending], np.where(count > 0, radii, full[pending]))
+            pending = pending[~done]
+            low, high = empty[pending], full[pending]
+            reach[pending] = np.where(np.isinf(high), 2*reach[pending],
+                                      np.where(high - low <= 2*self.cell_size, high, (low + high)/2))
+        return index, distance
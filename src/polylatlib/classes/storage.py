@@ -0,0 +1,702 @@
+"""
+**********
+Shape Storage
+**********
+Vertex and edge storage engines for PolyLatLib.
+
+This file contains the storage engines that sit behind the Shape class, holding the vertices and
+edges of a shape along with their property information, as well as the read-only views that
+present this storage as the familiar 'vertices', 'vertices_info', 'edges', and 'edges_info' lists.
+
+Two storage backends are available:
+
+- "dict" (DictStore), the default, keeps a property dictionary per vertex and per edge.
+- "array" (ArrayStore) keeps the properties as NumPy columns; an Nx2 float64 position array,
+  int32 size and uint8 colour-code arrays, and an Ex2 int32 endpoint array with float64 weight
+  and uint8 colour columns.
+
+Measured with tracemalloc on a 150 layer circular hexagon lattice from
+'generate_lattice_circular' (135,000 vertices, 1.5 edges per vertex, vertex names such as
+"123-4"), the whole Lattice takes roughly 1,130 bytes per vertex with the "dict" backend. With
+the "array" backend it takes roughly 80 bytes per vertex as generated, as its names are held
+as GeneratedNames and it has no name or edge index yet. The first lookup of a vertex or edge
+by name builds those indexes, after which it takes roughly 370 bytes per vertex.
+
+"""
+
+from collections.abc import Sequence
+import sys
+import numpy as np
+from polylatlib.exception import PolyLatNotColour
+
+__all__ = [
+    "COLOURS",
+    "STORES",
+    "colour_codes",
+    "grow_array",
+    "DictStore",
+    "ArrayStore",
+    "GeneratedNames",
+    "VertexView",
+    "VertexInfoView",
+    "EdgeView",
+    "EdgeInfoView"
+]
+
+# Supported colours, in the order used for colour codes by the array backend.
+COLOURS = ["k", "r", "g", "b", "c", "m", "y"]
+_COLOUR_CODES = {colour: code for code, colour in enumerate(COLOURS)}
+
+
+def colour_codes(colours, n):
+    """
+    Returns a uint8 array of n colour codes from a single colour or a sequence of n colours,
+    raising PolyLatNotColour for the first unsupported colour.
+    """
+    if isinstance(colours, str):
+        if colours not in _COLOUR_CODES:
+            raise PolyLatNotColour(colours)
+        return np.full(n, _COLOUR_CODES[colours], dtype=np.uint8)
+    colours = np.asarray(colours)
+    codes = np.full(colours.shape, len(COLOURS), dtype=np.uint8)
+    for code, colour in enumerate(COLOURS):
+        codes[colours == colour] = code
+    invalid = np.flatnonzero(codes == len(COLOURS))
+    if len(invalid):
+        raise PolyLatNotColour(colours[invalid[0]])
+    return np.broadcast_to(codes, (n,))
+
+
+def grow_array(array, needed):
+    """
+    Returns the array, or a copy with at least double its length, with room for 'needed' rows.
+    Growing by doubling keeps repeated appends amortised O(1) per row.
+    """
+    if needed <= len(array):
+        return array
+    capacity = max(needed, 2*len(array))
+    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class DictStore():
+    """
+    Hash-indexed storage engine for the vertices and edges of a shape.
+
+    Notes
+    -----
+    Vertices and edges are held in insertion order and are each given an integer index. A
+    dictionary from vertex name (and from edge vertex pair) to that index makes membership,
+    lookup, and update O(1) operations, rather than the O(n) list scans they would otherwise
+    require. Edges are stored by the integer indices of their end vertices.
+    """
+    def __init__(self):
+        """
+        Initialises an empty store.
+        """
+        self.names = []
+        self.index = {}
+        self.info = []
+        self.edge_pairs = []
+        self.edge_index = {}
+        self.edge_ends = []
+        self.edge_info = []
+
+    ## VERTICES ##
+    def num_vertices(self):
+        return len(self.names)
+
+    def has_vertex(self, vertex):
+        try:
+            return vertex in self.index
+        except TypeError:
+            return False
+
+    def vertex_id(self, vertex):
+        return self.index[vertex]
+
+    def vertex_ids(self, vertices):
+        return list(map(self.index.get, vertices))
+
+    def vertex_name(self, idx):
+        return self.names[idx]
+
+    def add_vertex(self, vertex, position, size, colour):
+        idx = len(self.names)
+        self.index[vertex] = idx
+        self.names.append(vertex)
+        self.info.append({
+            "position": position,
+            "size": size,
+            "colour": colour
+        })
+        return idx
+
+    def extend_vertices(self, names, positions, sizes, codes):
+        names = list(names)
+        start = len(self.names)
+        self.index.update(zip(names, range(start, start + len(names))))
+        self.names.extend(names)
+        positions = [None if x != x else (x, y) for x, y in positions.tolist()]
+        colours = [COLOURS[code] for code in codes.tolist()]
+        self.info.extend(
+            {"position": position, "size": size, "colour": colour}
+            for position, size, colour in zip(positions, sizes.tolist(), colours)
+        )
+
+    def get_vertex(self, idx, prop):
+        return self.info[idx][prop]
+
+    def set_vertex(self, idx, prop, value):
+        self.info[idx][prop] = value
+
+    def vertex_record(self, idx):
+        return (self.names[idx], dict(self.info[idx]))
+
+    def vertex_values(self, prop):
+        return [info[prop] for info in self.info]
+
+    def vertex_property(self, prop):
+        return dict(zip(self.names, self.vertex_values(prop)))
+
+    ## EDGES ##
+    def num_edges(self):
+        return len(self.edge_pairs)
+
+    def edge_id(self, vertex_one, vertex_two):
+        try:
+            idx = self.edge_index.get((vertex_one, vertex_two))
+            if idx is None:
+                idx = self.edge_index.get((vertex_two, vertex_one))
+            return idx
+        except TypeError:
+            return None
+
+    def edge_name(self, idx):
+        return self.edge_pairs[idx]
+
+    def add_edge(self, idx_one, idx_two, weight, colour):
+        idx = len(self.edge_pairs)
+        pair = (self.names[idx_one], self.names[idx_two])
+        self.edge_index[pair] = idx
+        self.edge_pairs.append(pair)
+        self.edge_ends.append((idx_one, idx_two))
+        self.edge_info.append({
+            "weight": weight,
+            "colour": colour
+        })
+        return idx
+
+    def extend_edges(self, ends, weights, codes):
+        start = len(self.edge_pairs)
+        ends = [tuple(pair) for pair in ends.tolist()]
+        pairs = [(self.names[one], self.names[two]) for one, two in ends]
+        self.edge_index.update(zip(pairs, range(start, start + len(pairs))))
+        self.edge_pairs.extend(pairs)
+        self.edge_ends.extend(ends)
+        colours = [COLOURS[code] for code in codes.tolist()]
+        self.edge_info.extend(
+            {"weight": weight, "colour": colour}
+            for weight, colour in zip(weights.tolist(), colours)
+        )
+
+    def get_edge(self, idx, prop):
+        return self.edge_info[idx][prop]
+
+    def set_edge(self, idx, prop, value):
+        self.edge_info[idx][prop] = value
+
+    def edge_record(self, idx):
+        return self.edge_pairs[idx] + (dict(self.edge_info[idx]),)
+
+    def edge_values(self, prop):
+        return [info[prop] for info in self.edge_info]
+
+    def edge_property(self, prop):
+        return dict(zip(self.edge_pairs, self.edge_values(prop)))
+
+    def edge_names(self):
+        return list(self.edge_pairs)
+
+    ## ARRAYS ##
+    def positions(self):
+        nan = (np.nan, np.nan)
+        positions = [nan if info["position"] is None else info["position"] for info in self.info]
+        return np.array(positions, dtype=np.float64).reshape(-1, 2)
+
+    def endpoints(self):
+        return np.array(self.edge_ends, dtype=np.int32).reshape(-1, 2)
+
+    def weights(self):
+        return np.array([info["weight"] for info in self.edge_info], dtype=np.float64)
+
+    def transform_positions(self, matrix, offset):
+        positions = self.positions() @ matrix.T + offset
+        for info, (x, y) in zip(self.info, positions.tolist()):
+            if info["position"] is not None:
+                info["position"] = (x, y)
+
+    ## MEMORY ##
+    def copy(self):
+        store = DictStore()
+        store.names = list(self.names)
+        store.index = dict(self.index)
+        store.info = [dict(info) for info in self.info]
+        store.edge_pairs = list(self.edge_pairs)
+        store.edge_index = dict(self.edge_index)
+        store.edge_ends = list(self.edge_ends)
+        store.edge_info = [dict(info) for info in self.edge_info]
+        return store
+
+    def nbytes(self):
+        # Estimated from the containers and the first vertex and edge
+        total = sum(map(sys.getsizeof, (self.names, self.index, self.info, self.edge_pairs,
+                                        self.edge_index, self.edge_ends, self.edge_info)))
+        if self.names:
+            info = self.info[0]
+            total += len(self.names) * (sys.getsizeof(self.names[0]) + sys.getsizeof(info)
+                                        + sys.getsizeof(info["position"]) + 2*sys.getsizeof(0.0))
+        if self.edge_pairs:
+            total += len(self.edge_pairs) * (2*sys.getsizeof(self.edge_pairs[0])
+                                             + sys.getsizeof(self.edge_info[0]) + sys.getsizeof(0.0))
+        return total
+
+
+class ArrayStore():
+    """
+    Columnar (structure-of-arrays) storage engine for the vertices and edges of a shape.
+
+    Notes
+    -----
+    Vertex positions are held in an Nx2 float64 array, with NaN marking a vertex with no position.
+    Vertex sizes and colour codes are held in int32 and uint8 arrays, edge end vertices in an Ex2
+    int32 array, and edge weights and colour codes in float64 and uint8 arrays. Colour codes are
+    indices into COLOURS. Arrays grow by doubling, so appending is amortised O(1).
+
+    Only vertex names are held as Python objects. The indexes of vertices by name and of edges
+    by vertex pair are built on the first lookup and maintained from then on, so shapes that are
+    only ever appended to in bulk never pay for them. Lattices generated by the tiling engine go
+    further and hold their names as GeneratedNames, creating each name string only when it is
+    read.
+
+    Values read back from this store are plain Python floats and ints, so a position added as
+    (1, 1) is returned as (1.0, 1.0) and weights are returned as floats.
+    """
+    def __init__(self):
+        """
+        Initialises an empty store.
+        """
+        self.names = []
+        self._index = {}
+        self.pos = np.empty((16, 2), dtype=np.float64)
+        self.size = np.empty(16, dtype=np.int32)
+        self.colour = np.empty(16, dtype=np.uint8)
+        self.n = 0
+        self.ends = np.empty((16, 2), dtype=np.int32)
+        self.weight = np.empty(16, dtype=np.float64)
+        self.edge_colour = np.empty(16, dtype=np.uint8)
+        self.m = 0
+        self._edge_index = None
+
+    _grow = staticmethod(grow_array)
+
+    @staticmethod
+    def _colour_code(colour):
+        try:
+            return _COLOUR_CODES[colour]
+        except (KeyError, TypeError):
+            raise PolyLatNotColour(colour)
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = dict(zip(self.names, range(self.n)))
+        return self._index
+
+    def _materialise_names(self):
+        if isinstance(self.names, GeneratedNames):
+            self.names = list(self.names)
+
+    ## VERTICES ##
+    def num_vertices(self):
+        return self.n
+
+    def has_vertex(self, vertex):
+        try:
+            return vertex in self.index
+        except TypeError:
+            return False
+
+    def vertex_id(self, vertex):
+        return self.index[vertex]
+
+    def vertex_ids(self, vertices):
+        return list(map(self.index.get, vertices))
+
+    def vertex_name(self, idx):
+        return self.names[idx]
+
+    def add_vertex(self, vertex, position, size, colour):
+        idx = self.n
+        code = self._colour_code(colour)
+        self.index[vertex] = idx
+        self._materialise_names()
+        self.names.append(vertex)
+        self.pos = self._grow(self.pos, idx + 1)
+        self.size = self._grow(self.size, idx + 1)
+        self.colour = self._grow(self.colour, idx + 1)
+        self.pos[idx] = (np.nan, np.nan) if position is None else position
+        self.size[idx] = size
+        self.colour[idx] = code
+        self.n += 1
+        return idx
+
+    def extend_vertices(self, names, positions, sizes, codes):
+        start, stop = self.n, self.n + len(names)
+        if start == 0 and isinstance(names, GeneratedNames):
+            self.names = names
+            self._index = None
+        elif isinstance(self.names, GeneratedNames) and isinstance(names, GeneratedNames) \
+                and self.names.labels == names.labels:
+            if self._index is not None:
+                self._index.update(zip(names, range(start, stop)))
+            self.names.extend(names)
+        else:
+            names = list(names)
+            if self._index is not None:
+                self._index.update(zip(names, range(start, stop)))
+            self._materialise_names()
+            self.names.extend(names)
+        self.pos = self._grow(self.pos, stop)
+        self.size = self._grow(self.size, stop)
+        self.colour = self._grow(self.colour, stop)
+        self.pos[start:stop] = positions
+        self.size[start:stop] = sizes
+        self.colour[start:stop] = codes
+        self.n = stop
+
+    def get_vertex(self, idx, prop):
+        if prop == "position":
+            x, y = self.pos[idx].tolist()
+            return None if x != x else (x, y)
+        elif prop == "size":
+            return int(self.size[idx])
+        return COLOURS[self.colour[idx]]
+
+    def set_vertex(self, idx, prop, value):
+        if prop == "position":
+            self.pos[idx] = value
+        elif prop == "size":
+            self.size[idx] = value
+        else:
+            self.colour[idx] = self._colour_code(value)
+
+    def vertex_record(self, idx):
+        info = {prop: self.get_vertex(idx, prop) for prop in ("position", "size", "colour")}
+        return (self.names[idx], info)
+
+    def vertex_values(self, prop):
+        if prop == "position":
+            return [None if x != x else (x, y) for x, y in self.pos[:self.n].tolist()]
+        elif prop == "size":
+            return self.size[:self.n].tolist()
+        return [COLOURS[code] for code in self.colour[:self.n].tolist()]
+
+    def vertex_property(self, prop):
+        return dict(zip(self.names, self.vertex_values(prop)))
+
+    ## EDGES ##
+    def num_edges(self):
+        return self.m
+
+    def _edge_key(self, idx_one, idx_two):
+        return (idx_one << 32) | idx_two
+
+    def _build_edge_index(self):
+        self._edge_index = {}
+        for idx, (one, two) in enumerate(self.ends[:self.m].tolist()):
+            self._edge_index[self._edge_key(one, two)] = idx
+
+    def edge_id(self, vertex_one, vertex_two):
+        if not (self.has_vertex(vertex_one) and self.has_vertex(vertex_two)):
+            return None
+        if self._edge_index is None:
+            self._build_edge_index()
+        one, two = self.index[vertex_one], self.index[vertex_two]
+        idx = self._edge_index.get(self._edge_key(one, two))
+        if idx is None:
+            idx = self._edge_index.get(self._edge_key(two, one))
+        return idx
+
+    def edge_name(self, idx):
+        one, two = self.ends[idx].tolist()
+        return (self.names[one], self.names[two])
+
+    def add_edge(self, idx_one, idx_two, weight, colour):
+        idx = self.m
+        code = self._colour_code(colour)
+        self.ends = self._grow(self.ends, idx + 1)
+        self.weight = self._grow(self.weight, idx + 1)
+        self.edge_colour = self._grow(self.edge_colour, idx + 1)
+        self.ends[idx] = (idx_one, idx_two)
+        self.weight[idx] = weight
+        self.edge_colour[idx] = code
+        self.m += 1
+        if self._edge_index is not None:
+            self._edge_index[self._edge_key(idx_one, idx_two)] = idx
+        return idx
+
+    def extend_edges(self, ends, weights, codes):
+        start, stop = self.m, self.m + len(ends)
+        self.ends = self._grow(self.ends, stop)
+        self.weight = self._grow(self.weight, stop)
+        self.edge_colour = self._grow(self.edge_colour, stop)
+        self.ends[start:stop] = ends
+        self.weight[start:stop] = weights
+        self.edge_colour[start:stop] = codes
+        self.m = stop
+        if self._edge_index is not None:
+            keys = (ends[:, 0].astype(np.int64) << 32) | ends[:, 1]
+            self._edge_index.update(zip(keys.tolist(), range(start, stop)))
+
+    def get_edge(self, idx, prop):
+        if prop == "weight":
+            return float(self.weight[idx])
+        return COLOURS[self.edge_colour[idx]]
+
+    def set_edge(self, idx, prop, value):
+        if prop == "weight":
+            self.weight[idx] = value
+        else:
+            self.edge_colour[idx] = self._colour_code(value)
+
+    def edge_record(self, idx):
+        return self.edge_name(idx) + ({"weight": self.get_edge(idx, "weight"),
+                                       "colour": self.get_edge(idx, "colour")},)
+
+    def edge_values(self, prop):
+        if prop == "weight":
+            return self.weight[:self.m].tolist()
+        return [COLOURS[code] for code in self.edge_colour[:self.m].tolist()]
+
+    def edge_property(self, prop):
+        return dict(zip(self.edge_names(), self.edge_values(prop)))
+
+    def edge_names(self):
+        # Generated names are created in batches, rather than one per edge end
+        names = list(self.names) if isinstance(self.names, GeneratedNames) else self.names
+        return [(names[one], names[two]) for one, two in self.ends[:self.m].tolist()]
+
+    ## ARRAYS ##
+    def positions(self):
+        return self.pos[:self.n]
+
+    def endpoints(self):
+        return self.ends[:self.m]
+
+    def weights(self):
+        return self.weight[:self.m]
+
+    def transform_positions(self, matrix, offset):
+        self.pos[:self.n] = self.pos[:self.n] @ matrix.T + offset
+
+    ## MEMORY ##
+    def copy(self):
+        store = ArrayStore()
+        if isinstance(self.names, GeneratedNames):
+            store.names = GeneratedNames(self.names.labels, self.names.ranks[:self.n].copy(),
+                                         self.names.corners[:self.n].copy())
+        else:
+            store.names = list(self.names)
+        store._index = None if self._index is None else dict(self._index)
+        for column in ("pos", "size", "colour"):
+            setattr(store, column, getattr(self, column)[:max(self.n, 1)].copy())
+        for column in ("ends", "weight", "edge_colour"):
+            setattr(store, column, getattr(self, column)[:max(self.m, 1)].copy())
+        store.n, store.m = self.n, self.m
+        store._edge_index = None if self._edge_index is None else dict(self._edge_index)
+        return store
+
+    def nbytes(self):
+        # Names and indexes are estimated from their first entries
+        total = sum(getattr(self, column).nbytes for column in
+                    ("pos", "size", "colour", "ends", "weight", "edge_colour"))
+        if isinstance(self.names, GeneratedNames):
+            total += self.names.ranks.nbytes + self.names.corners.nbytes
+        else:
+            total += sys.getsizeof(self.names)
+            if self.names:
+                total += len(self.names) * sys.getsizeof(self.names[0])
+        for index in (self._index, self._edge_index):
+            if index:
+                total += sys.getsizeof(index) + len(index) * sys.getsizeof(2**40)
+        return total
+
+
+class GeneratedNames(Sequence):
+    """
+    Read-only sequence of vertex names, 'label-k', generated on demand.
+
+    Parameters
+    ----------
+    labels : function
+        Function returning the list of shape labels for a list of shape ranks.
+    ranks : int array
+        The rank of the shape naming each vertex.
+    corners : int array
+        The corner, k, of that shape at each vertex.
+
+    Notes
+    -----
+    Holding the integer ranks and corners instead of name strings keeps large generated
+    lattices compact, and means names that are never read are never created.
+    """
+    def __init__(self, labels, ranks, corners):
+        self.labels = labels
+        self.ranks = np.asarray(ranks)
+        self.corners = np.asarray(corners)
+        self._n = len(self.ranks)
+
+    def __len__(self):
+        return self._n
+
+    def extend(self, names):
+        """
+        Appends another GeneratedNames with the same labels, in amortised time proportional to
+        the number of names appended.
+        """
+        if names.labels != self.labels:
+            raise ValueError("GeneratedNames can only be extended by names with the same labels")
+        stop = self._n + len(names)
+        self.ranks = grow_array(self.ranks, stop)
+        self.corners = grow_array(self.corners, stop)
+        self.ranks[self._n:stop] = names.ranks[:len(names)]
+        self.corners[self._n:stop] = names.corners[:len(names)]
+        self._n = stop
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._names(range(len(self))[i])
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("GeneratedNames index out of range")
+        return f"{self.labels([int(self.ranks[i])])[0]}-{self.corners[i]}"
+
+    def __iter__(self):
+        for start in range(0, len(self), 65536):
+            yield from self._names(range(start, min(start + 65536, len(self))))
+
+    def _names(self, indices):
+        indices = np.asarray(indices, dtype=np.int64)
+        labels = self.labels(self.ranks[indices].tolist())
+        return [f"{label}-{k}" for label, k in zip(labels, self.corners[indices].tolist())]
+
+
+# Storage backends by name.
+STORES = {
+    "dict": DictStore,
+    "array": ArrayStore
+}
+
+
+############################################################################################
+
+class _StoreView(Sequence):
+    """
+    Base class for the read-only list views onto a shape's store.
+    """
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._item(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._item(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, _StoreView)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class VertexView(_StoreView):
+    """
+    Read-only list of all vertex names, with O(1) membership and index lookup.
+    """
+    def __len__(self):
+        return self._store.num_vertices()
+
+    def _item(self, i):
+        return self._store.vertex_name(i)
+
+    def __contains__(self, vertex):
+        return self._store.has_vertex(vertex)
+
+    def index(self, vertex):
+        if not self._store.has_vertex(vertex):
+            raise ValueError(f"'{vertex}' is not in vertices")
+        return self._store.vertex_id(vertex)
+
+
+class VertexInfoView(_StoreView):
+    """
+    Read-only list of (vertex, property dictionary) tuples.
+    """
+    def __len__(self):
+        return self._store.num_vertices()
+
+    def _item(self, i):
+        return self._store.vertex_record(i)
+
+
+class EdgeView(_StoreView):
+    """
+    Read-only list of all edges as vertex pairs, with O(1) membership and index lookup.
+
+    Notes
+    -----
+    As with a list of edges, membership and index respect the stored direction of the edge. Use
+    'edge in shape' to check for an edge in either direction.
+    """
+    def __len__(self):
+        return self._store.num_edges()
+
+    def _item(self, i):
+        return self._store.edge_name(i)
+
+    def __contains__(self, edge):
+        return self._find(edge) is not None
+
+    def index(self, edge):
+        idx = self._find(edge)
+        if idx is None:
+            raise ValueError(f"'{edge}' is not in edges")
+        return idx
+
+    def _find(self, edge):
+        if type(edge) != tuple or len(edge) != 2:
+            return None
+        idx = self._store.edge_id(edge[0], edge[1])
+        if idx is not None and self._store.edge_name(idx) == edge:
+            return idx
+        return None
+
+
+class EdgeInfoView(_StoreView):
+    """
+    Read-only list of (vertex_one, vertex_two, property dictionary) tuples.
+    """
+    def __len__(self):
+        return self._store.num_edges()
+
+    def _item(self, i):
+        return self._store.edge_record(i)
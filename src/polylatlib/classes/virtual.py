@@ -0,0 +1,200 @@
+"""
+**********
+Virtual Lattice Class
+**********
+Virtual Lattice class for PolyLatLib.
+
+This file contains the virtual lattice, an unbounded lattice whose vertices and edges are computed
+on demand from the generating polygon's tiling rather than stored.
+
+"""
+
+import numpy as np
+from polylatlib.exception import PolyLatError
+from polylatlib.tiling import Block
+
+__all__ = [
+    "VirtualLattice"
+]
+
+
+class VirtualLattice():
+    """
+    Unbounded lattice of a polygon, computed on demand.
+
+    Parameters
+    ----------
+    polygon : Polygon
+        The generating polygon. A lattice must be possible for the polygon.
+
+    Attributes
+    ----------
+    polygon : Polygon
+        The generating polygon.
+    tiling : Tiling
+        The periodic tiling of the generating polygon, holding the translation vectors.
+
+    Example
+    -------
+    >>> lattice = VirtualLattice(Hexagon())
+    >>> vertex = (0, 10**6, -10**6)
+    >>> lattice.position(vertex)
+    >>> lattice.vertex_neighbours(vertex)
+    >>> window = lattice.window(range(-5, 5), range(-5, 5))
+
+    Notes
+    -----
+    Vertices are identified by integer triples (site, i, j); the tiling site translated by
+    i*t1 + j*t2. Polygons are identified by integer triples (i, j, s); the tiling's basis polygon
+    s translated by i*t1 + j*t2. Positions, neighbours and edges are pure functions of these
+    indices, so only the polygon and its tiling are stored and memory use does not depend on
+    how far across the lattice is accessed. A finite window of the lattice can be turned into
+    a concrete Lattice with 'window'. Site and basis polygon indices outside the tiling raise
+    PolyLatError.
+    """
+    def __init__(self, polygon):
+        """
+        Initialises a virtual lattice from the generating polygon's tiling.
+        """
+        if not polygon.get_lattice_state():
+            raise PolyLatError("Lattice not possible with this shape.")
+        self.polygon = polygon
+        self.tiling = polygon.get_tiling()
+
+    def _check_sites(self, sites):
+        """
+        Raises PolyLatError unless every site index is that of a site of the tiling. Negative
+        indices are rejected rather than counted from the end.
+        """
+        sites = np.asarray(sites)
+        if sites.size and (sites.min() < 0 or sites.max() >= len(self.tiling.sites)):
+            raise PolyLatError(f"Site indices must be from 0 to {len(self.tiling.sites) - 1}.")
+
+    def _check_basis(self, s):
+        """
+        Raises PolyLatError unless 's' is the index of a basis polygon of the tiling.
+        """
+        if not 0 <= s < self.tiling.num_polygons:
+            raise PolyLatError(f"Basis polygon indices must be from 0 to {self.tiling.num_polygons - 1}.")
+
+    def position(self, vertex):
+        """
+        Returns the position of a vertex.
+
+        Parameters
+        ----------
+        vertex : (site, i, j)
+            The vertex.
+
+        Returns
+        -------
+        position : (x, y) - 2D Cartesian Coordinate
+        """
+        position = self.positions([vertex])[0]
+        return (float(position[0]), float(position[1]))
+
+    def positions(self, vertices):
+        """
+        Returns the Nx2 array of positions of a list, or Nx3 array, of vertices.
+        """
+        vertices = np.asarray(vertices, dtype=np.int64).reshape(-1, 3)
+        self._check_sites(vertices[:, 0])
+        return self.tiling.positions(vertices[:, 0], vertices[:, 1], vertices[:, 2])
+
+    def polygon_vertices(self, polygon):
+        """
+        Returns the vertices of a polygon of the lattice, in order around the polygon.
+
+        Parameters
+        ----------
+        polygon : (i, j, s)
+            The polygon.
+
+        Returns
+        -------
+        vertices : list
+            List of the polygon's (site, i, j) vertices.
+        """
+        i, j, s = polygon
+        self._check_basis(s)
+        return [
+            (int(self.tiling.corner_site[s, k]),
+             i + int(self.tiling.corner_shift[s, k, 0]),
+             j + int(self.tiling.corner_shift[s, k, 1]))
+            for k in range(self.tiling.num_corners)
+        ]
+
+    def polygon_edges(self, polygon):
+        """
+        Returns the edges of a polygon of the lattice as 2-tuples of vertices.
+        """
+        vertices = self.polygon_vertices(polygon)
+        return [(vertices[k], vertices[(k + 1) % len(vertices)]) for k in range(len(vertices))]
+
+    def vertex_polygons(self, vertex):
+        """
+        Returns the polygons of the lattice containing a vertex, as (i, j, s) triples.
+        """
+        site, i, j = vertex
+        self._check_sites(site)
+        return [(i - int(shift[0]), j - int(shift[1]), s) for s, _, shift in self.tiling._site_corners[site]]
+
+    def vertex_neighbours(self, vertex):
+        """
+        Returns the vertices joined to a vertex by an edge.
+
+        Parameters
+        ----------
+        vertex : (site, i, j)
+            The vertex.
+
+        Returns
+        -------
+        neighbours : list
+            List of the neighbouring (site, i, j) vertices.
+        """
+        site, i, j = vertex
+        self._check_sites(site)
+        K = self.tiling.num_corners
+        neighbours = {}
+        for s, k, shift in self.tiling._site_corners[site]:
+            vertices = self.polygon_vertices((i - int(shift[0]), j - int(shift[1]), s))
+            neighbours.setdefault(vertices[(k - 1) % K])
+            neighbours.setdefault(vertices[(k + 1) % K])
+        return list(neighbours)
+
+    def vertex_edges(self, vertex):
+        """
+        Returns the edges at a vertex as 2-tuples, each starting from the given vertex.
+        """
+        vertex = tuple(vertex)
+        return [(vertex, neighbour) for neighbour in self.vertex_neighbours(vertex)]
+
+    def window(self, i_range, j_range):
+        """
+        Materialises a window of the virtual lattice as a concrete Lattice.
+
+        Parameters
+        ----------
+        i_range : range
+            The multiples of the first translation vector in the window.
+        j_range : range
+            The multiples of the second translation vector in the window.
+
+        Returns
+        -------
+        lattice : Lattice
+            Lattice object of every polygon (i, j, s) with i in 'i_range' and j in 'j_range'.
+
+        Notes
+        -----
+        The window is generated by the tiling engine, exactly and in time linear in its size.
+        Polygons are named 'row.column', counting basis polygons along 'j_range' as rows and
+        'i_range' as columns from 0.
+        """
+        for index_range in (i_range, j_range):
+            if not isinstance(index_range, range) or index_range.step != 1 or not len(index_range):
+                raise PolyLatError("Index ranges must be non-empty ranges with a step of 1.")
+        S = self.tiling.num_polygons
+        cells = Block(S*len(j_range), len(i_range), polygons=S, start=(i_range.start, S*j_range.start))
+        return self.polygon._tile_lattice(cells, self.tiling)
@@ -0,0 +1,177 @@
+"""
+**********
+Regions
+**********
+Regions of the plane for PolyLatLib.
+
+This file contains the regions that lattices can be clipped to with
+'Polygon.generate_lattice_clipped'. Each region gives a convex outline containing it, used to
+bound the tiling cells considered, and a vectorised test of which polygons overlap it.
+
+"""
+
+import numpy as np
+from polylatlib.exception import PolyLatError, PolyLatNotCart
+from polylatlib.functions import check_if_coord
+
+__all__ = [
+    "CircleRegion",
+    "BoxRegion",
+    "ConvexRegion"
+]
+
+# Overlaps smaller than this are treated as touching, so that polygons sharing only an edge or
+# corner with a region's boundary are not kept.
+_EPS = 1e-9
+
+
+def _edge_normals(corners):
+    """
+    Returns the ...xKx2 outward normals, unnormalised, of the sides of polygons given by their
+    ...xKx2 corners in anti-clockwise order.
+    """
+    sides = np.roll(corners, -1, axis=-2) - corners
+    return np.stack([sides[..., 1], -sides[..., 0]], axis=-1)
+
+
+def _orient(corners):
+    """
+    Returns ...xKx2 polygon corners in anti-clockwise order, reversing any given clockwise.
+    """
+    x, y = corners[..., 0], corners[..., 1]
+    area = (x*np.roll(y, -1, axis=-1) - np.roll(x, -1, axis=-1)*y).sum(axis=-1)
+    return np.where((area < 0)[..., None, None], corners[..., ::-1, :], corners)
+
+
+class CircleRegion():
+    """
+    A disc of the plane.
+
+    Parameters
+    ----------
+    centre : (x, y) - 2D Cartesian Coordinate
+        The centre of the disc.
+    radius : float > 0
+        The radius of the disc.
+
+    Example
+    -------
+    >>> lattice = Hexagon().generate_lattice_clipped(CircleRegion((0, 0), 50))
+    """
+    def __init__(self, centre, radius):
+        """
+        Initialises the disc of the given centre and radius.
+        """
+        if not check_if_coord(centre):
+            raise PolyLatNotCart(centre)
+        elif not radius > 0:
+            raise PolyLatError(f"Argument 'radius' = {radius}. A circle's radius must be positive.")
+        self.centre = centre
+        self.radius = radius
+
+    def outline(self):
+        """
+        Returns the Nx2 corners of a convex polygon containing the region; the regular 32-gon
+        circumscribing the disc.
+        """
+        angles = np.linspace(0, 2*np.pi, 32, endpoint=False)
+        radius = self.radius / np.cos(np.pi / 32)
+        return np.asarray(self.centre, dtype=np.float64) + radius*np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+    def overlaps(self, corners):
+        """
+        Returns whether each of the CxKx2 convex polygons overlaps the region.
+        """
+        corners = _orient(np.asarray(corners, dtype=np.float64))
+        offsets = np.asarray(self.centre, dtype=np.float64) - corners
+        sides = np.roll(corners, -1, axis=1) - corners
+        # Closest point to the centre on each side
+        t = np.clip((offsets*sides).sum(axis=2) / (sides*sides).sum(axis=2), 0, 1)
+        distance = np.hypot(*np.moveaxis(offsets - t[..., None]*sides, 2, 0)).min(axis=1)
+        inside = (sides[..., 0]*offsets[..., 1] - sides[..., 1]*offsets[..., 0] >= 0).all(axis=1)
+        return inside | (distance < self.radius - _EPS)
+
+
+class ConvexRegion():
+    """
+    A convex polygonal region of the plane.
+
+    Parameters
+    ----------
+    corners : list
+        The corners of the region, as (x, y) - 2D Cartesian Coordinates in order around it.
+
+    Example
+    -------
+    >>> triangle = ConvexRegion([(0, 0), (40, 0), (0, 30)])
+    >>> lattice = Square().generate_lattice_clipped(triangle)
+
+    Notes
+    -----
+    Overlap is tested with the separating axis theorem; a polygon overlaps the region unless
+    their projections onto one of their side normals are disjoint.
+    """
+    def __init__(self, corners):
+        """
+        Initialises the region with the given corners.
+        """
+        for corner in corners:
+            if not check_if_coord(corner):
+                raise PolyLatNotCart(corner)
+        corners = _orient(np.asarray(corners, dtype=np.float64))
+        if len(corners) < 3:
+            raise PolyLatError("A convex region must have at least 3 corners.")
+        turns = (_edge_normals(corners) * (np.roll(corners, -2, axis=0) - np.roll(corners, -1, axis=0))).sum(axis=1)
+        if (turns > 0).any() or not (turns < 0).any():
+            raise PolyLatError("Region corners must form a convex polygon.")
+        self.corners = corners
+
+    def outline(self):
+        """
+        Returns the Nx2 corners of the region.
+        """
+        return self.corners
+
+    def overlaps(self, corners):
+        """
+        Returns whether each of the CxKx2 convex polygons overlaps the region.
+        """
+        corners = _orient(np.asarray(corners, dtype=np.float64))
+        separated = np.zeros(len(corners), dtype=bool)
+        # Axes normal to the region's sides, then to each polygon's sides
+        for axes in (np.broadcast_to(_edge_normals(self.corners), (len(corners),) + self.corners.shape),
+                     _edge_normals(corners)):
+            polygon = np.einsum("cka,cna->cnk", corners, axes)
+            region = np.einsum("ka,cna->cnk", self.corners, axes)
+            separated |= ((polygon.max(axis=2) <= region.min(axis=2) + _EPS)
+                          | (region.max(axis=2) <= polygon.min(axis=2) + _EPS)).any(axis=1)
+        return ~separated
+
+
+class BoxRegion(ConvexRegion):
+    """
+    An axis-aligned rectangular region of the plane.
+
+    Parameters
+    ----------
+    lower : (x, y) - 2D Cartesian Coordinate
+        The corner of the box with the least x and y.
+    upper : (x, y) - 2D Cartesian Coordinate
+        The corner of the box with the greatest x and y.
+
+    Example
+    -------
+    >>> lattice = Hexagon().generate_lattice_clipped(BoxRegion((-30, -20), (30, 20)))
+    """
+    def __init__(self, lower, upper):
+        """
+        Initialises the box between the given corners.
+        """
+        for corner in (lower, upper):
+            if not check_if_coord(corner):
+                raise PolyLatNotCart(corner)
+        if not (lower[0] < upper[0] and lower[1] < upper[1]):
+            raise PolyLatError("A box's lower corner must be below and left of its upper corner.")
+        self.lower = lower
+        self.upper = upper
+        super().__init__([lower, (upper[0], lower[1]), upper, (lower[0], upper[1])])
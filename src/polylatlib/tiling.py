@@ -0,0 +1,999 @@
+"""
+**********
+Tiling
+**********
+Periodic tiling engine for PolyLatLib.
+
+This file contains the engine that generates lattices directly as vertex and edge arrays. A lattice
+is described as a periodic tiling; one or more basis polygons repeated by integer combinations of
+two translation vectors. Every vertex is identified exactly by an integer triple (site, i, j),
+so no floating point proximity checks are needed to find shared vertices.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from itertools import repeat
+import numpy as np
+from polylatlib.exception import PolyLatError, PolyLatNotPosInt
+from polylatlib.functions import is_positive_int
+from polylatlib.classes.storage import GeneratedNames
+
+__all__ = [
+    "Tiling",
+    "HexRings",
+    "SquareRings",
+    "TriangleRings",
+    "Block",
+    "Clipped",
+    "tile",
+    "stream"
+]
+
+
+def _rank_labels(ranks):
+    """
+    Returns the shape name, the rank itself, of each cell rank.
+    """
+    return [str(rank) for rank in ranks]
+
+
+class Tiling():
+    """
+    A periodic tiling of the plane by basis polygons.
+
+    Parameters
+    ----------
+    origin : (x, y) - 2D Cartesian Coordinate
+        Position of the tiling's cell (0, 0).
+    translations : 2x2 sequence
+        The two translation vectors, t1 and t2, that repeat the basis polygons. Cell (i, j) is
+        the basis polygons translated by i*t1 + j*t2.
+    polygons : SxKx2 sequence
+        The corners of each of the S basis polygons as offsets from the origin. All basis
+        polygons must have the same number of corners, K, listed in order around the polygon.
+
+    Attributes
+    ----------
+    sites : Nx2 array
+        The distinct vertex positions within a single cell, as offsets from the origin. Every
+        vertex of the tiling is a site translated by whole translation vectors.
+    corner_site : SxK array
+        The site of each polygon corner.
+    corner_shift : SxKx2 array
+        The whole translation, in units of (t1, t2), from a corner's site to the corner.
+    side_type : SxK array
+        An id shared by all polygon sides, (corner k to corner k + 1), that are the same edge
+        of the tiling up to whole translations.
+    side_shift : SxKx2 array
+        The whole translation of a side relative to the other sides of its type.
+    side_neighbour : SxK array
+        The basis polygon on the other side of each polygon side, or -1 if there is none.
+    side_offset : SxKx2 array
+        The whole translation, in units of (t1, t2), from a polygon's cell to the cell of the
+        polygon on the other side of each of its sides.
+    max_degree : int
+        The most edges meeting at any vertex of the tiling.
+
+    Notes
+    -----
+    A cell of the tiling is identified by the integer triple (i, j, s); polygon s translated
+    by i*t1 + j*t2. Corner k of cell (i, j, s) is the vertex (corner_site[s, k], i, j) +
+    corner_shift[s, k]. As this identity is exact, shared vertices and edges of neighbouring
+    cells can be found by index arithmetic alone.
+
+    Likewise, a point is located in the tiling by writing it in units of (t1, t2); the whole
+    part gives a cell, and only the few polygons of nearby cells that overlap that cell's
+    parallelogram can contain it. Basis polygons are assumed convex.
+    """
+    def __init__(self, origin, translations, polygons):
+        """
+        Initialises a tiling and reduces its polygon corners and sides to sites and side types.
+        """
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.translations = np.asarray(translations, dtype=np.float64)
+        corners = np.asarray(polygons, dtype=np.float64)
+        if corners.ndim != 3 or corners.shape[2] != 2:
+            raise PolyLatError("Tiling polygons must all have the same number of corners.")
+        if abs(np.linalg.det(self.translations)) < 1e-12:
+            raise PolyLatError("Tiling translation vectors must be linearly independent.")
+        self.num_polygons, self.num_corners = corners.shape[:2]
+
+        # Reduce corners to sites plus whole translations
+        coeff = corners.reshape(-1, 2) @ np.linalg.inv(self.translations)
+        shift = np.floor(coeff + 1e-7)
+        # Corners are grouped into sites by their rounded fractional parts, but each site keeps
+        # the exact fractional part of its first corner
+        frac = coeff - shift
+        _, first, site = np.unique(np.round(frac, 6), axis=0, return_index=True, return_inverse=True)
+        # Number sites in order of first appearance
+        order = np.argsort(first)
+        renumber = np.empty_like(order)
+        renumber[order] = np.arange(len(order))
+        self.corner_site = renumber[site.reshape(-1)].reshape(self.num_polygons, self.num_corners)
+        self.corner_shift = shift.astype(np.int64).reshape(self.num_polygons, self.num_corners, 2)
+        self.sites = frac[first[order]] @ self.translations
+
+        # Reduce sides to side types plus whole translations
+        self.side_type = np.empty((self.num_polygons, self.num_corners), dtype=np.int64)
+        self.side_shift = np.empty((self.num_polygons, self.num_corners, 2), dtype=np.int64)
+        types = {}
+        for s in range(self.num_polygons):
+            for k in range(self.num_corners):
+                k_next = (k + 1) % self.num_corners
+                a = (int(self.corner_site[s, k]),) + tuple(self.corner_shift[s, k].tolist())
+                b = (int(self.corner_site[s, k_next]),) + tuple(self.corner_shift[s, k_next].tolist())
+                forward = (a[0], b[0], b[1] - a[1], b[2] - a[2])
+                backward = (b[0], a[0], a[1] - b[1], a[2] - b[2])
+                key, base = (forward, a) if forward <= backward else (backward, b)
+                self.side_type[s, k] = types.setdefault(key, len(types))
+                self.side_shift[s, k] = base[1:]
+
+        # Every corner of each site, and every side of each type, as (s, k, shift)
+        self._site_corners = [[] for _ in range(len(self.sites))]
+        self._type_sides = [[] for _ in range(len(types))]
+        for s in range(self.num_polygons):
+            for k in range(self.num_corners):
+                self._site_corners[self.corner_site[s, k]].append((s, k, self.corner_shift[s, k]))
+                self._type_sides[self.side_type[s, k]].append((s, k, self.side_shift[s, k]))
+
+        # The polygon sharing each side, as the other side of the same type
+        self.side_neighbour = np.full((self.num_polygons, self.num_corners), -1, dtype=np.int64)
+        self.side_offset = np.zeros((self.num_polygons, self.num_corners, 2), dtype=np.int64)
+        for sides in self._type_sides:
+            for s0, k0, shift0 in sides:
+                for s1, k1, shift1 in sides:
+                    if (s1, k1) != (s0, k0):
+                        self.side_neighbour[s0, k0] = s1
+                        self.side_offset[s0, k0] = shift0 - shift1
+
+        # The vertices joined to each site, by the sides either side of its corners
+        degrees = []
+        for corners in self._site_corners:
+            joined = set()
+            for s, k, shift in corners:
+                for k1 in ((k - 1) % self.num_corners, (k + 1) % self.num_corners):
+                    offset = self.corner_shift[s, k1] - shift
+                    joined.add((int(self.corner_site[s, k1]), int(offset[0]), int(offset[1])))
+            degrees.append(len(joined))
+        self.max_degree = max(degrees)
+
+        # Each basis polygon in units of (t1, t2), from its sites, as half-planes normal . x >= limit
+        units = frac[first[order]][self.corner_site] + self.corner_shift
+        sides = np.roll(units, -1, axis=1) - units
+        x, y = units[..., 0], units[..., 1]
+        area = (x*np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1)*y).sum(axis=1)
+        self._normals = np.sign(area)[:, None, None]*np.stack([-sides[..., 1], sides[..., 0]], axis=2)
+        self._limits = (self._normals*units).sum(axis=2)
+        # The polygons (s) of cells (i, j) whose bounds meet the parallelogram of cell (0, 0),
+        # nearest first
+        cover = []
+        for s in range(self.num_polygons):
+            low, high = units[s].min(axis=0), units[s].max(axis=0)
+            for i in range(int(np.floor(-high[0])), int(np.ceil(1 - low[0])) + 1):
+                for j in range(int(np.floor(-high[1])), int(np.ceil(1 - low[1])) + 1):
+                    if (low + (i, j) <= 1 + 1e-9).all() and (high + (i, j) >= -1e-9).all():
+                        centre = units[s].mean(axis=0) + (i, j) - 0.5
+                        cover.append((centre @ centre, i, j, s))
+        self._cover = np.array([cell for _, *cell in sorted(cover)], dtype=np.int64)
+
+    @classmethod
+    def from_vectors(cls, start, vectors, translations):
+        """
+        Returns the tiling of a single polygon given by its edge vectors.
+
+        Parameters
+        ----------
+        start : (x, y) - 2D Cartesian Coordinate
+            Position of the polygon's first corner, which becomes the tiling's origin.
+        vectors : list
+            Ordered list of the polygon's edge vectors, as used by 'generate_shape'.
+        translations : 2x2 sequence
+            The two translation vectors of the tiling.
+        """
+        corners = [(0, 0)]
+        for vector in vectors[:-1]:
+            corners.append((corners[-1][0] + vector[0], corners[-1][1] + vector[1]))
+        return cls(start, translations, [corners])
+
+    def transformed(self, matrix, offset):
+        """
+        Returns the tiling mapped by the affine transform x -> matrix @ x + offset.
+
+        Notes
+        -----
+        Only the origin, translation vectors and sites move. Sites, corners and sides keep their
+        integer identities, so a lattice tiled by the transformed tiling has the same vertices and
+        edges, in the same order, as one tiled by the original.
+        """
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if abs(np.linalg.det(matrix)) < 1e-12:
+            raise PolyLatError("Tiling transform matrix must be invertible.")
+        tiling = copy(self)
+        tiling.origin = matrix @ self.origin + offset
+        tiling.translations = self.translations @ matrix.T
+        tiling.sites = self.sites @ matrix.T
+        return tiling
+
+    def positions(self, site, i, j):
+        """
+        Returns the Nx2 array of positions of the vertices (site, i, j).
+        """
+        return self.origin + self.sites[site] + np.outer(i, self.translations[0]) \
+            + np.outer(j, self.translations[1])
+
+    def owners(self, cells, i, j, s):
+        """
+        Returns the owning cell rank and corner of every corner of the given cells, and the
+        owning cell rank of every side.
+
+        Parameters
+        ----------
+        cells : cell sequence
+            The cells of the lattice, providing 'rank(i, j, s)'.
+        i, j, s : int arrays of length C
+            The cells whose corners and sides are to be resolved.
+
+        Returns
+        -------
+        vertex_rank, vertex_corner, edge_rank : CxK int arrays
+
+        Notes
+        -----
+        A vertex or edge of the lattice is owned by the lowest ranked cell of the sequence that
+        contains it. The candidate cells are found by index arithmetic from the site and side
+        reductions, so this is O(C) regardless of the lattice size.
+        """
+        C, K = len(i), self.num_corners
+        vertex_rank = np.empty((C, K), dtype=np.int64)
+        vertex_corner = np.empty((C, K), dtype=np.int64)
+        edge_rank = np.empty((C, K), dtype=np.int64)
+        for s0 in range(self.num_polygons):
+            sel = np.flatnonzero(s == s0)
+            if not len(sel):
+                continue
+            for k in range(K):
+                # Vertex at this corner, and every cell corner it could also be
+                vi = i[sel] + self.corner_shift[s0, k, 0]
+                vj = j[sel] + self.corner_shift[s0, k, 1]
+                vertex_rank[sel, k], vertex_corner[sel, k] = \
+                    self._site_owners(cells, self.corner_site[s0, k], vi, vj)
+                # Edge along this side, and every cell side it could also be
+                ei = i[sel] + self.side_shift[s0, k, 0]
+                ej = j[sel] + self.side_shift[s0, k, 1]
+                best = np.full(len(sel), np.iinfo(np.int64).max)
+                for s1, k1, shift in self._type_sides[self.side_type[s0, k]]:
+                    rank = cells.rank(ei - shift[0], ej - shift[1], np.full(len(sel), s1))
+                    better = (rank >= 0) & (rank < best)
+                    best[better] = rank[better]
+                edge_rank[sel, k] = best
+        return vertex_rank, vertex_corner, edge_rank
+
+    def vertex_owners(self, cells, site, i, j):
+        """
+        Returns the owning cell rank and corner of each vertex (site, i, j).
+
+        Parameters
+        ----------
+        cells : cell sequence
+            The cells of the lattice, providing 'rank(i, j, s)'.
+        site, i, j : int arrays of length N
+            The vertices to be resolved.
+
+        Returns
+        -------
+        rank, corner : int arrays of length N
+            The lowest ranked cell of the sequence containing each vertex and the vertex's
+            corner of that cell, with rank -1 for vertices of no cell in the sequence.
+        """
+        site, i, j = (np.asarray(a, dtype=np.int64).reshape(-1) for a in (site, i, j))
+        rank = np.full(len(site), -1, dtype=np.int64)
+        corner = np.zeros(len(site), dtype=np.int64)
+        for site0 in range(len(self.sites)):
+            sel = np.flatnonzero(site == site0)
+            if len(sel):
+                rank[sel], corner[sel] = self._site_owners(cells, site0, i[sel], j[sel])
+        rank[rank == np.iinfo(np.int64).max] = -1
+        return rank, corner
+
+    def vertex_cells(self, cells, site, i, j):
+        """
+        Returns the rank and corner of every cell containing each vertex (site, i, j).
+
+        Parameters
+        ----------
+        cells : cell sequence
+            The cells of the lattice, providing 'rank(i, j, s)'.
+        site, i, j : int arrays of length N
+            The vertices to be resolved.
+
+        Returns
+        -------
+        rank, corner : NxM int arrays
+            The ranks of the cells of the sequence containing each vertex and the vertex's corner
+            of each, where M is the most polygons meeting at any site. Ranks of -1 pad the rows
+            of vertices in fewer cells.
+        """
+        site, i, j = (np.asarray(a, dtype=np.int64).reshape(-1) for a in (site, i, j))
+        M = max(len(corners) for corners in self._site_corners)
+        rank = np.full((len(site), M), -1, dtype=np.int64)
+        corner = np.zeros((len(site), M), dtype=np.int64)
+        for site0, corners in enumerate(self._site_corners):
+            sel = np.flatnonzero(site == site0)
+            for m, (s1, k1, shift) in enumerate(corners if len(sel) else []):
+                rank[sel, m] = cells.rank(i[sel] - shift[0], j[sel] - shift[1], np.full(len(sel), s1))
+                corner[sel, m] = k1
+        return rank, corner
+
+    def locate(self, cells, points, block_size = 1 << 20):
+        """
+        Returns the rank of the cell containing each point.
+
+        Parameters
+        ----------
+        cells : cell sequence
+            The cells of the lattice, providing 'rank(i, j, s)'.
+        points : Mx2 array
+            The points to locate.
+        block_size : int > 0, Default = 1 << 20, optional
+            The number of points located at once.
+
+        Returns
+        -------
+        rank : int array of length M
+            The rank of the cell of the sequence containing each point, or -1 for points in no
+            cell of the sequence. Points on the boundary between cells are given to one of them.
+
+        Notes
+        -----
+        The cell (i, j) whose parallelogram holds each point follows from the point in units of
+        (t1, t2). The polygons of the nearby cells covering that parallelogram are then tested in
+        turn, nearest first, each against only the points not yet found, so most points are
+        found by the first or second test. This is O(M) however large the lattice is.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        inverse = np.linalg.inv(self.translations)
+        rank = np.full(len(points), -1, dtype=np.int64)
+        for start in range(0, len(points), block_size):
+            units = (points[start:start + block_size] - self.origin) @ inverse
+            cell = np.floor(units)
+            units -= cell
+            cell = cell.astype(np.int64)
+            pending = np.arange(len(units))
+            for i, j, s in self._cover:
+                # Within every side's half-plane of polygon s of cell (i, j), allowing for rounding
+                limits = self._limits[s] + self._normals[s] @ (i, j) - 1e-9
+                inside = ((units[pending] @ self._normals[s].T) >= limits).all(axis=1)
+                test = np.flatnonzero(inside)
+                found = cells.rank(cell[pending[test], 0] + i, cell[pending[test], 1] + j, np.full(len(test), s))
+                rank[start + pending[test]] = found
+                inside[test[found < 0]] = False
+                pending = pending[~inside]
+                if not len(pending):
+                    break
+        return rank
+
+    def _site_owners(self, cells, site, i, j):
+        """
+        Returns the owning cell rank and corner of the vertices (site, i, j) of a single site,
+        with the largest int64 as the rank of vertices of no cell in the sequence.
+        """
+        best = np.full(len(i), np.iinfo(np.int64).max)
+        best_k = np.zeros(len(i), dtype=np.int64)
+        for s1, k1, shift in self._site_corners[site]:
+            rank = cells.rank(i - shift[0], j - shift[1], np.full(len(i), s1))
+            better = (rank >= 0) & (rank < best)
+            best[better] = rank[better]
+            best_k[better] = k1
+        return best, best_k
+
+
+############################################################################################
+
+class _Rings():
+    """
+    Base of the cell sequences of circular lattices, which rank cells ring by ring outwards from
+    a central cell, ring 0.
+    """
+    def __init__(self, layers):
+        """
+        Initialises the ring sequence for the given number of layers.
+        """
+        if not is_positive_int(layers):
+            raise PolyLatNotPosInt(layers)
+        self.layers = layers
+
+    def cells(self, start, stop):
+        """
+        Returns the (i, j, s) arrays of the cells ranked 'start' up to 'stop'.
+        """
+        return self.at(np.arange(start, stop, dtype=np.int64))
+
+    def layer_cells(self, layer):
+        """
+        Returns the range of ranks of the cells in ring 'layer'.
+        """
+        return range(len(type(self)(layer)) if layer else 0, len(type(self)(layer + 1)))
+
+    def info(self, rank):
+        """
+        Returns the dictionary of the ring, 'layer', of the cell ranked 'rank'.
+        """
+        return {"layer": int(self._layer(np.array([rank], dtype=np.int64))[0])}
+
+    # Named by rank alone, so rings of any number of layers share the same labels
+    labels = staticmethod(_rank_labels)
+
+
+class HexRings(_Rings):
+    """
+    The cells of a circular lattice of hexagons, in rings around a central cell.
+
+    Parameters
+    ----------
+    layers : int > 0
+        The number of rings, including the central cell as the first.
+
+    Notes
+    -----
+    Cells are in axial coordinates (i, j), where the translation vectors of the tiling point
+    to two neighbouring hexagons 60 degrees apart, and the hex distance of a cell from the centre
+    is max(|i|, |j|, |i + j|). Ring l holds the 6l cells at distance l. Each ring starts at
+    (0, -l) and walks anti-clockwise along the six directions, l cells per side, matching the
+    order hexagons are generated in.
+    """
+    # Start corner and walking direction of each side of a ring of radius 1
+    _CORNERS = np.array([(0, -1), (1, -1), (1, 0), (0, 1), (-1, 1), (-1, 0)])
+    _DIRECTIONS = np.array([(1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1), (1, -1)])
+
+    def __len__(self):
+        return 1 + 3*self.layers*(self.layers - 1)
+
+    def at(self, rank):
+        """
+        Returns the (i, j, s) arrays of the cells of an array of ranks.
+        """
+        layer = self._layer(rank)
+        pos = rank - (1 + 3*layer*(layer - 1))
+        side = np.where(layer > 0, pos//np.maximum(layer, 1), 0)
+        step = np.where(layer > 0, pos % np.maximum(layer, 1), 0)
+        ij = self._CORNERS[side]*layer[:, None] + self._DIRECTIONS[side]*step[:, None]
+        return ij[:, 0], ij[:, 1], np.zeros(len(rank), dtype=np.int64)
+
+    @staticmethod
+    def _layer(rank):
+        """
+        Returns the ring of each rank, inverting 1 + 3l(l - 1) <= rank.
+        """
+        layer = np.floor((3 + np.sqrt(np.maximum(12*rank - 3, 0)))/6).astype(np.int64)
+        layer[rank == 0] = 0
+        layer -= (1 + 3*layer*(layer - 1) > rank) & (rank > 0)
+        layer += (1 + 3*(layer + 1)*layer <= rank) & (rank > 0)
+        return layer
+
+    def rank(self, i, j, s):
+        """
+        Returns the rank of each cell (i, j, s), or -1 for cells not in the sequence.
+        """
+        layer = np.maximum(np.maximum(np.abs(i), np.abs(j)), np.abs(i + j))
+        conditions = [
+            (j == -layer) & (i >= 0) & (i < layer),
+            (i == layer) & (j < 0),
+            (i + j == layer) & (i > 0),
+            (j == layer) & (i <= 0) & (i > -layer),
+            (i == -layer) & (j > 0),
+            (i + j == -layer) & (j <= 0) & (j > -layer),
+        ]
+        pos = np.select(conditions, [
+            i,
+            layer + layer + j,
+            2*layer + layer - i,
+            3*layer - i,
+            4*layer + layer - j,
+            5*layer - j,
+        ], 0)
+        rank = np.where(layer > 0, 1 + 3*layer*(layer - 1) + pos, 0)
+        return np.where((layer < self.layers) & (s == 0), rank, -1)
+
+
+class SquareRings(_Rings):
+    """
+    The cells of a circular lattice of four sided polygons, in square rings around a central cell.
+
+    Parameters
+    ----------
+    layers : int > 0
+        The number of rings, including the central cell as the first.
+
+    Notes
+    -----
+    Ring l holds the 8l cells (i, j) with max(|i|, |j|) = l. Each ring starts at (l, l) and walks
+    along the four directions -i, -j, +i and +j, 2l cells per side, matching the order four sided
+    polygons are generated in when the translation vectors are the polygon's third and fourth
+    edges.
+    """
+    # Start corner and walking direction of each side of a ring of radius 1
+    _CORNERS = np.array([(1, 1), (-1, 1), (-1, -1), (1, -1)])
+    _DIRECTIONS = np.array([(-1, 0), (0, -1), (1, 0), (0, 1)])
+
+    def __len__(self):
+        return (2*self.layers - 1)**2
+
+    def at(self, rank):
+        """
+        Returns the (i, j, s) arrays of the cells of an array of ranks.
+        """
+        layer = self._layer(rank)
+        pos = np.where(layer > 0, rank - (2*layer - 1)**2, 0)
+        side = np.where(layer > 0, pos//np.maximum(2*layer, 1), 0)
+        step = np.where(layer > 0, pos % np.maximum(2*layer, 1), 0)
+        ij = self._CORNERS[side]*layer[:, None] + self._DIRECTIONS[side]*step[:, None]
+        return ij[:, 0], ij[:, 1], np.zeros(len(rank), dtype=np.int64)
+
+    @staticmethod
+    def _layer(rank):
+        """
+        Returns the ring of each rank. Rings fill odd squares, (2l - 1)^2 <= rank < (2l + 1)^2.
+        """
+        layer = ((np.floor(np.sqrt(rank)).astype(np.int64) + 1)//2)
+        layer -= ((2*layer - 1)**2 > rank) & (rank > 0)
+        layer += (2*layer + 1)**2 <= rank
+        return layer
+
+    def rank(self, i, j, s):
+        """
+        Returns the rank of each cell (i, j, s), or -1 for cells not in the sequence.
+        """
+        layer = np.maximum(np.abs(i), np.abs(j))
+        conditions = [
+            (j == layer) & (i > -layer),
+            (i == -layer) & (j > -layer),
+            (j == -layer) & (i < layer),
+            (i == layer) & (j < layer),
+        ]
+        pos = np.select(conditions, [
+            layer - i,
+            2*layer + layer - j,
+            4*layer + layer + i,
+            6*layer + layer + j,
+        ], 0)
+        rank = np.where(layer > 0, (2*layer - 1)**2 + pos, 0)
+        return np.where((layer < self.layers) & (s == 0), rank, -1)
+
+
+class TriangleRings(_Rings):
+    """
+    The cells of a circular lattice of triangles, in rings around a central triangle.
+
+    Parameters
+    ----------
+    layers : int > 0
+        The number of rings, including the central triangle as the first.
+
+    Notes
+    -----
+    The tiling has two triangles per cell; s = 0 pointing the same way as the central triangle
+    and s = 1 pointing the opposite way. Cell (i, j, s) is given the coordinates
+    (x, y, z) = (i, -j, s - i + j), so that x + y + z = s, and the number of edges crossed from
+    the central triangle to it is |x| + |y| + |z|. Ring l holds the 3l triangles at distance l,
+    which all share an orientation. With m = l // 2 and p = l % 2, each ring starts at
+    (-m, 0, m + p) and walks anti-clockwise around six sides of alternately m + p and m
+    triangles, matching the order triangles are generated in.
+    """
+    # Start of each side of a ring as multiples of m and p, and the walking direction, in (x, y)
+    _CORNERS_M = np.array([(-1, 0), (-1, 1), (0, 1), (1, 0), (1, -1), (0, -1)])
+    _CORNERS_P = np.array([(0, 0), (0, 1), (0, 1), (1, 0), (1, 0), (0, 0)])
+    _DIRECTIONS = np.array([(0, 1), (1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1)])
+
+    def __len__(self):
+        return 1 + 3*self.layers*(self.layers - 1)//2
+
+    def at(self, rank):
+        """
+        Returns the (i, j, s) arrays of the cells of an array of ranks.
+        """
+        layer = self._layer(rank)
+        pos = np.where(layer > 0, rank - (1 + 3*layer*(layer - 1)//2), 0)
+        m, p = layer//2, layer % 2
+        lengths = np.stack([m + p, m, m + p, m, m + p, m], axis=1)
+        ends = np.cumsum(lengths, axis=1)
+        side = np.minimum(np.count_nonzero(ends <= pos[:, None], axis=1), 5)
+        step = pos - (ends - lengths)[np.arange(len(rank)), side]
+        xy = self._CORNERS_M[side]*m[:, None] + self._CORNERS_P[side]*p[:, None] \
+            + self._DIRECTIONS[side]*step[:, None]
+        return xy[:, 0], -xy[:, 1], p
+
+    @staticmethod
+    def _layer(rank):
+        """
+        Returns the ring of each rank, inverting 1 + 3l(l - 1)/2 <= rank.
+        """
+        layer = np.floor((3 + np.sqrt(np.maximum(24*rank - 15, 0)))/6).astype(np.int64)
+        layer[rank == 0] = 0
+        layer -= (1 + 3*layer*(layer - 1)//2 > rank) & (rank > 0)
+        layer += (1 + 3*(layer + 1)*layer//2 <= rank) & (rank > 0)
+        return layer
+
+    def rank(self, i, j, s):
+        """
+        Returns the rank of each cell (i, j, s), or -1 for cells not in the sequence.
+        """
+        x, y, z = i, -j, s - i + j
+        layer = np.abs(x) + np.abs(y) + np.abs(z)
+        m, p = layer//2, layer % 2
+        conditions = [
+            (x == -m) & (y >= 0) & (y < m + p),
+            (y == m + p) & (x < 0),
+            (z == -m) & (x >= 0) & (x < m + p),
+            (x == m + p) & (y <= 0) & (y > -m),
+            (y == -m) & (x > 0),
+            (z == m + p) & (x <= 0) & (x > -m),
+        ]
+        pos = np.select(conditions, [
+            y,
+            m + p + m + x,
+            2*m + p + x,
+            3*m + 2*p - y,
+            4*m + 2*p + m + p - x,
+            5*m + 3*p - x,
+        ], 0)
+        rank = np.where(layer > 0, 1 + 3*layer*(layer - 1)//2 + pos, 0)
+        return np.where((layer < self.layers) & ((s == 0) | (s == 1)), rank, -1)
+
+
+class Block():
+    """
+    The cells of a stacked lattice, in a block of rows by columns.
+
+    Parameters
+    ----------
+    rows : int > 0
+        The number of rows in the block.
+    columns : int > 0
+        The number of columns in the block.
+    row_step : (i, j), Default = (0, 1), optional
+        The tiling cell offset between one row and the next.
+    column_step : (i, j), Default = (1, 0), optional
+        The tiling cell offset between one column and the next.
+    polygons : int > 0, Default = 1, optional
+        The number of basis polygons per tiling cell.
+    start : (i, j), Default = (0, 0), optional
+        The tiling cell in row 0 and column 0.
+
+    Notes
+    -----
+    The cell in row r and column c is the tiling cell start + r*row_step + c*column_step, so any
+    parallelogram shaped range of tiling cells can be described as a block. Cells are ranked row
+    by row. The row and column steps must form a unimodular integer matrix, so that every tiling
+    cell maps back to a unique row and column.
+
+    For tilings with more than one basis polygon, the second component of the start and steps
+    counts single polygons rather than whole cells; cell (i, j, s) is at (i, polygons*j + s).
+    """
+    def __init__(self, rows, columns, row_step = (0, 1), column_step = (1, 0), polygons = 1, start = (0, 0)):
+        """
+        Initialises the block of cells for the given number of rows and columns.
+        """
+        for count in (rows, columns):
+            if not is_positive_int(count):
+                raise PolyLatNotPosInt(count)
+        self.rows = rows
+        self.columns = columns
+        self.polygons = polygons
+        self.start = np.array(start, dtype=np.int64)
+        self.steps = np.array([row_step, column_step], dtype=np.int64)
+        det = self.steps[0, 0]*self.steps[1, 1] - self.steps[0, 1]*self.steps[1, 0]
+        if abs(det) != 1:
+            raise PolyLatError("Block row and column steps must form a unimodular matrix.")
+        self._inverse = np.array([
+            [self.steps[1, 1], -self.steps[0, 1]],
+            [-self.steps[1, 0], self.steps[0, 0]]
+        ])*det
+
+    def __len__(self):
+        return self.rows*self.columns
+
+    def cells(self, start, stop):
+        """
+        Returns the (i, j, s) arrays of the cells ranked 'start' up to 'stop'.
+        """
+        return self.at(np.arange(start, stop, dtype=np.int64))
+
+    def at(self, rank):
+        """
+        Returns the (i, j, s) arrays of the cells of an array of ranks.
+        """
+        rc = np.stack([rank//self.columns, rank % self.columns], axis=1)
+        ij = rc @ self.steps + self.start
+        return ij[:, 0], ij[:, 1]//self.polygons, ij[:, 1] % self.polygons
+
+    def rank(self, i, j, s):
+        """
+        Returns the rank of each cell (i, j, s), or -1 for cells not in the sequence.
+        """
+        i = i - self.start[0]
+        q = j*self.polygons + s - self.start[1]
+        row = i*self._inverse[0, 0] + q*self._inverse[1, 0]
+        column = i*self._inverse[0, 1] + q*self._inverse[1, 1]
+        inside = (row >= 0) & (row < self.rows) & (column >= 0) & (column < self.columns) \
+            & (s >= 0) & (s < self.polygons)
+        return np.where(inside, row*self.columns + column, -1)
+
+    def labels(self, ranks):
+        """
+        Returns the shape name, 'row.column', of each cell rank.
+        """
+        return [f"{rank//self.columns}.{rank % self.columns}" for rank in ranks]
+
+    def row_cells(self, row):
+        """
+        Returns the range of ranks of the cells in row 'row'.
+        """
+        return range(row*self.columns, (row + 1)*self.columns)
+
+    def column_cells(self, column):
+        """
+        Returns the range of ranks of the cells in column 'column'.
+        """
+        return range(column, self.rows*self.columns, self.columns)
+
+    def info(self, rank):
+        """
+        Returns the dictionary of the 'row' and 'column' of the cell ranked 'rank'.
+        """
+        return {"row": rank//self.columns, "column": rank % self.columns}
+
+
+def _strip_range(polygon, lower, upper):
+    """
+    Returns the least and greatest x of the parts of a convex polygon within each horizontal
+    strip lower <= y <= upper, or inf and -inf where the polygon misses a strip.
+    """
+    x, y = polygon[:, 0], polygon[:, 1]
+    dx, dy = np.roll(x, -1) - x, np.roll(y, -1) - y
+    within = (y >= lower[:, None]) & (y <= upper[:, None])
+    least = np.where(within, x, np.inf).min(axis=1)
+    greatest = np.where(within, x, -np.inf).max(axis=1)
+    # Crossings of the polygon's sides with the strip's edges
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for level in (lower, upper):
+            t = (level[:, None] - y) / dy
+            crossing = (t >= 0) & (t <= 1)
+            least = np.minimum(least, np.where(crossing, x + t*dx, np.inf).min(axis=1))
+            greatest = np.maximum(greatest, np.where(crossing, x + t*dx, -np.inf).max(axis=1))
+    return least, greatest
+
+
+class Clipped():
+    """
+    The cells of a tiling overlapping a region, row by row.
+
+    Parameters
+    ----------
+    tiling : Tiling
+        The tiling whose cells are clipped.
+    region : region
+        The region to clip to, providing 'outline' and 'overlaps', such as a CircleRegion.
+    block_size : int > 0, Default = 65536, optional
+        The number of candidate cells tested at once.
+
+    Notes
+    -----
+    Candidate cells are bounded row by row by index arithmetic. In units of the translation
+    vectors, row j of cells spans a strip of the plane, and the range of i for which a cell of
+    the row can reach the region follows from the extent of the region's convex outline within
+    that strip and the extent of the basis polygons. Only candidates in these ranges have their
+    corners tested against the region, so the cost is proportional to the region's area rather
+    than to any lattice containing it, and no vertex is created for a rejected cell.
+
+    Kept cells are ranked by j, then i, then s, and ranks are found from cells by binary search.
+    """
+    def __init__(self, tiling, region, block_size = 65536):
+        """
+        Finds the cells of the tiling overlapping the region.
+        """
+        S = tiling.num_polygons
+        # Basis polygon corners, as offsets from the origin and in units of (t1, t2)
+        offsets = tiling.sites[tiling.corner_site] + tiling.corner_shift @ tiling.translations
+        inverse = np.linalg.inv(tiling.translations)
+        extent = (offsets @ inverse).reshape(-1, 2)
+        outline = (np.asarray(region.outline(), dtype=np.float64) - tiling.origin) @ inverse
+
+        # Range of i for each row of cells that can reach the outline
+        j = np.arange(np.floor(outline[:, 1].min() - extent[:, 1].max()),
+                      np.ceil(outline[:, 1].max() - extent[:, 1].min()) + 1).astype(np.int64)
+        lower, upper = _strip_range(outline, j + extent[:, 1].min(), j + extent[:, 1].max())
+        reach = np.isfinite(lower)
+        j = j[reach]
+        first = np.floor(lower[reach] - extent[:, 0].max()).astype(np.int64)
+        last = np.ceil(upper[reach] - extent[:, 0].min()).astype(np.int64)
+        self._start = np.array([first.min(initial=0), j.min(initial=0)], dtype=np.int64)
+        self._width = int(last.max(initial=0) - self._start[0] + 1)
+        self.polygons = S
+
+        kept = [np.empty(0, dtype=np.int64)]
+        counts = (last - first + 1)*S
+        starts = np.cumsum(counts) - counts
+        row = 0
+        while row < len(j):
+            stop = max(row + 1, int(np.searchsorted(starts, starts[row] + block_size, "right")) - 1)
+            # Every (i, s) of rows 'row' up to 'stop'
+            rows = np.repeat(np.arange(row, stop), counts[row:stop])
+            index = np.arange(len(rows)) - (starts[rows] - starts[row])
+            i, s = first[rows] + index//S, index % S
+            corners = tiling.origin + offsets[s] + (np.outer(i, tiling.translations[0])
+                                                    + np.outer(j[rows], tiling.translations[1]))[:, None]
+            keep = region.overlaps(corners)
+            kept.append(self._key(i[keep], j[rows][keep], s[keep]))
+            row = stop
+        self._keys = np.concatenate(kept)
+
+    def _key(self, i, j, s):
+        """
+        Returns the row-major sort key of each cell (i, j, s) of the candidate range.
+        """
+        return ((j - self._start[1])*self._width + i - self._start[0])*self.polygons + s
+
+    def __len__(self):
+        return len(self._keys)
+
+    def cells(self, start, stop):
+        """
+        Returns the (i, j, s) arrays of the cells ranked 'start' up to 'stop'.
+        """
+        return self.at(np.arange(start, stop, dtype=np.int64))
+
+    def at(self, rank):
+        """
+        Returns the (i, j, s) arrays of the cells of an array of ranks.
+        """
+        cell, s = np.divmod(self._keys[rank], self.polygons)
+        row, column = np.divmod(cell, self._width)
+        return column + self._start[0], row + self._start[1], s
+
+    def rank(self, i, j, s):
+        """
+        Returns the rank of each cell (i, j, s), or -1 for cells not in the sequence.
+        """
+        i, j, s = np.broadcast_arrays(np.asarray(i, dtype=np.int64), np.asarray(j, dtype=np.int64),
+                                      np.asarray(s, dtype=np.int64))
+        column = i - self._start[0]
+        inside = (column >= 0) & (column < self._width) & (j >= self._start[1]) \
+            & (s >= 0) & (s < self.polygons)
+        key = self._key(i, j, s)
+        rank = np.minimum(np.searchsorted(self._keys, key), max(len(self._keys) - 1, 0))
+        found = inside & (self._keys[rank] == key) if len(self._keys) else np.zeros(key.shape, dtype=bool)
+        return np.where(found, rank, -1)
+
+    def info(self, rank):
+        """
+        Returns an empty dictionary; clipped cells have no layers, rows or columns.
+        """
+        return {}
+
+    labels = staticmethod(_rank_labels)
+
+
+############################################################################################
+
+def _tile_part(tiling, cells, start, stop):
+    """
+    Resolves the owners of the corners and sides of the cells ranked 'start' up to 'stop', and
+    the positions of the vertices they own. Parts are independent, so they can be resolved in
+    separate worker processes.
+    """
+    i, j, s = cells.cells(start, stop)
+    vertex_rank, vertex_corner, edge_rank = tiling.owners(cells, i, j, s)
+    rank = np.arange(start, stop)[:, None]
+    owned = (vertex_rank == rank) & (vertex_corner == np.arange(tiling.num_corners)[None, :])
+    owner, k = np.nonzero(owned)
+    site = tiling.corner_site[s[owner], k]
+    shift = tiling.corner_shift[s[owner], k]
+    positions = tiling.positions(site, i[owner] + shift[:, 0], j[owner] + shift[:, 1])
+    return vertex_rank, vertex_corner, owned, edge_rank == rank, positions, owner + start, k
+
+
+def tile(tiling, cells, start = 0, known = None, first = 0, workers = 1):
+    """
+    Generates the vertices and edges of a lattice as arrays.
+
+    Parameters
+    ----------
+    tiling : Tiling
+        The periodic tiling the lattice is cut from.
+    cells : cell sequence
+        The cells of the tiling making up the lattice, in generation order.
+    start : int >= 0, Default = 0, optional
+        The rank of the first cell to generate. Cells ranked below it are taken to be generated
+        already, so that a lattice can be extended to a longer sequence of the same cells.
+    known : int array, Default = None, optional
+        The vertex index of every corner of the cells already generated, one row per cell.
+        Required when 'start' > 0.
+    first : int >= 0, Default = 0, optional
+        The vertex index of the first new vertex.
+    workers : int > 0, Default = 1, optional
+        The number of processes to resolve the cells with.
+
+    Returns
+    -------
+    names : GeneratedNames
+        Vertex names, of the form 'shape_name-k' for the first shape containing the vertex.
+    positions : Nx2 float64 array
+        Vertex positions.
+    ends : Ex2 int32 array
+        The vertex indices at either end of each edge.
+    corners : CxK int32 array
+        The vertex index of every corner of the generated cells.
+
+    Notes
+    -----
+    Vertices and edges are emitted once each, by the first cell in the sequence containing
+    them, in the order they would be met when adding the cells' polygons one at a time. The
+    work is linear in the number of cells generated.
+
+    With more than one worker, the cells are split into equal contiguous rank ranges whose
+    owners and vertex positions are resolved in a process pool. As ownership depends only on
+    the cells, the parts are stitched back together in rank order into exactly the serial
+    result.
+    """
+    C = len(cells)
+    if workers > 1:
+        bounds = np.linspace(start, C, workers + 1).round().astype(np.int64).tolist()
+        with ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(_tile_part, repeat(tiling), repeat(cells), bounds[:-1], bounds[1:]))
+        vertex_rank, vertex_corner, owned, sides, positions, owner, k = \
+            (np.concatenate(arrays) for arrays in zip(*parts))
+    else:
+        vertex_rank, vertex_corner, owned, sides, positions, owner, k = _tile_part(tiling, cells, start, C)
+
+    # Number owned vertices in generation order, then look up every corner's vertex
+    ids = np.full(owned.shape, -1, dtype=np.int64)
+    ids[owned] = first + np.arange(len(owner))
+    new = vertex_rank >= start
+    corners = np.empty(owned.shape, dtype=np.int32)
+    corners[new] = ids[vertex_rank[new] - start, vertex_corner[new]]
+    if start:
+        corners[~new] = known[vertex_rank[~new], vertex_corner[~new]]
+    names = GeneratedNames(cells.labels, owner, k)
+
+    ends = np.stack([corners[sides], np.roll(corners, -1, axis=1)[sides]], axis=1)
+    return names, positions, ends, corners
+
+
+def stream(tiling, cells, chunk_size):
+    """
+    Generates the vertices and edges of a lattice in chunks.
+
+    Parameters
+    ----------
+    tiling : Tiling
+        The periodic tiling the lattice is cut from.
+    cells : cell sequence
+        The cells of the tiling making up the lattice, in generation order.
+    chunk_size : int > 0
+        The number of cells processed per chunk.
+
+    Yields
+    ------
+    names : list
+        Names of the vertices first met in the chunk's cells.
+    positions : Nx2 float64 array
+        Positions of those vertices.
+    edges : list
+        The edges first met in the chunk's cells, as pairs of vertex names.
+
+    Notes
+    -----
+    Concatenating the chunks gives exactly the vertices and edges of 'tile', in the same order.
+    A vertex or edge belongs to the chunk of its owning cell, and every vertex name follows from
+    the owner's rank alone, so edges reaching back into earlier chunks need no record of them.
+    Memory use depends only on the chunk size.
+    """
+    for start in range(0, len(cells), chunk_size):
+        stop = min(start + chunk_size, len(cells))
+        vertex_rank, vertex_corner, _, sides, positions, owner, k = _tile_part(tiling, cells, start, stop)
+        names = list(GeneratedNames(cells.labels, owner, k))
+        a = GeneratedNames(cells.labels, vertex_rank[sides], vertex_corner[sides])
+        b = GeneratedNames(cells.labels, np.roll(vertex_rank, -1, axis=1)[sides],
+                           np.roll(vertex_corner, -1, axis=1)[sides])
+        yield names, positions, list(zip(a, b))
@@ -0,0 +1,70 @@
+"""
+Tests of the compressed sparse row adjacency that shapes keep of their edges.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import Square, Hexagon
+from polylatlib.classes.adjacency import Adjacency
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatNotExist
+
+
+def check_rows(n, ends, offsets, neighbours, edges):
+    """
+    Checks the CSR arrays against a scan of every edge for each vertex.
+    """
+    assert len(offsets) == n + 1 and offsets[0] == 0
+    for v in range(n):
+        row = slice(offsets[v], offsets[v + 1])
+        expected = sorted(
+            (two if one == v else one, e) for e, (one, two) in enumerate(ends.tolist()) if v in (one, two))
+        assert list(zip(neighbours[row].tolist(), edges[row].tolist())) == expected
+
+
+def test_random_graph():
+    rng = np.random.default_rng(4)
+    ends = np.unique(np.sort(rng.integers(0, 60, (150, 2)), axis=1), axis=0)
+    ends = ends[rng.permutation(len(ends))]
+    adjacency = Adjacency(70, ends)
+    check_rows(70, ends, adjacency.offsets, adjacency.neighbours, adjacency.edges)
+    assert adjacency.size == (70, len(ends))
+    np.testing.assert_array_equal(adjacency.degrees(), np.diff(adjacency.offsets))
+    np.testing.assert_array_equal(adjacency.degrees(np.array([3, 65])), adjacency.degrees()[[3, 65]])
+    with pytest.raises(ValueError):
+        adjacency.neighbours[0] = 1
+
+    extended = adjacency.with_vertices(75)
+    assert extended.size == (75, len(ends))
+    check_rows(75, ends, extended.offsets, extended.neighbours, extended.edges)
+
+
+@pytest.mark.parametrize("backend", ["dict", "array"])
+@pytest.mark.parametrize("cls", [Square, Hexagon])
+def test_lattice_adjacency(cls, backend):
+    lattice = cls(backend=backend).generate_lattice_circular(4)
+    ends = lattice.to_numpy()[1]
+    offsets, neighbours, edges = lattice.get_adjacency()
+    check_rows(len(lattice.vertices), ends, offsets, neighbours, edges)
+    names = list(lattice.vertices)
+    vertex = names[5]
+    assert lattice.vertex_neighbours(vertex) == [names[idx] for idx in neighbours[offsets[5]:offsets[6]]]
+    assert lattice.degree(vertex) == offsets[6] - offsets[5]
+
+
+def test_kept_until_edges_change():
+    A = Shape()
+    A.add_edges([(0, 1), (1, 2), (2, 2)])
+    first = A._get_adjacency()
+    assert A.get_degrees().tolist() == [1, 2, 2]
+    A.update_edge_weight((0, 1), 3)
+    A.update_vertex_position(0, (1, 1))
+    assert A._get_adjacency() is first
+    A.add_vertex(3)
+    assert A._get_adjacency().size == (4, 3) and A.degree(3) == 0
+    assert A._get_adjacency().neighbours is first.neighbours
+    A.add_edge(3, 0)
+    assert A.vertex_neighbours(0) == [1, 3]
+    check_rows(4, A.to_numpy()[1], *A.get_adjacency())
+    with pytest.raises(PolyLatNotExist):
+        A.vertex_neighbours(9)
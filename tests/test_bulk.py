@@ -0,0 +1,128 @@
+"""
+Tests of the bulk 'add_vertices' and 'add_edges' paths of Shape, on both storage backends.
+"""
+
+import numpy as np
+import pytest
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatError, PolyLatNotCart, PolyLatNotColour, PolyLatNotPosInt
+
+BACKENDS = ["dict", "array"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_vertices_scalar_properties(backend):
+    A = Shape(backend)
+    A.add_vertices(["a", "b", "c"], [(0, 0), (1, 0), (0, 1)], sizes=6, colours="r")
+    assert list(A.vertices) == ["a", "b", "c"]
+    assert A.get_vertex_sizes() == {"a": 6, "b": 6, "c": 6}
+    assert A.get_vertex_colours() == {"a": "r", "b": "r", "c": "r"}
+    assert A.get_vertex_positions()["b"] == (1, 0)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_vertices_per_vertex_properties(backend):
+    A = Shape(backend)
+    A.add_vertices(np.array([1, 2, 3]), np.arange(6).reshape(3, 2), sizes=[1, 2, 3], colours=["r", "g", "b"])
+    assert list(A.vertices) == [1, 2, 3]
+    assert A.get_vertex_sizes() == {1: 1, 2: 2, 3: 3}
+    assert A.get_vertex_colours() == {1: "r", 2: "g", 3: "b"}
+    assert A.get_vertex_positions()[3] == (4, 5)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_vertices_matches_add_vertex(backend):
+    bulk, single = Shape(backend), Shape(backend)
+    bulk.add_vertices(["a", "b"], [(0, 1), (2, 3)], sizes=[2, 3], colours=["g", "m"])
+    single.add_vertex("a", (0, 1), 2, "g")
+    single.add_vertex("b", (2, 3), 3, "m")
+    assert bulk.vertices_info == single.vertices_info
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("kwargs", [
+    {"sizes": [1, 2]},
+    {"sizes": [1, 2, 3, 4]},
+    {"sizes": [[1, 2, 3]]},
+    {"colours": ["r", "g"]},
+    {"colours": ["r", "g", "b", "k"]},
+])
+def test_add_vertices_mismatched_lengths(backend, kwargs):
+    A = Shape(backend)
+    with pytest.raises(PolyLatError, match="one value per vertex"):
+        A.add_vertices(["a", "b", "c"], **kwargs)
+    assert len(A.vertices) == 0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("args, error", [
+    ((["a", "a"],), PolyLatError),
+    ((["a", "b"], [(0, 0)]), PolyLatNotCart),
+    ((["a", "b"], [(0, 0), (np.nan, 1)]), PolyLatNotCart),
+    ((["a", "b"], None, [1, 0]), PolyLatNotPosInt),
+    ((["a", "b"], None, 4, ["r", "q"]), PolyLatNotColour),
+])
+def test_add_vertices_invalid_adds_nothing(backend, args, error):
+    A = Shape(backend)
+    A.add_vertex("z")
+    with pytest.raises(error):
+        A.add_vertices(*args)
+    assert list(A.vertices) == ["z"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_vertices_existing_vertex(backend):
+    A = Shape(backend)
+    A.add_vertex("a")
+    with pytest.raises(PolyLatError):
+        A.add_vertices(["b", "a"])
+    assert list(A.vertices) == ["a"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_edges_scalar_and_per_edge_properties(backend):
+    A = Shape(backend)
+    A.add_edges([(0, 1), (1, 2)], weights=3, colours="r")
+    A.add_edges(np.array([[2, 3], [3, 0]]), weights=[4, 5], colours=["g", "b"])
+    assert list(A.vertices) == [0, 1, 2, 3]
+    assert A.get_edge_weights() == {(0, 1): 3, (1, 2): 3, (2, 3): 4, (3, 0): 5}
+    assert A.get_edge_colours() == {(0, 1): "r", (1, 2): "r", (2, 3): "g", (3, 0): "b"}
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_add_edges_matches_add_edge(backend):
+    bulk, single = Shape(backend), Shape(backend)
+    bulk.add_edges([("a", "b"), ("b", "c")], weights=[2, 7], colours=["c", "y"])
+    single.add_edge("a", "b", 2, "c")
+    single.add_edge("b", "c", 7, "y")
+    assert bulk.vertices_info == single.vertices_info
+    assert bulk.edges_info == single.edges_info
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("kwargs", [
+    {"weights": [1, 2]},
+    {"weights": [1, 2, 3, 4]},
+    {"colours": ["r"]},
+    {"colours": ["r", "g", "b", "k"]},
+])
+def test_add_edges_mismatched_lengths(backend, kwargs):
+    A = Shape(backend)
+    with pytest.raises(PolyLatError, match="one value per edge"):
+        A.add_edges([(0, 1), (1, 2), (2, 0)], **kwargs)
+    assert len(A.vertices) == 0 and len(A.edges) == 0
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("edges", [
+    [(0, 1), (1, 0)],
+    [(0, 1), (0, 1)],
+    [(1, 2)],
+])
+def test_add_edges_repeated_edges_add_nothing(backend, edges):
+    A = Shape(backend)
+    A.add_edge(2, 1)
+    with pytest.raises(PolyLatError):
+        A.add_edges(edges)
+    assert list(A.edges) == [(2, 1)]
+    assert list(A.vertices) == [2, 1]
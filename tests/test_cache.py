@@ -0,0 +1,96 @@
+"""
+Tests of the least recently used lattice cache behind 'Polygon.generate_lattice'.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon
+from polylatlib.cache import LatticeCache, lattice_cache
+
+
+def assert_same_lattice(one, two):
+    assert list(one.vertices) == list(two.vertices)
+    assert list(one.edges) == list(two.edges)
+    np.testing.assert_allclose(one.to_numpy()[0], two.to_numpy()[0], rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("lat_type, size", [("circular", 4), ("stacked", (3, 5))])
+def test_hits_moved_into_place(cls, lat_type, size):
+    cache = LatticeCache()
+    first = cache.lattice(cls(), size, lat_type)
+    assert_same_lattice(first, cls()._generate_lattice(size, lat_type))
+    for centre, rotation in [((0, 0), 0), ((3, -7), 0), ((-1, 2), 37)]:
+        polygon = cls(centre=centre, rotation=rotation)
+        assert_same_lattice(cache.lattice(polygon, size, lat_type), polygon._generate_lattice(size, lat_type))
+    assert (cache.hits, cache.misses, len(cache)) == (3, 1, 1)
+
+
+def test_key_separates_lattices():
+    cache = LatticeCache()
+    cache.lattice(Hexagon(), 3, "circular")
+    cache.lattice(Hexagon(edge_length=2), 3, "circular")
+    cache.lattice(Hexagon(backend="array"), 3, "circular")
+    cache.lattice(Hexagon(), 4, "circular")
+    cache.lattice(Hexagon(), 3, "stacked")
+    cache.lattice(Square(), 3, "circular")
+    assert (cache.hits, cache.misses) == (0, 6)
+    # A single stacked size is used for both rows and columns
+    cache.lattice(Hexagon(), (3, 3), "stacked")
+    assert cache.hits == 1
+
+
+def test_served_lattices_independent():
+    cache = LatticeCache()
+    first = cache.lattice(Square(), 2, "circular")
+    first.update_vertex_position(first.vertices[0], (100, 100))
+    first.add_vertex("extra")
+    second = cache.lattice(Square(), 2, "circular")
+    assert "extra" not in second
+    assert second.get_vertex_positions()[second.vertices[0]] != (100, 100)
+
+
+def test_least_recently_used_evicted():
+    cache = LatticeCache(max_entries=2)
+    for layers in (1, 2):
+        cache.lattice(Square(), layers, "circular")
+    cache.lattice(Square(), 1, "circular")
+    cache.lattice(Square(), 3, "circular")
+    assert cache.evictions == 1
+    cache.lattice(Square(), 1, "circular")
+    assert cache.hits == 2
+    cache.lattice(Square(), 2, "circular")
+    assert cache.misses == 4
+
+
+def test_byte_limit():
+    cache = LatticeCache(max_bytes=None)
+    cache.lattice(Hexagon(backend="array"), 3, "circular")
+    size = cache.stats()["bytes"]
+    assert size > 0
+    cache.max_bytes = size
+    cache.lattice(Hexagon(backend="array"), 20, "circular")
+    assert len(cache) == 1 and cache.evictions == 0
+    cache.max_bytes = 2*size
+    cache.lattice(Hexagon(backend="array"), 4, "circular")
+    assert len(cache) == 1 and cache.evictions == 1
+
+
+def test_disabled_and_cleared():
+    cache = LatticeCache(max_entries=0)
+    cache.lattice(Square(), 2, "circular")
+    cache.lattice(Square(), 2, "circular")
+    assert len(cache) == 0 and cache.hits == 0
+    cache.max_entries = 4
+    cache.lattice(Square(), 2, "circular")
+    cache.lattice(Square(), 2, "circular")
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0}
+
+
+def test_generate_lattice_uses_shared_cache():
+    lattice_cache.clear()
+    Hexagon(centre=(1, 1)).generate_lattice(3, "circular")
+    Hexagon(centre=(4, 0), rotation=20).generate_lattice(3, "circular")
+    assert (lattice_cache.hits, lattice_cache.misses) == (1, 1)
+    lattice_cache.clear()
@@ -0,0 +1,96 @@
+"""
+Tests of the cell table recorded as lattices are generated, and the cell and vertex lookups
+built on it.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon, CircleRegion
+from polylatlib.exception import PolyLatError, PolyLatNotExist
+
+POLYGONS = [EquilateralTriangle, Square, Hexagon]
+
+
+def generate(cls, lat_type):
+    polygon = cls(edge_length=1.5, centre=(2, 1), rotation=10)
+    if lat_type == "circular":
+        return polygon.generate_lattice_circular(4)
+    elif lat_type == "stacked":
+        return polygon.generate_lattice_stacked(3, 5)
+    return polygon.generate_lattice_clipped(CircleRegion((0, 0), 5))
+
+
+@pytest.mark.parametrize("cls", POLYGONS)
+@pytest.mark.parametrize("lat_type", ["circular", "stacked", "clipped"])
+def test_cell_table_gives_polygons(cls, lat_type):
+    lattice = generate(cls, lat_type)
+    positions, ends, _ = lattice.to_numpy()
+    table = lattice._get_cell_vertices()
+    assert table.shape == (len(lattice._cells), cls().sides)
+
+    # Each cell's corners are joined in order around a regular polygon of the right size
+    sides = np.stack([table, np.roll(table, -1, axis=1)], axis=2).reshape(-1, 2)
+    edges = {frozenset(edge) for edge in ends.tolist()}
+    assert {frozenset(side) for side in sides.tolist()} == edges
+    np.testing.assert_allclose(np.hypot(*(positions[sides[:, 1]] - positions[sides[:, 0]]).T), 1.5, rtol=1e-12)
+    assert set(table.reshape(-1).tolist()) == set(range(len(positions)))
+
+    names = list(lattice.vertices)
+    for cell in (0, len(table) - 1):
+        assert lattice.get_cell_vertices(cell) == [names[idx] for idx in table[cell]]
+    assert lattice.get_cell_vertices(0)[0] == lattice._cells.labels([0])[0] + "-0"
+
+
+@pytest.mark.parametrize("cls", POLYGONS)
+def test_layers_rows_and_columns(cls):
+    lattice = generate(cls, "circular")
+    layers = [lattice.get_layer_cells(layer) for layer in range(4)]
+    assert [cell for layer in layers for cell in layer] == list(range(len(lattice._cells)))
+    for layer, cells in enumerate(layers):
+        assert all(lattice.get_cell_info(cell)["layer"] == layer for cell in cells)
+    if cls is Hexagon:
+        assert [len(cells) for cells in layers] == [1, 6, 12, 18]
+
+    lattice = generate(cls, "stacked")
+    for row in range(3):
+        for column, cell in enumerate(lattice.get_row_cells(row)):
+            info = lattice.get_cell_info(cell)
+            assert (info["name"], info["row"], info["column"]) == (f"{row}.{column}", row, column)
+            assert cell in lattice.get_column_cells(column)
+
+
+@pytest.mark.parametrize("cls", POLYGONS)
+@pytest.mark.parametrize("lat_type", ["circular", "stacked", "clipped"])
+def test_vertex_at_coordinates(cls, lat_type):
+    lattice = generate(cls, lat_type)
+    for vertex, coordinate in lattice.get_vertex_coordinates().items():
+        assert lattice.get_vertex_at(coordinate) == vertex
+    site, i, j = lattice.get_vertex_coordinates(as_array=True).max(axis=0).tolist()
+    for coordinate in [(-1, 0, 0), (len(lattice._tiling.sites), 0, 0), (0, i + 5, j + 5)]:
+        with pytest.raises(PolyLatNotExist):
+            lattice.get_vertex_at(coordinate)
+
+
+def test_lookups_rejected():
+    circular, stacked = generate(Square, "circular"), generate(Square, "stacked")
+    for cell in (-1, len(circular._cells)):
+        with pytest.raises(PolyLatNotExist):
+            circular.get_cell_vertices(cell)
+        with pytest.raises(PolyLatNotExist):
+            circular.get_cell_info(cell)
+    with pytest.raises(PolyLatNotExist):
+        circular.get_layer_cells(4)
+    with pytest.raises(PolyLatNotExist):
+        stacked.get_row_cells(3)
+    with pytest.raises(PolyLatError):
+        stacked.get_layer_cells(0)
+    with pytest.raises(PolyLatError):
+        circular.get_column_cells(0)
+
+
+def test_grown_and_copied_tables():
+    lattice = Hexagon().generate_lattice_circular(2)
+    copy = lattice.copy()
+    lattice.grow()
+    np.testing.assert_array_equal(lattice._get_cell_vertices(), Hexagon().generate_lattice_circular(3)._get_cell_vertices())
+    assert len(copy._get_cell_vertices()) == 7
@@ -0,0 +1,64 @@
+"""
+Tests that clipped lattices keep exactly the polygons that a test of every polygon of a large
+window of the tiling finds overlapping the region.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon, Rectangle, CircleRegion, BoxRegion, ConvexRegion
+from polylatlib.classes.virtual import VirtualLattice
+from polylatlib.exception import PolyLatError
+
+REGIONS = [
+    CircleRegion((0.3, -0.2), 4.5),
+    CircleRegion((10, 7), 0.2),
+    BoxRegion((-3, -1), (5, 2.5)),
+    BoxRegion((0, 0), (1, 1)),
+    ConvexRegion([(0, 0), (8, -1), (3, 6)]),
+]
+
+
+def brute_force(polygon, region, reach = 20):
+    """
+    Returns the set of (i, j, s) polygons of a window of the tiling overlapping the region.
+    """
+    virtual = VirtualLattice(polygon)
+    cells = [(i, j, s) for i in range(-reach, reach) for j in range(-reach, reach)
+             for s in range(virtual.tiling.num_polygons)]
+    corners = np.stack([virtual.positions(virtual.polygon_vertices(cell)) for cell in cells])
+    return {cell for cell, kept in zip(cells, region.overlaps(corners)) if kept}
+
+
+@pytest.mark.parametrize("region", REGIONS)
+@pytest.mark.parametrize("polygon", [
+    EquilateralTriangle(), Square(rotation=20), Hexagon(edge_length=0.7, centre=(1, 1)), Rectangle(2, 1),
+])
+def test_clipped_matches_brute_force(polygon, region):
+    lattice = polygon.generate_lattice_clipped(region)
+    cells = lattice._cells
+    i, j, s = cells.at(np.arange(len(cells)))
+    kept = set(zip(i.tolist(), j.tolist(), s.tolist()))
+    assert kept and len(kept) == len(cells)
+    assert kept == brute_force(polygon, region)
+    # Ranked by j, then i, then s
+    assert list(zip(j.tolist(), i.tolist(), s.tolist())) == sorted(zip(j.tolist(), i.tolist(), s.tolist()))
+
+
+def test_clipped_circle_covers_disc():
+    lattice = Hexagon().generate_lattice_clipped(CircleRegion((0, 0), 6))
+    positions = lattice.to_numpy()[0]
+    # Every point of the disc lies in a kept hexagon, so within an edge length of a vertex
+    rng = np.random.default_rng(7)
+    radius, angle = 6*np.sqrt(rng.uniform(size=500)), rng.uniform(0, 2*np.pi, 500)
+    points = np.stack([radius*np.cos(angle), radius*np.sin(angle)], axis=1)
+    distances = np.hypot(*(points[:, None] - positions[None]).transpose(2, 0, 1)).min(axis=1)
+    assert distances.max() <= 1 + 1e-9
+
+
+def test_invalid_regions_rejected():
+    with pytest.raises(PolyLatError):
+        CircleRegion((0, 0), 0)
+    with pytest.raises(PolyLatError):
+        BoxRegion((1, 0), (0, 1))
+    with pytest.raises(PolyLatError):
+        ConvexRegion([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)])
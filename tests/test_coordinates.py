@@ -0,0 +1,31 @@
+"""
+Tests that the exact (site, i, j) coordinates of tiled lattice vertices give the polygons' exact
+corner positions.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("edge_length", [1, 1000])
+@pytest.mark.parametrize("lat_type, size", [("circular", 6), ("stacked", (5, 7))])
+def test_coordinate_positions_match_corner_offsets(cls, edge_length, lat_type, size):
+    polygon = cls(edge_length=edge_length, centre=(2, -5))
+    if lat_type == "circular":
+        lattice = polygon.generate_lattice_circular(size)
+    else:
+        lattice = polygon.generate_lattice_stacked(*size)
+    tiling = lattice._tiling
+    coordinates = lattice.get_vertex_coordinates(as_array=True)
+    positions = tiling.positions(*coordinates.T)
+    np.testing.assert_allclose(positions, lattice.to_numpy()[0], rtol=0, atol=1e-12*edge_length)
+
+    # Every cell that is a translate of the polygon has its exact corners, in order
+    table = lattice._get_cell_vertices()
+    i, j, s = lattice._cells.at(np.arange(len(table)))
+    translate = s == 0
+    centres = polygon.centre + np.outer(i, tiling.translations[0]) + np.outer(j, tiling.translations[1])
+    corners = centres[translate][:, None] + np.asarray(polygon._corner_offsets())
+    np.testing.assert_allclose(positions[table[translate]], corners, rtol=0, atol=1e-12*edge_length)
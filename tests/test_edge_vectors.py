@@ -0,0 +1,65 @@
+"""
+Tests of the vectorised and cached 'get_edge_vectors', on both storage backends.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import Hexagon
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatNotExist
+
+BACKENDS = ["dict", "array"]
+
+
+def example(backend):
+    A = Shape(backend)
+    for i in range(3):
+        A.add_vertex(i, (i, i + (-1)**i))
+    A.add_edge(0, 1)
+    A.add_edge(1, 2)
+    A.add_edge(0, 2)
+    return A
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_edge_vectors(backend):
+    A = example(backend)
+    assert A.get_edge_vectors() == {(0, 1): (1, -1), (1, 2): (1, 3), (0, 2): (2, 2)}
+    vectors = A.get_edge_vectors(as_array=True)
+    np.testing.assert_array_equal(vectors, [(1, -1), (1, 3), (2, 2)])
+    with pytest.raises(ValueError):
+        vectors[0, 0] = 5
+    assert A.get_edge_vector((2, 1)) == (1, 3)
+    with pytest.raises(PolyLatNotExist):
+        A.get_edge_vector((0, 3))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_cache_cleared_on_change(backend):
+    A = example(backend)
+    A.get_edge_vectors()
+    A.update_vertex_position(2, (0, 0))
+    assert A.get_edge_vectors()[(0, 2)] == (0, -1)
+    A.add_vertex(3, (5, 5))
+    A.add_edge(3, 0)
+    assert A.get_edge_vector((0, 3)) == (-5, -4)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_missing_position(backend):
+    A = example(backend)
+    A.add_edge(0, "nowhere")
+    with pytest.raises(TypeError):
+        A.get_edge_vectors()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_lattice_edge_vectors(backend):
+    lattice = Hexagon(edge_length=2, backend=backend).generate_lattice_circular(4)
+    positions = lattice.get_vertex_positions()
+    vectors = lattice.get_edge_vectors()
+    assert list(vectors) == list(lattice.edges)
+    for (one, two), vector in vectors.items():
+        expected = (positions[two][0] - positions[one][0], positions[two][1] - positions[one][1])
+        np.testing.assert_allclose(vector, expected, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(np.hypot(*lattice.get_edge_vectors(as_array=True).T), 2, rtol=1e-12)
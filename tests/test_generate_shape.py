@@ -0,0 +1,65 @@
+"""
+Tests that 'generate_shape' merges new vertices into existing ones through its spatial hash just
+as a search of every vertex would.
+"""
+
+import numpy as np
+import pytest
+from polylatlib.classes.base_shapes import Shape
+
+BACKENDS = ["dict", "array"]
+SQUARE = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_adjacent_squares_share_vertices(backend):
+    A = Shape(backend)
+    A.generate_shape((0, 0), 0, SQUARE)
+    A.generate_shape((1.001, 0), 1, SQUARE)
+    assert len(A.vertices) == 6
+    assert len(A.edges) == 7
+    assert A.vertex_neighbours("0-1") == ["0-0", "0-2", "1-1"]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_tolerance(backend):
+    A = Shape(backend)
+    A.generate_shape((0, 0), 0, SQUARE)
+    A.generate_shape((1.02, 0), 1, SQUARE)
+    assert len(A.vertices) == 8
+    A.generate_shape((1.02, 0), 2, SQUARE, tolerance=0.05)
+    assert len(A.vertices) == 8
+    A.merge_tolerance = 0.001
+    A.generate_shape((0.002, 0), 3, SQUARE)
+    assert len(A.vertices) == 12
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_moved_vertices_found(backend):
+    A = Shape(backend)
+    A.add_vertex("p", (5, 5))
+    A.add_vertex("q")
+    A.generate_shape((0, 0), 0, SQUARE)
+    A.update_vertex_position("p", (2, 0))
+    A.update_vertex_position("q", (2, 1))
+    A.generate_shape((1, 0), 1, SQUARE)
+    assert len(A.vertices) == 6
+    assert ("0-1", "p") in A and ("p", "q") in A and ("q", "0-2") in A
+    # Nothing is left at the old position
+    A.generate_shape((5, 5), 2, SQUARE)
+    assert "2-0" in A
+
+
+def test_matches_search_of_every_vertex():
+    rng = np.random.default_rng(3)
+    A = Shape()
+    starts = rng.uniform(-5, 5, (200, 2)).round(1)
+    for n, start in enumerate(starts):
+        A.generate_shape(tuple(start.tolist()), n, SQUARE)
+    positions = A.to_numpy()[0]
+    # No two vertices within the tolerance, and every corner at a vertex
+    gaps = np.hypot(*(positions[:, None] - positions[None]).transpose(2, 0, 1))
+    assert gaps[np.triu_indices(len(positions), 1)].min() > 0.01
+    corners = starts[:, None] + np.cumsum([(0, 0)] + SQUARE[:3], axis=0)
+    distances = np.hypot(*(corners.reshape(-1, 1, 2) - positions[None]).transpose(2, 0, 1))
+    assert distances.min(axis=1).max() < 0.01
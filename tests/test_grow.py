@@ -0,0 +1,54 @@
+"""
+Tests that growing a circular lattice in place gives exactly the lattice generated with the
+larger number of layers from the start.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon
+from polylatlib.exception import PolyLatError, PolyLatNotPosInt
+
+
+def assert_same_lattice(one, two):
+    assert list(one.vertices) == list(two.vertices)
+    assert list(one.edges) == list(two.edges)
+    np.testing.assert_allclose(one.to_numpy()[0], two.to_numpy()[0], rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(one.get_vertex_coordinates(as_array=True), two.get_vertex_coordinates(as_array=True))
+
+
+@pytest.mark.parametrize("backend", ["dict", "array"])
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("layers, n_layers", [(1, 1), (2, 3), (4, 1)])
+def test_grow_matches_fresh(cls, layers, n_layers, backend):
+    polygon = cls(centre=(1, -1), rotation=15, backend=backend)
+    lattice = polygon.generate_lattice_circular(layers)
+    lattice.grow(n_layers)
+    assert_same_lattice(lattice, polygon.generate_lattice_circular(layers + n_layers))
+    # Growing again carries on from the grown lattice
+    lattice.grow()
+    assert_same_lattice(lattice, polygon.generate_lattice_circular(layers + n_layers + 1))
+
+
+def test_grow_copy_leaves_original():
+    polygon = Hexagon()
+    lattice = polygon.generate_lattice(3, "circular")
+    grown = lattice.copy()
+    grown.grow(2)
+    assert len(lattice.vertices) == len(polygon.generate_lattice_circular(3).vertices)
+    assert_same_lattice(grown, polygon.generate_lattice_circular(5))
+
+
+@pytest.mark.parametrize("n_layers", [0, -1, 1.5])
+def test_invalid_layers_rejected(n_layers):
+    lattice = Square().generate_lattice_circular(2)
+    with pytest.raises(PolyLatNotPosInt):
+        lattice.grow(n_layers)
+
+
+def test_only_unchanged_circular_lattices_grow():
+    with pytest.raises(PolyLatError):
+        Square().generate_lattice_stacked(3, 3).grow()
+    lattice = Square().generate_lattice_circular(2)
+    lattice.add_vertex("extra", (10, 10))
+    with pytest.raises(PolyLatError):
+        lattice.grow()
@@ -0,0 +1,69 @@
+"""
+Tests that 'locate_cells' finds the polygon containing each point as a test of every polygon of
+the lattice would.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon, Rectangle, Lattice, CircleRegion
+from polylatlib.exception import PolyLatError
+
+
+def containing(lattice, points):
+    """
+    Returns the cells strictly containing each point, by testing the point against every cell,
+    and whether each point is clear of every cell's edges.
+    """
+    positions = lattice.to_numpy()[0]
+    corners = positions[lattice._get_cell_vertices()]
+    sides = np.roll(corners, -1, axis=1) - corners
+    offsets = points[:, None, None] - corners[None]
+    cross = sides[None, ..., 0]*offsets[..., 1] - sides[None, ..., 1]*offsets[..., 0]
+    # Corners may run either way round
+    cross *= np.sign(cross.sum(axis=2, keepdims=True))
+    inside = (cross > 0).all(axis=2)
+    clear = (np.abs(cross) > 1e-6).all(axis=(1, 2))
+    return [np.flatnonzero(row).tolist() for row in inside], clear
+
+
+@pytest.mark.parametrize("polygon", [
+    EquilateralTriangle(), Square(rotation=30), Hexagon(centre=(2, -1), edge_length=1.3), Rectangle(2, 1),
+])
+@pytest.mark.parametrize("lat_type", ["circular", "stacked", "clipped"])
+def test_locate_matches_brute_force(polygon, lat_type):
+    if lat_type == "circular":
+        lattice = polygon.generate_lattice_circular(4)
+    elif lat_type == "stacked":
+        lattice = polygon.generate_lattice_stacked(3, 6)
+    else:
+        lattice = polygon.generate_lattice_clipped(CircleRegion((1, 1), 4))
+    points = np.random.default_rng(5).uniform(-12, 12, (3000, 2))
+    cells = lattice.locate_cells(points)
+    expected, clear = containing(lattice, points)
+    assert clear.sum() > 2900
+    for cell, found, ok in zip(cells.tolist(), expected, clear.tolist()):
+        if ok:
+            assert [cell] == found if found else cell == -1
+    assert (cells >= 0).any() and (cells < 0).any()
+
+    # Cell centroids are located in their own cell
+    centroids = lattice.to_numpy()[0][lattice._get_cell_vertices()].mean(axis=1)
+    np.testing.assert_array_equal(lattice.locate_cells(centroids), np.arange(len(centroids)))
+
+
+def test_locate_moved_lattice():
+    lattice = Hexagon().generate_lattice_circular(3)
+    lattice.rotate(17, centre=(1, 2))
+    lattice.translate((-4, 3))
+    lattice.scale(1.5)
+    centroids = lattice.to_numpy()[0][lattice._get_cell_vertices()].mean(axis=1)
+    np.testing.assert_array_equal(lattice.locate_cells(centroids), np.arange(len(centroids)))
+
+
+def test_locate_rejected():
+    lattice = Square().generate_lattice_circular(2)
+    with pytest.raises(PolyLatError):
+        lattice.locate_cells([1, 2, 3])
+    # Lattices built piece by piece have no tiling to locate points on
+    with pytest.raises(PolyLatError):
+        Lattice().locate_cells([(0, 0)])
@@ -0,0 +1,60 @@
+"""
+Tests that the sparse adjacency, Laplacian and incidence matrices of shapes match those NetworkX
+builds from the same graph.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Hexagon
+from polylatlib.classes.base_shapes import Shape
+
+pytest.importorskip("scipy.sparse")
+networkx = pytest.importorskip("networkx")
+
+
+def weighted(backend):
+    lattice = EquilateralTriangle(backend=backend).generate_lattice_circular(3)
+    for n, edge in enumerate(list(lattice.edges)):
+        lattice.update_edge_weight(edge, 1 + n % 4)
+    lattice.add_vertex("alone", (50, 50))
+    return lattice
+
+
+def graph(shape):
+    graph = networkx.Graph()
+    graph.add_nodes_from(shape.vertices)
+    graph.add_weighted_edges_from((one, two, weight) for (one, two), weight in shape.get_edge_weights().items())
+    return graph
+
+
+@pytest.mark.parametrize("backend", ["dict", "array"])
+@pytest.mark.parametrize("use_weights", [False, True])
+def test_matrices_match_networkx(backend, use_weights):
+    shape = weighted(backend)
+    G, nodes, edges = graph(shape), list(shape.vertices), list(shape.edges)
+    weight = "weight" if use_weights else None
+
+    adjacency = shape.adjacency_matrix(use_weights)
+    assert adjacency.format == "csr" and adjacency.shape == (len(nodes), len(nodes))
+    np.testing.assert_array_equal(adjacency.toarray(), networkx.to_numpy_array(G, nodelist=nodes, weight=weight))
+    np.testing.assert_array_equal(shape.laplacian(use_weights).toarray(),
+                                  networkx.laplacian_matrix(G, nodelist=nodes, weight=weight).toarray())
+    for oriented in (False, True):
+        incidence = shape.incidence_matrix(oriented, use_weights)
+        expected = networkx.incidence_matrix(G, nodelist=nodes, edgelist=edges, oriented=oriented, weight=weight)
+        assert incidence.shape == (len(nodes), len(edges))
+        np.testing.assert_array_equal(incidence.toarray(), expected.toarray())
+
+
+def test_oriented_incidence_gives_laplacian():
+    lattice = Hexagon().generate_lattice_circular(4)
+    B = lattice.incidence_matrix(oriented=True)
+    np.testing.assert_array_equal((B @ B.T).toarray(), lattice.laplacian().toarray())
+    np.testing.assert_array_equal(np.asarray(lattice.adjacency_matrix().sum(axis=1)).reshape(-1), lattice.get_degrees())
+
+
+def test_self_loops():
+    A = Shape()
+    A.add_edges([(0, 1), (1, 1)], weights=[2, 3])
+    np.testing.assert_array_equal(A.adjacency_matrix(weighted=True).toarray(), [[0, 2], [2, 3]])
+    np.testing.assert_array_equal(A.incidence_matrix().toarray(), [[1, 0], [1, 0]])
@@ -0,0 +1,78 @@
+"""
+Tests that the index arithmetic neighbour queries of lattices agree with searches of the lattice's
+cell table and edges.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon, CircleRegion
+from polylatlib.exception import PolyLatError, PolyLatNotExist
+
+POLYGONS = [EquilateralTriangle, Square, Hexagon]
+
+
+def generate(cls, lat_type):
+    polygon = cls(backend="array")
+    if lat_type == "circular":
+        return polygon.generate_lattice_circular(5)
+    elif lat_type == "stacked":
+        return polygon.generate_lattice_stacked(4, 6)
+    return polygon.generate_lattice_clipped(CircleRegion((1, 0), 4))
+
+
+@pytest.mark.parametrize("cls", POLYGONS)
+@pytest.mark.parametrize("lat_type", ["circular", "stacked", "clipped"])
+def test_cell_neighbours_share_sides(cls, lat_type):
+    lattice = generate(cls, lat_type)
+    table = lattice._get_cell_vertices()
+    K = table.shape[1]
+    sides = {}
+    for cell, corners in enumerate(table.tolist()):
+        for k in range(K):
+            sides.setdefault(frozenset((corners[k], corners[(k + 1) % K])), []).append(cell)
+
+    neighbours = lattice.cell_neighbours(np.arange(len(table)))
+    assert neighbours.shape == (len(table), K)
+    for cell, corners in enumerate(table.tolist()):
+        for k in range(K):
+            other = [c for c in sides[frozenset((corners[k], corners[(k + 1) % K]))] if c != cell]
+            assert neighbours[cell, k] == (other[0] if other else -1)
+        assert lattice.cell_neighbours(cell) == [c for c in neighbours[cell].tolist() if c >= 0]
+    # An array of any shape
+    assert lattice.cell_neighbours(np.zeros((2, 3), dtype=int)).shape == (2, 3, K)
+
+
+@pytest.mark.parametrize("cls", POLYGONS)
+@pytest.mark.parametrize("lat_type", ["circular", "stacked", "clipped"])
+def test_vertex_neighbours_match_edges(cls, lat_type):
+    lattice = generate(cls, lat_type)
+    positions, ends, _ = lattice.to_numpy()
+    expected = [set() for _ in positions]
+    for one, two in ends.tolist():
+        expected[one].add(two)
+        expected[two].add(one)
+
+    neighbours = lattice.vertex_neighbour_indices(np.arange(len(positions)))
+    assert neighbours.shape[1] == max(len(found) for found in expected)
+    for idx, row in enumerate(neighbours.tolist()):
+        assert [n for n in row if n >= 0] == sorted(expected[idx])
+        assert row[len(expected[idx]):] == [-1]*(len(row) - len(expected[idx]))
+
+
+def test_hexagon_example():
+    lattice = Hexagon().generate_lattice(10, "circular")
+    assert lattice.cell_neighbours(0) == [3, 4, 5, 6, 1, 2]
+    assert lattice.cell_neighbours(np.arange(200)).shape == (200, 6)
+
+
+def test_queries_rejected():
+    lattice = generate(Square, "circular")
+    with pytest.raises(PolyLatNotExist):
+        lattice.cell_neighbours(len(lattice._cells))
+    with pytest.raises(PolyLatNotExist):
+        lattice.cell_neighbours(np.array([0, -1]))
+    with pytest.raises(PolyLatNotExist):
+        lattice.vertex_neighbour_indices([0, len(lattice.vertices)])
+    lattice.add_edge(lattice.vertices[0], "extra")
+    with pytest.raises(PolyLatError):
+        lattice.vertex_neighbour_indices([0])
@@ -0,0 +1,85 @@
+"""
+Tests of the conversion of shapes to and from NumPy arrays, SciPy matrices and NetworkX graphs, on
+both storage backends.
+"""
+
+from fractions import Fraction
+import numpy as np
+import pytest
+from polylatlib import Hexagon, Square
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatError
+
+networkx = pytest.importorskip("networkx")
+
+BACKENDS = ["dict", "array"]
+
+
+def square_graph(weights):
+    graph = networkx.Graph()
+    for node, position in enumerate([(0, 0), (1, 0), (1, 1), (0, 1)]):
+        graph.add_node(node, pos=position)
+    for node, weight in enumerate(weights):
+        graph.add_edge(node, (node + 1) % 4, weight=weight)
+    return graph
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("cls", [Square, Hexagon])
+def test_lattice_round_trip(cls, backend):
+    lattice = cls(backend=backend).generate_lattice_circular(3)
+    graph = lattice.to_networkx()
+    assert graph.number_of_nodes() == len(lattice.vertices)
+    assert graph.number_of_edges() == len(lattice.edges)
+
+    shape = Shape.from_networkx(graph, backend=backend)
+    assert list(shape.vertices) == list(lattice.vertices)
+    assert {frozenset(edge) for edge in shape.edges} == {frozenset(edge) for edge in lattice.edges}
+    np.testing.assert_array_equal(shape.to_numpy()[0], lattice.to_numpy()[0])
+    assert shape.get_vertex_colours() == lattice.get_vertex_colours()
+    assert networkx.utils.graphs_equal(shape.to_networkx(), graph)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_numpy_and_scipy_exports(backend):
+    pytest.importorskip("scipy.sparse")
+    lattice = Hexagon(backend=backend).generate_lattice_circular(3)
+    lattice.update_edge_weight(lattice.edges[2], 3)
+    positions, ends, weights = lattice.to_numpy()
+    names = list(lattice.vertices)
+    assert positions.shape == (len(names), 2) and ends.shape == (len(lattice.edges), 2)
+    assert [(names[one], names[two]) for one, two in ends.tolist()] == list(lattice.edges)
+    assert weights.tolist() == list(lattice.get_edge_weights().values())
+    with pytest.raises(ValueError):
+        positions[0, 0] = 1
+    if backend == "array":
+        # Views of the store's columns show later property updates
+        lattice.update_vertex_position(names[0], (9, 9))
+        assert positions[0].tolist() == [9, 9]
+
+    graph = lattice.to_networkx()
+    for format in ("csr", "coo"):
+        matrix = lattice.to_scipy_sparse(format=format)
+        assert matrix.format == format
+        np.testing.assert_array_equal(matrix.toarray(), networkx.to_scipy_sparse_array(graph, nodelist=names).toarray())
+    np.testing.assert_array_equal(lattice.to_scipy_sparse(weighted=False).toarray(), lattice.adjacency_matrix().toarray())
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_real_edge_weights(backend):
+    weights = [0.5, -2, np.float32(1.25), Fraction(1, 4)]
+    shape = Shape.from_networkx(square_graph(weights), backend=backend)
+    stored = shape.get_edge_weights()
+    assert [stored[node, (node + 1) % 4] if node < 3 else stored[0, 3] for node in range(4)] == [0.5, -2, 1.25, 0.25]
+    np.testing.assert_allclose(sorted(shape.to_numpy()[2]), [-2, 0.25, 0.5, 1.25])
+
+
+@pytest.mark.parametrize("weight", [float("nan"), float("inf"), True, "1", 1 + 1j])
+def test_invalid_edge_weights_rejected(weight):
+    with pytest.raises(PolyLatError):
+        Shape.from_networkx(square_graph([1, 1, weight, 1]))
+
+
+def test_directed_graph_rejected():
+    with pytest.raises(PolyLatError):
+        Shape.from_networkx(networkx.DiGraph([(0, 1)]))
@@ -0,0 +1,98 @@
+"""
+Tests that the grid index answers nearest vertex, distance and box queries as a search of every
+vertex would.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import Hexagon
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatError, PolyLatNotCart
+
+
+def scattered(kind, n = 400, seed = 0):
+    rng = np.random.default_rng(seed)
+    if kind == "uniform":
+        return rng.uniform(-10, 10, (n, 2))
+    elif kind == "clustered":
+        # A dense cluster, a far outlier, and a thin line
+        return np.concatenate([rng.normal(0, 0.01, (n - 51, 2)), [(1e4, -3e3)],
+                               np.stack([np.linspace(0, 50, 50), np.full(50, 2.0)], axis=1)])
+    return Hexagon().generate_lattice_circular(8).to_numpy()[0]
+
+
+def shape_of(positions):
+    A = Shape("array")
+    A.add_vertices(range(len(positions)), positions)
+    A.add_vertex("nowhere")
+    return A
+
+
+def distances(positions, points):
+    return np.hypot(*(points[:, None] - positions[None]).transpose(2, 0, 1))
+
+
+def rows(offsets, indices):
+    return [indices[offsets[m]:offsets[m + 1]].tolist() for m in range(len(offsets) - 1)]
+
+
+QUERIES = np.random.default_rng(1).uniform(-15, 15, (300, 2))
+
+
+@pytest.mark.parametrize("kind", ["uniform", "clustered", "lattice"])
+def test_nearest(kind):
+    positions = scattered(kind)
+    A = shape_of(positions)
+    points = np.concatenate([QUERIES, positions[:20] + 1e-3, [(-1e6, 5e5)]])
+    index, distance = A.nearest_vertex_indices(points)
+    expected = distances(positions, points)
+    np.testing.assert_allclose(distance, expected.min(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(expected[np.arange(len(points)), index], expected.min(axis=1), rtol=1e-12)
+    assert A.nearest_vertex(tuple(points[0].tolist())) == index[0]
+
+
+@pytest.mark.parametrize("kind", ["uniform", "clustered", "lattice"])
+def test_within(kind):
+    positions = scattered(kind)
+    A = shape_of(positions)
+    radius = np.random.default_rng(2).uniform(0, 4, len(QUERIES))
+    expected = distances(positions, QUERIES) <= radius[:, None]
+    assert rows(*A.vertex_indices_within(QUERIES, radius)) == [np.flatnonzero(row).tolist() for row in expected]
+    expected = distances(positions, QUERIES) <= 1.5
+    assert rows(*A.vertex_indices_within(QUERIES, 1.5)) == [np.flatnonzero(row).tolist() for row in expected]
+    assert A.vertices_within((0, 0), 2) == np.flatnonzero(distances(positions, np.zeros((1, 2)))[0] <= 2).tolist()
+
+
+@pytest.mark.parametrize("kind", ["uniform", "clustered", "lattice"])
+def test_in_boxes(kind):
+    positions = scattered(kind)
+    A = shape_of(positions)
+    lowers = QUERIES
+    uppers = QUERIES + np.random.default_rng(3).uniform(0, 6, QUERIES.shape)
+    inside = ((positions[None] >= lowers[:, None]) & (positions[None] <= uppers[:, None])).all(axis=2)
+    assert rows(*A.vertex_indices_in_box(lowers, uppers)) == [np.flatnonzero(row).tolist() for row in inside]
+    assert A.vertices_in_box((-2, -2), (2, 2)) == \
+        np.flatnonzero((np.abs(positions) <= 2).all(axis=1)).tolist()
+
+
+def test_ties_and_updates():
+    A = Shape()
+    A.add_vertices(["a", "b", "c"], [(1, 0), (-1, 0), (0, 5)])
+    assert A.nearest_vertex((0, 0)) == "a"
+    A.update_vertex_position("c", (0, 0.5))
+    assert A.nearest_vertex((0, 0)) == "c"
+    A.add_vertex("d", (0, 0))
+    assert A.vertices_within((0, 0), 0.6) == ["c", "d"]
+
+
+def test_empty_and_invalid():
+    A = Shape()
+    A.add_vertex("nowhere")
+    index, distance = A.nearest_vertex_indices([(0, 0)])
+    assert index[0] == -1 and distance[0] == np.inf
+    with pytest.raises(PolyLatError):
+        A.nearest_vertex((0, 0))
+    with pytest.raises(PolyLatError):
+        A.nearest_vertex_indices([0, 0, 0])
+    with pytest.raises(PolyLatNotCart):
+        A.vertices_within("origin", 1)
@@ -0,0 +1,75 @@
+"""
+Tests of the hash-indexed vertex and edge store behind Shape, on both storage backends.
+"""
+
+import pytest
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatError, PolyLatNotExist
+
+BACKENDS = ["dict", "array"]
+
+
+def house(backend):
+    A = Shape(backend)
+    A.add_vertex("a", (0, 0))
+    A.add_vertex("b", (1, 0), 6, "r")
+    A.add_edge("a", "b", 2, "g")
+    A.add_edge("b", "c")
+    return A
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_membership_either_direction(backend):
+    A = house(backend)
+    assert "a" in A and "c" in A and "z" not in A
+    assert ("a", "b") in A and ("b", "a") in A
+    assert ("a", "c") not in A
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_duplicates_rejected(backend):
+    A = house(backend)
+    with pytest.raises(PolyLatError):
+        A.add_vertex("a")
+    with pytest.raises(PolyLatError):
+        A.add_edge("b", "a")
+    assert list(A.vertices) == ["a", "b", "c"]
+    assert list(A.edges) == [("a", "b"), ("b", "c")]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_views_read_only_and_ordered(backend):
+    A = house(backend)
+    assert A.vertices[-1] == "c" and A.edges[0] == ("a", "b")
+    assert A.vertices_info[1] == ("b", {"position": (1, 0), "size": 6, "colour": "r"})
+    assert A.edges_info[0] == ("a", "b", {"weight": 2, "colour": "g"})
+    with pytest.raises(TypeError):
+        A.vertices[0] = "x"
+    with pytest.raises(AttributeError):
+        A.edges.append(("a", "c"))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_updates_and_lookups(backend):
+    A = house(backend)
+    A.update_edge(("b", "a"), "weight", 5)
+    A.update_vertex("c", "colour", "m")
+    A.update_vertex_position("c", (2, 0))
+    assert A.get_edge_weights() == {("a", "b"): 5, ("b", "c"): 1}
+    assert A.get_vertex_colours() == {"a": "b", "b": "r", "c": "m"}
+    assert A.get_vertex_positions() == {"a": (0, 0), "b": (1, 0), "c": (2, 0)}
+    assert A.vertex_neighbours("b") == ["a", "c"]
+    assert A.degree("b") == 2 and list(A.get_degrees()) == [1, 2, 1]
+    with pytest.raises(PolyLatNotExist):
+        A.update_vertex("z", "colour", "r")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_copy_independent(backend):
+    A = house(backend)
+    B = A.copy()
+    B.add_edge("c", "d")
+    B.update_vertex_size("a", 9)
+    assert list(A.vertices) == ["a", "b", "c"] and len(A.edges) == 2
+    assert A.get_vertex_sizes()["a"] == 4
+    assert ("c", "d") in B
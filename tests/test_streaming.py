@@ -0,0 +1,44 @@
+"""
+Tests that lattices streamed in chunks by 'iter_lattice' match those from 'generate_lattice'.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon
+from polylatlib.exception import PolyLatError, PolyLatNotPosInt, PolyLatNotProp
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("layers, lat_type", [(6, "circular"), ((4, 7), "stacked")])
+@pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+def test_iter_lattice_matches_generate_lattice(cls, layers, lat_type, chunk_size):
+    polygon = cls(backend="array")
+    lattice = polygon.generate_lattice(layers, lat_type)
+    vertices, positions, edges = [], [], []
+    for chunk_vertices, chunk_positions, chunk_edges in polygon.iter_lattice(layers, lat_type, chunk_size):
+        vertices.extend(chunk_vertices)
+        positions.append(chunk_positions)
+        edges.extend(chunk_edges)
+    assert vertices == list(lattice.vertices)
+    # generate_lattice serves a cached lattice rotated into place, so may differ in the last bit
+    np.testing.assert_allclose(np.concatenate(positions), lattice.to_numpy()[0], rtol=0, atol=1e-12)
+    assert edges == list(lattice.edges)
+
+
+@pytest.mark.parametrize("layers, lat_type, error", [
+    (0, "circular", PolyLatNotPosInt),
+    (-3, "circular", PolyLatNotPosInt),
+    (2.5, "circular", PolyLatNotPosInt),
+    ((0, 2), "stacked", PolyLatNotPosInt),
+    ((2, -1), "stacked", PolyLatNotPosInt),
+    (3, "spiral", PolyLatNotProp),
+])
+def test_iter_lattice_rejects_arguments_when_called(layers, lat_type, error):
+    # Raised by the call itself, before any chunk is requested
+    with pytest.raises(error):
+        Hexagon().iter_lattice(layers, lat_type)
+
+
+def test_iter_lattice_rejects_chunk_size():
+    with pytest.raises(PolyLatError):
+        Hexagon().iter_lattice(3, "circular", chunk_size=0)
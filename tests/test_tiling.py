@@ -0,0 +1,262 @@
+"""
+Tests that lattices generated by the tiling engine have the same topology as those built the
+legacy way, one 'generate_shape' call per polygon with vertices merged by proximity.
+"""
+
+from math import sqrt
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon, Lattice, Rectangle
+from polylatlib.exception import PolyLatNotPosInt
+from polylatlib.functions import add_vectors, change_to_cart_list, change_to_cart_vector
+
+
+### LEGACY CONSTRUCTIONS ###
+# The generate_lattice_* methods as they were before the tiling engine.
+
+def legacy_triangle_circular(polygon, layers):
+    polar_vectors = []
+    for i in range(2*polygon.sides):
+        polar_vectors.append((polygon.edge_length, 30 + (i + 1)*polygon.int_angle + polygon.rotation))
+    chg_vectors = change_to_cart_list(polar_vectors)
+    triangle_one = [chg_vectors[2*i + 1] for i in range(polygon.sides)]
+    triangle_two = [chg_vectors[len(chg_vectors) - (2*i + 1)] for i in range(polygon.sides)]
+
+    lattice = Lattice()
+    shape = 0
+    origin_vertex = add_vectors(polygon.centre, polygon.radius_vec)
+    for layer in range(layers):
+        if layer == 0:
+            lattice.generate_shape(origin_vertex, shape, triangle_one)
+        elif layer % 2 == 0:
+            origin_vertex = add_vectors(origin_vertex, chg_vectors[5])
+            origin_vertex = add_vectors(origin_vertex, chg_vectors[4])
+            vertex_pos = origin_vertex
+            for i in range(3):
+                for _ in range(int(layer/2)):
+                    shape += 1
+                    lattice.generate_shape(vertex_pos, shape, triangle_one)
+                    vertex_pos = add_vectors(vertex_pos, chg_vectors[2*i])
+                for _ in range(int(layer/2)):
+                    shape += 1
+                    lattice.generate_shape(vertex_pos, shape, triangle_one)
+                    vertex_pos = add_vectors(vertex_pos, chg_vectors[(2*i) + 1])
+        else:
+            origin_vertex = add_vectors(origin_vertex, chg_vectors[2])
+            vertex_pos = origin_vertex
+            for i in range(3):
+                for _ in range(int((layer + 1)/2)):
+                    shape += 1
+                    lattice.generate_shape(vertex_pos, shape, triangle_two)
+                    vertex_pos = add_vectors(vertex_pos, chg_vectors[2*i])
+                for _ in range(int((layer + 1)/2) - 1):
+                    shape += 1
+                    lattice.generate_shape(vertex_pos, shape, triangle_two)
+                    vertex_pos = add_vectors(vertex_pos, chg_vectors[(2*i) + 1])
+    return lattice
+
+
+def legacy_triangle_stacked(polygon, rows, columns):
+    edge_vec_1 = list(polygon.get_edge_vectors().values())
+    edge_vec_2 = [edge_vec_1[2], edge_vec_1[1], edge_vec_1[0]]
+    edge_vec = [edge_vec_1, edge_vec_2]
+    move_row = [edge_vec_1[0], edge_vec_1[2]]
+    move_col = [edge_vec_1[2], (-edge_vec_1[0][0], -edge_vec_1[0][1])]
+
+    lattice = Lattice()
+    origin_vertex = add_vectors(polygon.centre, polygon.radius_vec)
+    for i in range(rows):
+        col_pos = origin_vertex
+        for j in range(columns):
+            lattice.generate_shape(col_pos, str(i) + "." + str(j), edge_vec[(i + j) % 2])
+            # Even rows step on after odd columns, odd rows after even columns
+            if (i + j) % 2 == 1:
+                col_pos = add_vectors(col_pos, move_col[0])
+                col_pos = add_vectors(col_pos, move_col[1])
+        origin_vertex = add_vectors(origin_vertex, move_row[i % 2])
+    return lattice
+
+
+def legacy_square_circular(polygon, layers):
+    chg_vectors = list(polygon.get_edge_vectors().values())
+    lattice = Lattice()
+    shape = 0
+    for layer in range(layers):
+        radius_vec = (round((layer*2*polygon.radius_vec[0]) + polygon.radius_vec[0], 3),
+                      round((layer*2*polygon.radius_vec[1]) + polygon.radius_vec[1], 3))
+        start_vertex_pos = add_vectors(polygon.centre, radius_vec)
+        if layer == 0:
+            lattice.generate_shape(start_vertex_pos, shape, chg_vectors)
+            shape += 1
+        else:
+            for i in range(polygon.sides):
+                for _ in range(2*layer):
+                    lattice.generate_shape(start_vertex_pos, shape, chg_vectors)
+                    start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[i])
+                    shape += 1
+    return lattice
+
+
+def legacy_square_stacked(polygon, rows, columns):
+    edge_vec = list(polygon.get_edge_vectors().values())
+    lattice = Lattice()
+    start_pos = add_vectors(polygon.centre, polygon.radius_vec)
+    for i in range(rows):
+        vertex_pos = start_pos
+        for j in range(columns):
+            lattice.generate_shape(vertex_pos, str(i) + "." + str(j), edge_vec)
+            vertex_pos = add_vectors(vertex_pos, edge_vec[2])
+        start_pos = add_vectors(start_pos, edge_vec[3])
+    return lattice
+
+
+def _hexagon_step(polygon):
+    edge_length_plus = 1.5*polygon.edge_length
+    half_hex_height = round(sqrt(0.75*((polygon.edge_length)**2)), 2)
+    return round(sqrt(edge_length_plus**2 + half_hex_height**2), 2)
+
+
+def legacy_hexagon_circular(polygon, layers):
+    step = _hexagon_step(polygon)
+    polar_vectors = []
+    for i in range(polygon.sides):
+        polar_vectors.append((step, i*(polygon.theta) + polygon.theta/2 + polygon.rotation))
+    chg_vectors = change_to_cart_list(polar_vectors)
+    polygon_vectors = list(polygon.get_edge_vectors().values())
+
+    lattice = Lattice()
+    shape = 1
+    for layer in range(layers):
+        if layer == 0:
+            start_vertex_pos = add_vectors(polygon.centre, polygon.radius_vec)
+            lattice.generate_shape(start_vertex_pos, 0, polygon_vectors)
+        else:
+            start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[4])
+            lattice.generate_shape(start_vertex_pos, shape, polygon_vectors)
+            for i in range(polygon.sides):
+                for _ in range(layer):
+                    shape += 1
+                    start_vertex_pos = add_vectors(start_vertex_pos, chg_vectors[i])
+                    lattice.generate_shape(start_vertex_pos, shape, polygon_vectors)
+    return lattice
+
+
+def legacy_hexagon_stacked(polygon, rows, columns):
+    edge_vec = list(polygon.get_edge_vectors().values())
+    step = _hexagon_step(polygon)
+    move_row = change_to_cart_vector((step, 30 + polygon.rotation))
+    move_col = change_to_cart_vector((step, polygon.rotation - 30))
+    lattice = Lattice()
+    start_pos = add_vectors(polygon.centre, polygon.radius_vec)
+    for i in range(rows):
+        vertex_pos = start_pos
+        for j in range(columns):
+            lattice.generate_shape(vertex_pos, str(i) + "." + str(j), edge_vec)
+            vertex_pos = add_vectors(vertex_pos, move_col)
+        start_pos = add_vectors(start_pos, move_row)
+    return lattice
+
+
+LEGACY = {
+    (EquilateralTriangle, "circular"): legacy_triangle_circular,
+    (EquilateralTriangle, "stacked"): legacy_triangle_stacked,
+    (Square, "circular"): legacy_square_circular,
+    (Square, "stacked"): legacy_square_stacked,
+    (Hexagon, "circular"): legacy_hexagon_circular,
+    (Hexagon, "stacked"): legacy_hexagon_stacked,
+}
+
+
+### COMPARISON ###
+
+def vertex_matching(lattice, legacy, tolerance):
+    """
+    Returns the index in 'lattice' of the vertex at the position of each vertex of 'legacy'.
+    """
+    positions = legacy.to_numpy()[0]
+    indices, distances = lattice.nearest_vertex_indices(positions)
+    assert distances.max() < tolerance
+    assert len(np.unique(indices)) == len(indices)
+    return indices
+
+
+def edge_set(ends):
+    return {frozenset(edge) for edge in ends.tolist()}
+
+
+@pytest.mark.parametrize("backend", ["dict", "array"])
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("lat_type, size", [
+    ("circular", 1), ("circular", 2), ("circular", 3), ("circular", 5),
+    ("stacked", (1, 1)), ("stacked", (2, 3)), ("stacked", (4, 4)), ("stacked", (5, 2)),
+])
+def test_tiled_topology_matches_legacy(cls, lat_type, size, backend):
+    polygon = cls(backend=backend)
+    if lat_type == "circular":
+        lattice = polygon.generate_lattice_circular(size)
+        legacy = LEGACY[cls, lat_type](polygon, size)
+    else:
+        lattice = polygon.generate_lattice_stacked(*size)
+        legacy = LEGACY[cls, lat_type](polygon, *size)
+
+    assert len(lattice.vertices) == len(legacy.vertices)
+    assert len(lattice.edges) == len(legacy.edges)
+    # Legacy positions are rounded to 2 or 3 decimals along the way
+    matching = vertex_matching(lattice, legacy, 0.05*polygon.edge_length)
+    assert edge_set(matching[legacy.to_numpy()[1]]) == edge_set(lattice.to_numpy()[1])
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("lat_type, size", [("circular", 4), ("stacked", (3, 4))])
+def test_tiled_graph_isomorphic_to_legacy(cls, lat_type, size):
+    networkx = pytest.importorskip("networkx")
+    polygon = cls()
+    if lat_type == "circular":
+        lattice = polygon.generate_lattice_circular(size)
+        legacy = LEGACY[cls, lat_type](polygon, size)
+    else:
+        lattice = polygon.generate_lattice_stacked(*size)
+        legacy = LEGACY[cls, lat_type](polygon, *size)
+    assert networkx.is_isomorphic(lattice.to_networkx(), legacy.to_networkx())
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("edge_length", [1, 1000])
+def test_tiled_positions_exact(cls, edge_length):
+    polygon = cls(edge_length=edge_length, centre=(3, -2))
+    lattice = polygon.generate_lattice_circular(3)
+    # The central polygon is generated first, corner by corner
+    corners = np.asarray(polygon._corner_offsets()) + polygon.centre
+    positions = lattice.to_numpy()[0][:len(corners)]
+    np.testing.assert_allclose(positions, corners, rtol=0, atol=1e-12*edge_length)
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("layers", [0, -1, -4, 1.5, 2.0])
+def test_invalid_layers_rejected(cls, layers):
+    polygon = cls()
+    with pytest.raises(PolyLatNotPosInt):
+        polygon.generate_lattice(layers, "circular")
+    with pytest.raises(PolyLatNotPosInt):
+        polygon.generate_lattice_circular(layers)
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+@pytest.mark.parametrize("size", [(0, 3), (3, 0), (-1, 3), (2, -2), (1.5, 2), (2, 2.0)])
+def test_invalid_stacked_size_rejected(cls, size):
+    polygon = cls()
+    with pytest.raises(PolyLatNotPosInt):
+        polygon.generate_lattice_stacked(*size)
+    with pytest.raises(PolyLatNotPosInt):
+        polygon.generate_lattice(size, "stacked")
+
+
+@pytest.mark.parametrize("layers", [0, -2, 1.5])
+def test_invalid_four_sided_size_rejected(layers):
+    rectangle = Rectangle(2, 1)
+    with pytest.raises(PolyLatNotPosInt):
+        rectangle.generate_lattice_circular(layers)
+    with pytest.raises(PolyLatNotPosInt):
+        rectangle.generate_lattice_stacked(layers, 2)
+    with pytest.raises(PolyLatNotPosInt):
+        rectangle.generate_lattice_stacked(2, layers)
@@ -0,0 +1,82 @@
+"""
+Tests of the affine transforms of Shape, on both storage backends.
+"""
+
+from math import sqrt
+import numpy as np
+import pytest
+from polylatlib import Hexagon, Square
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatError, PolyLatNotCart
+
+BACKENDS = ["dict", "array"]
+
+
+def triangle(backend):
+    A = Shape(backend)
+    A.add_vertices(["a", "b", "c"], [(0, 0), (2, 0), (1, 3)], sizes=[1, 2, 3])
+    A.add_vertex("nowhere")
+    A.add_edges([("a", "b"), ("b", "c"), ("c", "a")], weights=[4, 5, 6])
+    return A
+
+
+def positions(shape):
+    return shape.to_numpy()[0][:3]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_transform(backend):
+    A = triangle(backend)
+    matrix, offset = np.array([[1, 0.5], [-2, 1]]), np.array([3, -1])
+    expected = positions(A) @ matrix.T + offset
+    A.transform(matrix, (3, -1))
+    np.testing.assert_allclose(positions(A), expected)
+    assert A.get_vertex_positions()["nowhere"] is None
+    assert A.get_vertex_sizes() == {"a": 1, "b": 2, "c": 3, "nowhere": 4}
+    assert list(A.get_edge_weights().values()) == [4, 5, 6]
+    np.testing.assert_allclose(A.get_edge_vectors(as_array=True), np.diff(expected[[0, 1, 2, 0]], axis=0))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_translate_rotate_scale(backend):
+    A = triangle(backend)
+    A.translate((1, 1))
+    np.testing.assert_allclose(positions(A), [(1, 1), (3, 1), (2, 4)])
+    A.rotate(90, centre=(1, 1))
+    np.testing.assert_allclose(positions(A), [(1, 1), (1, 3), (-2, 2)], atol=1e-12)
+    A.scale(2, centre=(1, 1))
+    np.testing.assert_allclose(positions(A), [(1, 1), (1, 5), (-5, 3)], atol=1e-12)
+    A.scale((1, -1))
+    np.testing.assert_allclose(positions(A), [(1, -1), (1, -5), (-5, -3)], atol=1e-12)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_copy(backend):
+    A = triangle(backend)
+    B = A.rotate(45, copy=True)
+    np.testing.assert_array_equal(positions(A), [(0, 0), (2, 0), (1, 3)])
+    np.testing.assert_allclose(positions(B)[1], (sqrt(2), sqrt(2)))
+    assert A.translate((1, 0)) is None
+
+
+def test_invalid_arguments_rejected():
+    A = triangle("dict")
+    with pytest.raises(PolyLatError):
+        A.transform([[1, 0, 0], [0, 1, 0]])
+    with pytest.raises(PolyLatNotCart):
+        A.transform(np.eye(2), (1, 2, 3))
+    with pytest.raises(PolyLatNotCart):
+        A.rotate(30, centre="origin")
+
+
+@pytest.mark.parametrize("cls", [Square, Hexagon])
+def test_transformed_lattice_grows_in_place(cls):
+    lattice = cls().generate_lattice_circular(3)
+    lattice.rotate(30, centre=(1, 1))
+    lattice.translate((5, -2))
+    lattice.grow(2)
+    expected = cls().generate_lattice_circular(5)
+    expected.rotate(30, centre=(1, 1))
+    expected.translate((5, -2))
+    assert list(lattice.edges) == list(expected.edges)
+    np.testing.assert_allclose(lattice.to_numpy()[0], expected.to_numpy()[0], rtol=0, atol=1e-9)
@@ -0,0 +1,108 @@
+"""
+Tests that the array-based breadth first searches, shortest paths and connected components of
+shapes agree with NetworkX.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import Hexagon
+from polylatlib.classes.base_shapes import Shape
+from polylatlib.exception import PolyLatError, PolyLatNotExist
+
+networkx = pytest.importorskip("networkx")
+
+
+def random_shape(seed = 6, n = 120, m = 130):
+    # Sparse enough to fall apart into several components
+    rng = np.random.default_rng(seed)
+    ends = np.unique(np.sort(rng.integers(0, n, (m, 2)), axis=1), axis=0)
+    A = Shape("array")
+    A.add_vertices(range(n))
+    A.add_edges([tuple(edge) for edge in ends.tolist() if edge[0] != edge[1]])
+    return A
+
+
+SHAPES = {
+    "random": random_shape,
+    "lattice": lambda: Hexagon().generate_lattice_circular(5),
+}
+
+
+def graph(shape):
+    graph = networkx.Graph()
+    graph.add_nodes_from(range(len(shape.vertices)))
+    graph.add_edges_from(shape.to_numpy()[1].tolist())
+    return graph
+
+
+def lengths(G, n, sources):
+    distance = np.full(n, -1)
+    for vertex, length in networkx.multi_source_dijkstra_path_length(G, set(sources)).items():
+        distance[vertex] = length
+    return distance
+
+
+@pytest.mark.parametrize("name", SHAPES)
+def test_bfs_distances(name):
+    shape = SHAPES[name]()
+    G, n = graph(shape), len(shape.vertices)
+    names = list(shape.vertices)
+    for source in (0, 17, n - 1):
+        np.testing.assert_array_equal(shape.bfs_distances(names[source]), lengths(G, n, [source]))
+    sources = [3, 40, 41, 3]
+    np.testing.assert_array_equal(shape.bfs_distance_indices(sources), lengths(G, n, sources))
+    separate = shape.bfs_distance_indices(sources, separate=True)
+    assert separate.shape == (4, n)
+    for row, source in zip(separate, sources):
+        np.testing.assert_array_equal(row, lengths(G, n, [source]))
+
+
+@pytest.mark.parametrize("name", SHAPES)
+def test_shortest_paths(name):
+    shape = SHAPES[name]()
+    G, names = graph(shape), list(shape.vertices)
+    index = {vertex: idx for idx, vertex in enumerate(names)}
+    pairs = np.random.default_rng(8).integers(0, len(names), (40, 2)).tolist()
+    for a, b in pairs:
+        if networkx.has_path(G, a, b):
+            path = [index[vertex] for vertex in shape.shortest_path(names[a], names[b])]
+            assert path[0] == a and path[-1] == b
+            assert len(path) - 1 == networkx.shortest_path_length(G, a, b)
+            assert all(G.has_edge(one, two) for one, two in zip(path, path[1:]))
+        else:
+            with pytest.raises(PolyLatError):
+                shape.shortest_path(names[a], names[b])
+
+
+@pytest.mark.parametrize("name", SHAPES)
+def test_connected_components(name):
+    shape = SHAPES[name]()
+    G, n = graph(shape), len(shape.vertices)
+    components = shape.connected_components()
+    expected = sorted(networkx.connected_components(G), key=min)
+    assert components.max() + 1 == len(expected)
+    for number, component in enumerate(expected):
+        assert set(np.flatnonzero(components == number).tolist()) == component
+
+    subset = np.random.default_rng(9).random(n) < 0.6
+    components = shape.connected_components(subset)
+    assert (components[~subset] == -1).all()
+    expected = sorted(networkx.connected_components(G.subgraph(np.flatnonzero(subset).tolist())), key=min)
+    for number, component in enumerate(expected):
+        assert set(np.flatnonzero(components == number).tolist()) == component
+
+
+def test_docstring_examples_and_errors():
+    A = Shape()
+    A.add_edges([(0, 1), (1, 2), (2, 3)])
+    A.add_vertex(4)
+    np.testing.assert_array_equal(A.bfs_distances(1), [1, 0, 1, 2, -1])
+    A.add_edge(0, 3)
+    assert A.shortest_path(1, 3) == [1, 0, 3]
+    assert A.shortest_path(2, 2) == [2]
+    with pytest.raises(PolyLatNotExist):
+        A.bfs_distances(9)
+    with pytest.raises(PolyLatNotExist):
+        A.bfs_distance_indices([0, 5])
+    with pytest.raises(PolyLatError):
+        A.connected_components([True, False])
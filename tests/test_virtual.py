@@ -0,0 +1,68 @@
+"""
+Tests that the virtual lattice agrees with the concrete windows it materialises, and rejects
+indices outside its tiling.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon
+from polylatlib.classes.virtual import VirtualLattice
+from polylatlib.exception import PolyLatError
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+def test_window_matches_virtual_lattice(cls):
+    virtual = VirtualLattice(cls(centre=(1, 2), rotation=10))
+    i_range, j_range = range(-3, 3), range(-2, 4)
+    lattice = virtual.window(i_range, j_range)
+    coordinates = [tuple(vertex) for vertex in lattice.get_vertex_coordinates(as_array=True).tolist()]
+    np.testing.assert_allclose(virtual.positions(coordinates), lattice.to_numpy()[0], rtol=0, atol=1e-12)
+
+    # Vertices whose polygons all lie in the window have the same neighbours in both
+    index = {vertex: n for n, vertex in enumerate(coordinates)}
+    neighbours = [set() for _ in coordinates]
+    for one, two in lattice.to_numpy()[1].tolist():
+        neighbours[one].add(coordinates[two])
+        neighbours[two].add(coordinates[one])
+    interior = 0
+    for vertex, n in index.items():
+        polygons = virtual.vertex_polygons(vertex)
+        if all(i in i_range and j in j_range for i, j, _ in polygons):
+            assert set(virtual.vertex_neighbours(vertex)) == neighbours[n]
+            interior += 1
+        else:
+            assert neighbours[n] <= set(virtual.vertex_neighbours(vertex))
+    assert interior > 0
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+def test_far_vertices_are_translates(cls):
+    virtual = VirtualLattice(cls())
+    t1, t2 = virtual.tiling.translations
+    for site in range(len(virtual.tiling.sites)):
+        near, far = virtual.positions([(site, 1, -2), (site, 10**6 + 1, -10**6 - 2)])
+        np.testing.assert_allclose(far - near, 10**6*(t1 - t2), rtol=0, atol=1e-6)
+        shift = [(s, i + 10**6, j - 10**6) for s, i, j in virtual.vertex_neighbours((site, 1, -2))]
+        assert virtual.vertex_neighbours((site, 10**6 + 1, -10**6 - 2)) == shift
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+def test_out_of_range_indices_rejected(cls):
+    virtual = VirtualLattice(cls())
+    sites, polygons = len(virtual.tiling.sites), virtual.tiling.num_polygons
+    for site in (-1, sites):
+        with pytest.raises(PolyLatError):
+            virtual.position((site, 0, 0))
+        with pytest.raises(PolyLatError):
+            virtual.positions([(0, 0, 0), (site, 0, 0)])
+        with pytest.raises(PolyLatError):
+            virtual.vertex_neighbours((site, 0, 0))
+        with pytest.raises(PolyLatError):
+            virtual.vertex_polygons((site, 0, 0))
+        with pytest.raises(PolyLatError):
+            virtual.vertex_edges((site, 0, 0))
+    for s in (-1, polygons):
+        with pytest.raises(PolyLatError):
+            virtual.polygon_vertices((0, 0, s))
+        with pytest.raises(PolyLatError):
+            virtual.polygon_edges((0, 0, s))
@@ -0,0 +1,37 @@
+"""
+Tests that lattices generated in a process pool are stitched back into exactly the lattices
+generated serially. Each parallel generation starts a small pool, so the cases are kept few.
+"""
+
+import numpy as np
+import pytest
+from polylatlib import EquilateralTriangle, Square, Hexagon, CircleRegion
+from polylatlib.exception import PolyLatNotPosInt
+
+
+def assert_same_lattice(one, two):
+    assert list(one.vertices) == list(two.vertices)
+    assert list(one.edges) == list(two.edges)
+    np.testing.assert_array_equal(one.to_numpy()[0], two.to_numpy()[0])
+    np.testing.assert_array_equal(one._get_cell_vertices(), two._get_cell_vertices())
+
+
+@pytest.mark.parametrize("cls", [EquilateralTriangle, Square, Hexagon])
+def test_parallel_matches_serial(cls):
+    polygon = cls(backend="array")
+    assert_same_lattice(polygon.generate_lattice_circular(9, workers=3), polygon.generate_lattice_circular(9))
+    assert_same_lattice(polygon.generate_lattice_stacked(7, 5, workers=2), polygon.generate_lattice_stacked(7, 5))
+
+
+def test_parallel_clipped_and_tiny():
+    polygon = Hexagon()
+    region = CircleRegion((1, 2), 6)
+    assert_same_lattice(polygon.generate_lattice_clipped(region, workers=2), polygon.generate_lattice_clipped(region))
+    # More workers than cells leaves some parts empty
+    assert_same_lattice(polygon.generate_lattice_circular(1, workers=3), polygon.generate_lattice_circular(1))
+
+
+@pytest.mark.parametrize("workers", [0, -2, 1.5])
+def test_invalid_workers_rejected(workers):
+    with pytest.raises(PolyLatNotPosInt):
+        Square().generate_lattice_circular(3, workers=workers)